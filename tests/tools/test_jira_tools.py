@@ -1,91 +1,229 @@
 import unittest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, call
+import io
 import os
 import json
+import threading
+from dataclasses import dataclass
 import requests # Import the requests library
 
 # Assuming tools.jira_tools is accessible in the PYTHONPATH
 # Adjust the import path if your project structure is different
+from tools import jira_tools
 from tools.jira_tools import get_jira_issue_links, get_jira_issue_details, CUSTOM_FIELD_CATEGORY_ID, search_jira_issues_jql
 
-class TestGetJiraIssueLinks(unittest.TestCase):
+# Atlassian configuration seen by the functions under test.
+_ENV = {
+    "ATLASSIAN_INSTANCE_URL": "https://test.atlassian.net",
+    "ATLASSIAN_EMAIL": "test@example.com",
+    "ATLASSIAN_API_KEY": "test_api_key"
+}
+
+# Field list requested by get_jira_issue_details.
+_FIELDS_PARAM = f"summary,status,assignee,description,{CUSTOM_FIELD_CATEGORY_ID}"
+_RENDER_PARAMS = {"fields": "description", "expand": "renderedFields.description"}
+
+# Expected request for the PROJ-123 link lookup, built once at import time.
+_EXPECTED_LINK_CALL = call(
+    "https://test.atlassian.net/rest/api/3/issue/PROJ-123?fields=issuelinks",
+    auth=("test@example.com", "test_api_key"),
+    headers=None,
+    timeout=15,
+    stream=True
+)
+
+# JQL search queries used by the search tests.
+_DEFAULT_SEARCH_JQL = "project = TEST"
+_CUSTOM_SEARCH_JQL = "assignee = currentUser()"
+_CUSTOM_SEARCH_FIELDS = ["summary", "customfield_10001", "labels"]
+
+@dataclass(frozen=True)
+class _SearchResponses:
+    """Search response payloads shared across runs; the code under test only reads them."""
+    default: dict
+    custom_fields: dict
+    complex: dict
+
+
+_SEARCH_RESPONSES = _SearchResponses(
+    default={
+        "issues": [
+            {
+                "key": "TEST-1",
+                "fields": {
+                    "summary": "Test Issue 1",
+                    "status": {"name": "Open"},
+                    "assignee": {"displayName": "User A"},
+                    "reporter": {"displayName": "User B"},
+                    "created": "2023-01-01T10:00:00.000+0000",
+                    "updated": "2023-01-02T10:00:00.000+0000"
+                }
+            },
+            {
+                "key": "TEST-2",
+                "fields": {
+                    "summary": "Test Issue 2",
+                    "status": {"name": "In Progress"},
+                    "assignee": None, # Unassigned
+                    "reporter": {"displayName": "User C"},
+                    "created": "2023-01-03T10:00:00.000+0000",
+                    "updated": "2023-01-04T10:00:00.000+0000"
+                }
+            }
+        ],
+        "maxResults": 50,
+        "total": 2
+    },
+    custom_fields={
+        "issues": [
+            {
+                "key": "TEST-3",
+                "fields": {
+                    "summary": "Custom Field Test",
+                    "customfield_10001": {"value": "OptionA"}, # Single select custom field
+                    "labels": ["label1", "label2"] # List of strings
+                }
+            }
+        ],
+        "maxResults": 10,
+        "total": 1
+    },
+    complex={
+        "issues": [
+            {
+                "key": "TEST-COMPLEX",
+                "fields": {
+                    "status": {"name": "Blocked", "description": "Issue is blocked"}, # 'name'
+                    "assignee": {"displayName": "Dev Lead", "accountId": "123"}, # 'displayName'
+                    "components": [{"name": "Backend"}, {"name": "API"}], # list of dicts with 'name'
+                    "custom_single_select": {"value": "High"}, # 'value'
+                    "custom_multi_select": [ # list of dicts with 'value'
+                        {"value": "Feature"},
+                        {"value": "Improvement"}
+                    ],
+                    "priority": {"name": "Highest"} # 'name'
+                }
+            }
+        ],
+        "maxResults": 1, "total": 1
+    },
+)
 
-    def _setup_mock_env_vars(self, mock_getenv):
-        mock_getenv.side_effect = lambda key, default=None: {
-            "ATLASSIAN_INSTANCE_URL": "https://test.atlassian.net",
-            "ATLASSIAN_EMAIL": "test@example.com",
-            "ATLASSIAN_API_KEY": "test_api_key"
-        }.get(key, default)
-
-    @patch('tools.jira_tools.requests.get')
-    @patch('tools.jira_tools.os.getenv')
-    def test_get_issue_links_success_no_links(self, mock_getenv, mock_requests_get):
-        self._setup_mock_env_vars(mock_getenv)
-        issue_id = "PROJ-123"
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "fields": {
-                "issuelinks": []
-            }
-        }
-        mock_requests_get.return_value = mock_response
+class _FakeResp:
+    """Minimal stand-in for requests.Response; cheaper to build than a MagicMock."""
+    __slots__ = ("status_code", "headers", "_json", "_err", "_raw")
 
-        result = get_jira_issue_links(issue_id)
+    def __init__(self, payload, status=200, err=None, headers=None):
+        self.status_code = status
+        self.headers = headers or {}
+        self._json = payload
+        self._err = err
+        self._raw = None
 
-        self.assertEqual(result["status"], "success")
-        self.assertEqual(result["report"], f"No issue links found for issue '{issue_id}'.")
-        mock_requests_get.assert_called_once_with(
-            f"https://test.atlassian.net/rest/api/3/issue/{issue_id}?fields=issuelinks",
-            headers={"Accept": "application/json"},
-            auth=("test@example.com", "test_api_key"),
-            timeout=15
-        )
+    @property
+    def content(self):
+        return json.dumps(self._json).encode()
 
-    @patch('tools.jira_tools.requests.get')
-    @patch('tools.jira_tools.os.getenv')
-    def test_get_issue_links_success_with_inward_link(self, mock_getenv, mock_requests_get):
-        self._setup_mock_env_vars(mock_getenv)
-        issue_id = "PROJ-123"
+    @property
+    def raw(self):
+        if self._raw is None: # Same stream on every access, like a real response
+            self._raw = io.BytesIO(self.content)
+        return self._raw
+
+    def json(self):
+        return self._json
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+    def raise_for_status(self):
+        if self._err:
+            raise self._err
+
+    def close(self):
+        pass
+
+
+class _IjsonStub:
+    """Stands in for the optional ijson package, which is not a test dependency.
+
+    items() loads the whole stream with json and yields the elements of the list
+    at the given prefix, so it returns what ijson.items() would for these payloads.
+    """
+    JSONError = ValueError
+
+    def __init__(self):
+        self.calls = [] # (stream, prefix) per items() call
+
+    def items(self, stream, prefix):
+        self.calls.append((stream, prefix))
+        document = json.load(stream)
+        for name in prefix.split(".")[:-1]: # The trailing "item" selects the list elements
+            document = document.get(name, {})
+        yield from document or []
+
+
+class TestGetJiraIssueLinks(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # Link payload covering four kinds of missing data; built once per class.
+        cls.incomplete_links_payload = {
             "fields": {
                 "issuelinks": [
-                    {
-                        "type": {"name": "Blocks", "inward": "is blocked by"},
+                    { # Missing type.name
+                        "type": {"inward": "is blocked by"},
                         "inwardIssue": {
                             "key": "PROJ-456",
                             "fields": {"summary": "Another Task", "status": {"name": "Open"}}
                         }
+                    },
+                    { # Missing inwardIssue.key
+                        "type": {"name": "Relates", "outward": "relates to"},
+                        "outwardIssue": {
+                            "fields": {"summary": "Related Story", "status": {"name": "In Progress"}}
+                        }
+                    },
+                    { # Missing outwardIssue.fields.summary
+                        "type": {"name": "Depends", "outward": "depends on"},
+                        "outwardIssue": {
+                            "key": "PROJ-789",
+                            "fields": {"status": {"name": "Closed"}}
+                        }
+                    },
+                    { # Missing outwardIssue.fields.status
+                        "type": {"name": "Tests", "outward": "tests"},
+                        "outwardIssue": {
+                            "key": "PROJ-ABC",
+                            "fields": {"summary": "Test Case"}
+                        }
                     }
                 ]
             }
         }
-        mock_requests_get.return_value = mock_response
-
-        result = get_jira_issue_links(issue_id)
-
-        self.assertEqual(result["status"], "success")
-        expected_report_lines = [
-            f"Issue links for {issue_id}:",
-            "  - Type: Blocks, Direction: is blocked by PROJ-456 (Status: Open, Summary: Another Task)"
-        ]
-        self.assertEqual(result["report"], "\n".join(expected_report_lines))
-
-    @patch('tools.jira_tools.requests.get')
-    @patch('tools.jira_tools.os.getenv')
-    def test_get_issue_links_success_with_outward_link(self, mock_getenv, mock_requests_get):
-        self._setup_mock_env_vars(mock_getenv)
-        issue_id = "PROJ-123"
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "fields": {
-                "issuelinks": [
+        # (case name, API payload, expected links, expected report)
+        cls.link_cases = [
+            ("no_links", {"fields": {"issuelinks": []}}, [], "No issue links found for issue 'PROJ-123'."),
+            ("missing_fields", {}, [], "No issue links found for issue 'PROJ-123'."),
+            ("missing_issuelinks", {"fields": {}}, [], "No issue links found for issue 'PROJ-123'."),
+            (
+                "inward",
+                {"fields": {"issuelinks": [
+                    {
+                        "type": {"name": "Blocks", "inward": "is blocked by"},
+                        "inwardIssue": {
+                            "key": "PROJ-456",
+                            "fields": {"summary": "Another Task", "status": {"name": "Open"}}
+                        }
+                    }
+                ]}},
+                [{"type": "Blocks", "direction": "is blocked by", "key": "PROJ-456",
+                  "status": "Open", "summary": "Another Task"}],
+                "Issue links for PROJ-123:\n"
+                "  - Type: Blocks, Direction: is blocked by PROJ-456 (Status: Open, Summary: Another Task)",
+            ),
+            (
+                "outward",
+                {"fields": {"issuelinks": [
                     {
                         "type": {"name": "Relates", "outward": "relates to"},
                         "outwardIssue": {
@@ -93,31 +231,15 @@ class TestGetJiraIssueLinks(unittest.TestCase):
                             "fields": {"summary": "Related Story", "status": {"name": "In Progress"}}
                         }
                     }
-                ]
-            }
-        }
-        mock_requests_get.return_value = mock_response
-
-        result = get_jira_issue_links(issue_id)
-
-        self.assertEqual(result["status"], "success")
-        expected_report_lines = [
-            f"Issue links for {issue_id}:",
-            "  - Type: Relates, Direction: relates to PROJ-789 (Status: In Progress, Summary: Related Story)"
-        ]
-        self.assertEqual(result["report"], "\n".join(expected_report_lines))
-
-    @patch('tools.jira_tools.requests.get')
-    @patch('tools.jira_tools.os.getenv')
-    def test_get_issue_links_success_with_multiple_links(self, mock_getenv, mock_requests_get):
-        self._setup_mock_env_vars(mock_getenv)
-        issue_id = "PROJ-123"
-
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "fields": {
-                "issuelinks": [
+                ]}},
+                [{"type": "Relates", "direction": "relates to", "key": "PROJ-789",
+                  "status": "In Progress", "summary": "Related Story"}],
+                "Issue links for PROJ-123:\n"
+                "  - Type: Relates, Direction: relates to PROJ-789 (Status: In Progress, Summary: Related Story)",
+            ),
+            (
+                "multiple", # Order of links should match the order from the API
+                {"fields": {"issuelinks": [
                     {
                         "type": {"name": "Blocks", "inward": "is blocked by"},
                         "inwardIssue": {
@@ -132,95 +254,106 @@ class TestGetJiraIssueLinks(unittest.TestCase):
                             "fields": {"summary": "Related Story", "status": {"name": "To Do"}}
                         }
                     }
-                ]
-            }
-        }
-        mock_requests_get.return_value = mock_response
-
-        result = get_jira_issue_links(issue_id)
-        self.assertEqual(result["status"], "success")
-        # Order of links in the report should match the order from the API
-        expected_report_lines = [
-            f"Issue links for {issue_id}:",
-            "  - Type: Blocks, Direction: is blocked by PROJ-456 (Status: Done, Summary: Blocker Task)",
-            "  - Type: Relates, Direction: relates to PROJ-789 (Status: To Do, Summary: Related Story)"
+                ]}},
+                [{"type": "Blocks", "direction": "is blocked by", "key": "PROJ-456",
+                  "status": "Done", "summary": "Blocker Task"},
+                 {"type": "Relates", "direction": "relates to", "key": "PROJ-789",
+                  "status": "To Do", "summary": "Related Story"}],
+                "Issue links for PROJ-123:\n"
+                "  - Type: Blocks, Direction: is blocked by PROJ-456 (Status: Done, Summary: Blocker Task)\n"
+                "  - Type: Relates, Direction: relates to PROJ-789 (Status: To Do, Summary: Related Story)",
+            ),
+            (
+                "incomplete",
+                cls.incomplete_links_payload,
+                [{"type": "N/A", "direction": "is blocked by", "key": "PROJ-456",
+                  "status": "Open", "summary": "Another Task"},
+                 {"type": "Relates", "direction": "relates to", "key": "N/A",
+                  "status": "In Progress", "summary": "Related Story"},
+                 {"type": "Depends", "direction": "depends on", "key": "PROJ-789",
+                  "status": "Closed", "summary": "N/A"},
+                 {"type": "Tests", "direction": "tests", "key": "PROJ-ABC",
+                  "status": "N/A", "summary": "Test Case"}],
+                "Issue links for PROJ-123:\n"
+                "  - Type: N/A, Direction: is blocked by PROJ-456 (Status: Open, Summary: Another Task)\n"
+                "  - Type: Relates, Direction: relates to N/A (Status: In Progress, Summary: Related Story)\n"
+                "  - Type: Depends, Direction: depends on PROJ-789 (Status: Closed, Summary: N/A)\n"
+                "  - Type: Tests, Direction: tests PROJ-ABC (Status: N/A, Summary: Test Case)",
+            ),
         ]
-        self.assertEqual(result["report"], "\n".join(expected_report_lines))
 
-
-    @patch('tools.jira_tools.os.getenv')
-    def test_get_issue_links_missing_env_vars(self, mock_getenv):
-        mock_getenv.side_effect = lambda key, default=None: None # Simulate no env vars
+    def setUp(self):
+        # Each test must hit the mocked API rather than a result cached by another test
+        jira_tools.clear_cache()
+        self._env = patch.dict(os.environ, _ENV)
+        self._env.start()
+
+    def tearDown(self):
+        self._env.stop()
+
+    @patch.object(jira_tools._SESSION, 'get')
+    def test_get_issue_links_success_cases(self, mock_requests_get):
+        for name, payload, expected_links, expected_report in self.link_cases:
+            with self.subTest(case=name):
+                jira_tools.clear_cache()
+                mock_requests_get.reset_mock()
+                mock_requests_get.return_value = _FakeResp(payload)
+
+                result = get_jira_issue_links("PROJ-123")
+
+                self.assertEqual(result["status"], "success")
+                self.assertEqual(result["links"], expected_links)
+                self.assertEqual(result["report"], expected_report)
+                self.assertEqual(mock_requests_get.call_args, _EXPECTED_LINK_CALL)
+                self.assertEqual(mock_requests_get.call_count, 1)
+
+    @patch.object(jira_tools._SESSION, 'get')
+    def test_get_issue_links_streamed_with_ijson(self, mock_requests_get):
+        for name, payload, expected_links, expected_report in self.link_cases:
+            with self.subTest(case=name):
+                jira_tools.clear_cache()
+                response = _FakeResp(payload)
+                mock_requests_get.return_value = response
+                ijson_stub = _IjsonStub()
+
+                with patch.object(jira_tools, 'ijson', ijson_stub):
+                    result = get_jira_issue_links("PROJ-123")
+
+                self.assertEqual(result["status"], "success")
+                self.assertEqual(result["links"], expected_links)
+                self.assertEqual(result["report"], expected_report)
+                self.assertEqual(ijson_stub.calls, [(response.raw, "fields.issuelinks.item")])
+                self.assertTrue(response.raw.decode_content) # Compressed bodies are decoded before parsing
+
+    @patch.object(jira_tools._SESSION, 'get')
+    def test_get_issue_links_http_errors(self, mock_requests_get):
         issue_id = "PROJ-123"
-        result = get_jira_issue_links(issue_id)
-        self.assertEqual(result["status"], "error")
-        self.assertIn("Atlassian instance configuration", result["error_message"])
-
-    @patch('tools.jira_tools.requests.get')
-    @patch('tools.jira_tools.os.getenv')
-    def test_get_issue_links_http_error_401(self, mock_getenv, mock_requests_get):
-        self._setup_mock_env_vars(mock_getenv)
-        issue_id = "PROJ-123"
-
-        mock_response = MagicMock()
-        mock_response.status_code = 401
-        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("Unauthorized")
-        mock_requests_get.return_value = mock_response
-
-        result = get_jira_issue_links(issue_id)
-        self.assertEqual(result["status"], "error")
-        self.assertEqual(result["error_message"], "Jira authentication failed. Check email/API key.")
-
-    @patch('tools.jira_tools.requests.get')
-    @patch('tools.jira_tools.os.getenv')
-    def test_get_issue_links_http_error_403(self, mock_getenv, mock_requests_get):
-        self._setup_mock_env_vars(mock_getenv)
-        issue_id = "PROJ-FORBIDDEN"
-
-        mock_response = MagicMock()
-        mock_response.status_code = 403
-        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("Forbidden")
-        mock_requests_get.return_value = mock_response
-
-        result = get_jira_issue_links(issue_id)
-        self.assertEqual(result["status"], "error")
-        self.assertEqual(result["error_message"], f"Jira permission denied for accessing issue links for '{issue_id}'.")
-
-    @patch('tools.jira_tools.requests.get')
-    @patch('tools.jira_tools.os.getenv')
-    def test_get_issue_links_http_error_404(self, mock_getenv, mock_requests_get):
-        self._setup_mock_env_vars(mock_getenv)
-        issue_id = "PROJ-NOTFOUND"
-
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("Not Found")
-        mock_requests_get.return_value = mock_response
-
-        result = get_jira_issue_links(issue_id)
-        self.assertEqual(result["status"], "error")
-        self.assertEqual(result["error_message"], f"Jira issue '{issue_id}' not found.")
+        cases = [
+            (401, "Unauthorized", "Jira authentication failed. Check email/API key."),
+            (403, "Forbidden", f"Jira permission denied for accessing issue links for '{issue_id}'."),
+            (404, "Not Found", f"Jira issue '{issue_id}' not found."),
+            (500, "500 Server Error", "HTTP error occurred while fetching issue links: 500 Server Error"),
+        ]
+        for status_code, reason, expected_message in cases:
+            with self.subTest(status_code=status_code):
+                mock_requests_get.return_value = _FakeResp(
+                    None, status_code, err=requests.exceptions.HTTPError(reason)
+                )
 
-    @patch('tools.jira_tools.requests.get')
-    @patch('tools.jira_tools.os.getenv')
-    def test_get_issue_links_other_http_error(self, mock_getenv, mock_requests_get):
-        self._setup_mock_env_vars(mock_getenv)
-        issue_id = "PROJ-ERROR"
-        http_error_message = "500 Server Error"
+                result = get_jira_issue_links(issue_id)
 
-        mock_response = MagicMock()
-        mock_response.status_code = 500
-        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError(http_error_message)
-        mock_requests_get.return_value = mock_response
+                self.assertEqual(result["status"], "error")
+                self.assertEqual(result["error_message"], expected_message)
 
-        result = get_jira_issue_links(issue_id)
+    def test_get_issue_links_missing_env_vars(self):
+        issue_id = "PROJ-123"
+        with patch.dict(os.environ, {}, clear=True): # Simulate no env vars
+            result = get_jira_issue_links(issue_id)
         self.assertEqual(result["status"], "error")
-        self.assertEqual(result["error_message"], f"HTTP error occurred while fetching issue links: {http_error_message}")
+        self.assertIn("Atlassian instance configuration", result["error_message"])
 
-    @patch('tools.jira_tools.requests.get')
-    @patch('tools.jira_tools.os.getenv')
-    def test_get_issue_links_request_exception(self, mock_getenv, mock_requests_get):
-        self._setup_mock_env_vars(mock_getenv)
+    @patch.object(jira_tools._SESSION, 'get')
+    def test_get_issue_links_request_exception(self, mock_requests_get):
         issue_id = "PROJ-REQEX"
         req_exception_message = "Connection timed out"
 
@@ -230,109 +363,52 @@ class TestGetJiraIssueLinks(unittest.TestCase):
         self.assertEqual(result["status"], "error")
         self.assertEqual(result["error_message"], f"Error fetching issue links: {req_exception_message}")
 
-    @patch('tools.jira_tools.requests.get')
-    @patch('tools.jira_tools.os.getenv')
-    def test_get_issue_links_malformed_response_no_fields(self, mock_getenv, mock_requests_get):
-        self._setup_mock_env_vars(mock_getenv)
-        issue_id = "PROJ-BADJSON1"
-
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {} # Missing 'fields'
-        mock_requests_get.return_value = mock_response
-
-        result = get_jira_issue_links(issue_id)
-        self.assertEqual(result["status"], "success") # Should still be success as per current implementation
-        self.assertEqual(result["report"], f"No issue links found for issue '{issue_id}'.")
-
-
-    @patch('tools.jira_tools.requests.get')
-    @patch('tools.jira_tools.os.getenv')
-    def test_get_issue_links_malformed_response_no_issuelinks(self, mock_getenv, mock_requests_get):
-        self._setup_mock_env_vars(mock_getenv)
-        issue_id = "PROJ-BADJSON2"
-
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"fields": {}} # Missing 'issuelinks'
-        mock_requests_get.return_value = mock_response
-
-        result = get_jira_issue_links(issue_id)
-        self.assertEqual(result["status"], "success") # Should still be success
-        self.assertEqual(result["report"], f"No issue links found for issue '{issue_id}'.")
-
-    @patch('tools.jira_tools.requests.get')
-    @patch('tools.jira_tools.os.getenv')
-    def test_get_issue_links_link_data_incomplete(self, mock_getenv, mock_requests_get):
-        self._setup_mock_env_vars(mock_getenv)
-        issue_id = "PROJ-INCMPLTE"
-
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+    @patch.object(jira_tools._SESSION, 'get')
+    def test_get_issue_links_many_links(self, mock_requests_get):
+        issue_id = "PROJ-MANY"
+        link_count = 5000
+        mock_requests_get.return_value = _FakeResp({
             "fields": {
                 "issuelinks": [
-                    { # Missing type.name
-                        "type": {"inward": "is blocked by"},
-                        "inwardIssue": {
-                            "key": "PROJ-456",
-                            "fields": {"summary": "Another Task", "status": {"name": "Open"}}
-                        }
-                    },
-                    { # Missing inwardIssue.key
+                    {
                         "type": {"name": "Relates", "outward": "relates to"},
                         "outwardIssue": {
-                            "fields": {"summary": "Related Story", "status": {"name": "In Progress"}}
-                        }
-                    },
-                    { # Missing outwardIssue.fields.summary
-                        "type": {"name": "Depends", "outward": "depends on"},
-                        "outwardIssue": {
-                            "key": "PROJ-789",
-                            "fields": {"status": {"name": "Closed"}}
-                        }
-                    },
-                     { # Missing outwardIssue.fields.status
-                        "type": {"name": "Tests", "outward": "tests"},
-                        "outwardIssue": {
-                            "key": "PROJ-ABC",
-                            "fields": {"summary": "Test Case"}
+                            "key": f"PROJ-{i}",
+                            "fields": {"summary": f"Story {i}", "status": {"name": "Open"}}
                         }
                     }
+                    for i in range(link_count)
                 ]
             }
-        }
-        mock_requests_get.return_value = mock_response
+        })
 
         result = get_jira_issue_links(issue_id)
+
         self.assertEqual(result["status"], "success")
-        expected_report_lines = [
-            f"Issue links for {issue_id}:",
-            "  - Type: N/A, Direction: is blocked by PROJ-456 (Status: Open, Summary: Another Task)",
-            "  - Type: Relates, Direction: relates to N/A (Status: In Progress, Summary: Related Story)",
-            "  - Type: Depends, Direction: depends on PROJ-789 (Status: Closed, Summary: N/A)",
-            "  - Type: Tests, Direction: tests PROJ-ABC (Status: N/A, Summary: Test Case)"
-        ]
-        self.assertEqual(result["report"], "\n".join(expected_report_lines))
+        self.assertEqual(len(result["links"]), link_count)
+        report_lines = result["report"].split("\n")
+        self.assertEqual(len(report_lines), link_count + 1)
+        self.assertEqual(
+            report_lines[-1],
+            "  - Type: Relates, Direction: relates to PROJ-4999 (Status: Open, Summary: Story 4999)"
+        )
 
 
 class TestGetJiraIssueDetails(unittest.TestCase):
 
-    def _setup_mock_env_vars(self, mock_getenv):
-        mock_getenv.side_effect = lambda key, default=None: {
-            "ATLASSIAN_INSTANCE_URL": "https://test.atlassian.net",
-            "ATLASSIAN_EMAIL": "test@example.com",
-            "ATLASSIAN_API_KEY": "test_api_key"
-        }.get(key, default)
-
-    @patch('tools.jira_tools.requests.get')
-    @patch('tools.jira_tools.os.getenv')
-    def test_get_details_success_plain_text_default(self, mock_getenv, mock_requests_get):
-        self._setup_mock_env_vars(mock_getenv)
+    def setUp(self):
+        # Each test must hit the mocked API rather than a result cached by another test
+        jira_tools.clear_cache()
+        self._env = patch.dict(os.environ, _ENV)
+        self._env.start()
+
+    def tearDown(self):
+        self._env.stop()
+
+    @patch.object(jira_tools._SESSION, 'get')
+    def test_get_details_success_plain_text_default(self, mock_requests_get):
         issue_id = "PROJ-1"
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_requests_get.return_value = _FakeResp({
             "fields": {
                 "summary": "Test Summary",
                 "status": {"name": "Open"},
@@ -344,8 +420,7 @@ class TestGetJiraIssueDetails(unittest.TestCase):
                     ]
                 }
             }
-        }
-        mock_requests_get.return_value = mock_response
+        })
 
         result = get_jira_issue_details(issue_id) # render_html=False by default
 
@@ -361,33 +436,161 @@ class TestGetJiraIssueDetails(unittest.TestCase):
         self.assertEqual(result["report"], expected_report)
         mock_requests_get.assert_called_once_with(
             f"https://test.atlassian.net/rest/api/3/issue/{issue_id}",
-            headers={"Accept": "application/json"},
             auth=("test@example.com", "test_api_key"),
-            params={"fields": f"summary,status,assignee,description,{CUSTOM_FIELD_CATEGORY_ID}"},
+            headers=None,
+            params={"fields": _FIELDS_PARAM},
             timeout=15
         )
 
-    @patch('tools.jira_tools.requests.get')
-    @patch('tools.jira_tools.os.getenv')
-    def test_get_details_success_render_html_provided(self, mock_getenv, mock_requests_get):
-        self._setup_mock_env_vars(mock_getenv)
+    @patch.object(jira_tools._SESSION, 'get')
+    def test_get_details_cached_hits(self, mock_requests_get):
+        mock_requests_get.return_value = _FakeResp({
+            "fields": {"summary": "Cached", "status": {"name": "Open"}, "assignee": None, "description": None}
+        })
+
+        first = get_jira_issue_details("PROJ-1")
+        second = get_jira_issue_details("PROJ-1")
+
+        self.assertEqual(first, second)
+        self.assertEqual(mock_requests_get.call_count, 1)
+
+    @patch.object(jira_tools._SESSION, 'get')
+    def test_get_details_cached_hit_is_a_copy(self, mock_requests_get):
+        mock_requests_get.return_value = _FakeResp({
+            "fields": {"summary": "Cached", "status": {"name": "Open"}, "assignee": None, "description": None}
+        })
+
+        first = get_jira_issue_details("PROJ-1")
+        expected = dict(first)
+        first["report"] = "changed by the caller"
+
+        self.assertEqual(get_jira_issue_details("PROJ-1"), expected)
+        self.assertEqual(mock_requests_get.call_count, 1)
+
+    @patch.object(jira_tools, '_CACHE_MAXSIZE', 2)
+    @patch.object(jira_tools._SESSION, 'get')
+    def test_get_details_cache_evicts_least_recently_used(self, mock_requests_get):
+        mock_requests_get.return_value = _FakeResp({
+            "fields": {"summary": "Cached", "status": {"name": "Open"}, "assignee": None, "description": None}
+        })
+
+        for issue_id in ("PROJ-1", "PROJ-2", "PROJ-1", "PROJ-3"): # The PROJ-1 hit makes PROJ-2 the oldest
+            get_jira_issue_details(issue_id)
+        self.assertEqual(mock_requests_get.call_count, 3)
+
+        get_jira_issue_details("PROJ-1") # Still cached
+        self.assertEqual(mock_requests_get.call_count, 3)
+        get_jira_issue_details("PROJ-2") # Evicted by PROJ-3
+        self.assertEqual(mock_requests_get.call_count, 4)
+
+    @patch.object(jira_tools._SESSION, 'get')
+    def test_get_details_writes_invalidate_cached_issue(self, mock_requests_get):
+        mock_requests_get.return_value = _FakeResp({
+            "fields": {"summary": "Cached", "status": {"name": "Open"}, "assignee": None, "description": None}
+        })
+        writes = [
+            ("update", "put", lambda: jira_tools.update_jira_issue("PROJ-1", summary="New summary")),
+            ("transition", "post", lambda: jira_tools.transition_jira_issue("PROJ-1", "31")),
+            ("comment", "post", lambda: jira_tools.add_jira_comment("PROJ-1", "A comment")),
+        ]
+
+        for name, method, write in writes:
+            with self.subTest(write=name):
+                jira_tools.clear_cache()
+                mock_requests_get.reset_mock()
+                get_jira_issue_details("PROJ-1")
+                get_jira_issue_details("PROJ-2")
+
+                with patch.object(jira_tools._SESSION, method, return_value=_FakeResp({"id": "1"}, 204)):
+                    self.assertEqual(write()["status"], "success")
+
+                get_jira_issue_details("PROJ-1") # Refetched
+                get_jira_issue_details("PROJ-2") # Other issues stay cached
+                self.assertEqual(mock_requests_get.call_count, 3)
+
+    @patch.object(jira_tools._SESSION, 'get')
+    def test_get_details_config_change_clears_cache(self, mock_requests_get):
+        mock_requests_get.return_value = _FakeResp({
+            "fields": {"summary": "Cached", "status": {"name": "Open"}, "assignee": None, "description": None}
+        })
+
+        get_jira_issue_details("PROJ-1")
+        with patch.dict(os.environ, {"ATLASSIAN_INSTANCE_URL": "https://other.atlassian.net/"}):
+            get_jira_issue_details("PROJ-1")
+
+        self.assertEqual(mock_requests_get.call_count, 2)
+        self.assertEqual(mock_requests_get.call_args.args, ("https://other.atlassian.net/rest/api/3/issue/PROJ-1",))
+
+    @patch.object(jira_tools._SESSION, 'get')
+    def test_get_details_errors_are_not_cached(self, mock_requests_get):
+        mock_requests_get.return_value = _FakeResp(None, 404, err=requests.exceptions.HTTPError("404 Not Found"))
+
+        get_jira_issue_details("PROJ-404")
+        result = get_jira_issue_details("PROJ-404")
+
+        self.assertEqual(result["status"], "error")
+        self.assertEqual(mock_requests_get.call_count, 2)
+
+    @patch.object(jira_tools, '_CACHE_TTL', 0) # Every read is past the TTL; the ETag stays
+    @patch.object(jira_tools._SESSION, 'get')
+    def test_get_details_returns_cached_on_304(self, mock_requests_get):
+        mock_requests_get.side_effect = [
+            _FakeResp({
+                "fields": {"summary": "Tagged", "status": {"name": "Open"}, "assignee": None, "description": None}
+            }, headers={"ETag": "abc"}),
+            _FakeResp(None, 304),
+        ]
+
+        first_result = get_jira_issue_details("PROJ-ETAG")
+        result = get_jira_issue_details("PROJ-ETAG")
+
+        self.assertEqual(result, first_result)
+        self.assertEqual(mock_requests_get.call_count, 2)
+        self.assertIsNone(mock_requests_get.call_args_list[0].kwargs["headers"])
+        self.assertEqual(mock_requests_get.call_args_list[1].kwargs["headers"], {"If-None-Match": "abc"})
+
+    @patch.object(jira_tools._SESSION, 'get')
+    def test_get_details_plain_get_once_etag_entry_is_gone(self, mock_requests_get):
+        mock_requests_get.return_value = _FakeResp({
+            "fields": {"summary": "Tagged", "status": {"name": "Open"}, "assignee": None, "description": None}
+        }, headers={"ETag": "abc"})
+
+        get_jira_issue_details("PROJ-ETAG")
+        jira_tools._invalidate_issue("PROJ-ETAG") # Drops the cached result and its ETag
+        result = get_jira_issue_details("PROJ-ETAG")
+
+        self.assertEqual(result["status"], "success")
+        self.assertEqual(mock_requests_get.call_count, 2)
+        self.assertIsNone(mock_requests_get.call_args.kwargs["headers"])
+
+    @patch.object(jira_tools, '_CACHE_MAXSIZE', 2)
+    @patch.object(jira_tools._SESSION, 'get')
+    def test_get_details_etags_share_the_bounded_cache(self, mock_requests_get):
+        mock_requests_get.return_value = _FakeResp({
+            "fields": {"summary": "Tagged", "status": {"name": "Open"}, "assignee": None, "description": None}
+        }, headers={"ETag": "abc"})
+
+        for issue_id in ("PROJ-1", "PROJ-2", "PROJ-3"):
+            get_jira_issue_details(issue_id)
+
+        self.assertEqual(len(jira_tools._CACHE), 2)
+
+    @patch.object(jira_tools._SESSION, 'get')
+    def test_get_details_success_render_html_provided(self, mock_requests_get):
         issue_id = "PROJ-2"
         html_description_content = "<p>Hello <b>HTML</b> world.</p>"
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "renderedFields": {
-                "description": html_description_content
-            },
-            "fields": {
-                "summary": "HTML Test",
-                "status": {"name": "In Progress"},
-                "assignee": None, # Unassigned
-                CUSTOM_FIELD_CATEGORY_ID: {"value": "Frontend"},
-                "description": {"type": "doc", "version": 1, "content": []} # ADF might still exist
-            }
-        }
-        mock_requests_get.return_value = mock_response
+        mock_requests_get.side_effect = [
+            _FakeResp({
+                "fields": {
+                    "summary": "HTML Test",
+                    "status": {"name": "In Progress"},
+                    "assignee": None, # Unassigned
+                    CUSTOM_FIELD_CATEGORY_ID: {"value": "Frontend"},
+                    "description": {"type": "doc", "version": 1, "content": []} # ADF is what gets rendered
+                }
+            }),
+            _FakeResp({"renderedFields": {"description": html_description_content}}),
+        ]
 
         result = get_jira_issue_details(issue_id, render_html=True)
 
@@ -401,39 +604,46 @@ class TestGetJiraIssueDetails(unittest.TestCase):
             f"  Description: {html_description_content}"
         )
         self.assertEqual(result["report"], expected_report)
-        mock_requests_get.assert_called_once_with(
-            f"https://test.atlassian.net/rest/api/3/issue/{issue_id}",
-            headers={"Accept": "application/json"},
-            auth=("test@example.com", "test_api_key"),
-            params={"fields": f"summary,status,assignee,description,{CUSTOM_FIELD_CATEGORY_ID}", "expand": "renderedFields"},
-            timeout=15
-        )
-
-    @patch('tools.jira_tools.requests.get')
-    @patch('tools.jira_tools.os.getenv')
-    def test_get_details_success_render_html_fallback_to_adf(self, mock_getenv, mock_requests_get):
-        self._setup_mock_env_vars(mock_getenv)
+        self.assertEqual(mock_requests_get.call_args_list, [
+            call(
+                f"https://test.atlassian.net/rest/api/3/issue/{issue_id}",
+                auth=("test@example.com", "test_api_key"),
+                headers=None,
+                params={"fields": _FIELDS_PARAM},
+                timeout=15
+            ),
+            call(
+                f"https://test.atlassian.net/rest/api/3/issue/{issue_id}",
+                auth=("test@example.com", "test_api_key"),
+                params=_RENDER_PARAMS,
+                timeout=15
+            ),
+        ])
+
+    @patch.object(jira_tools._SESSION, 'get')
+    def test_get_details_success_render_html_fallback_to_adf(self, mock_requests_get):
         issue_id = "PROJ-3"
         adf_description_text = "ADF fallback content."
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "renderedFields": { # HTML description explicitly missing or null
-                "description": None
-            },
-            "fields": {
-                "summary": "Fallback Test",
-                "status": {"name": "Done"},
-                "assignee": {"displayName": "QA"},
-                CUSTOM_FIELD_CATEGORY_ID: None, # Category not set
-                "description": {
-                    "type": "doc", "version": 1, "content": [
-                        {"type": "paragraph", "content": [{"type": "text", "text": adf_description_text}]}
-                    ]
+        mock_requests_get.side_effect = [
+            _FakeResp({
+                "fields": {
+                    "summary": "Fallback Test",
+                    "status": {"name": "Done"},
+                    "assignee": {"displayName": "QA"},
+                    CUSTOM_FIELD_CATEGORY_ID: None, # Category not set
+                    "description": {
+                        "type": "doc", "version": 1, "content": [
+                            {"type": "paragraph", "content": [{"type": "text", "text": adf_description_text}]}
+                        ]
+                    }
                 }
-            }
-        }
-        mock_requests_get.return_value = mock_response
+            }),
+            _FakeResp({
+                "renderedFields": { # HTML description explicitly missing or null
+                    "description": None
+                }
+            }),
+        ]
 
         result = get_jira_issue_details(issue_id, render_html=True)
 
@@ -448,279 +658,220 @@ class TestGetJiraIssueDetails(unittest.TestCase):
             f"  Description: {expected_description}"
         )
         self.assertEqual(result["report"], expected_report)
-        mock_requests_get.assert_called_once_with(
-            f"https://test.atlassian.net/rest/api/3/issue/{issue_id}",
-            headers={"Accept": "application/json"},
-            auth=("test@example.com", "test_api_key"),
-            params={"fields": f"summary,status,assignee,description,{CUSTOM_FIELD_CATEGORY_ID}", "expand": "renderedFields"},
-            timeout=15
-        )
+        self.assertEqual(mock_requests_get.call_count, 2)
+        self.assertEqual(mock_requests_get.call_args.kwargs["params"], _RENDER_PARAMS)
+
+    @patch.object(jira_tools._SESSION, 'get')
+    def test_get_details_render_request_only_for_adf(self, mock_requests_get):
+        adf = {"type": "doc", "version": 1, "content": []}
+        # (case name, description field, expected number of GETs)
+        cases = [
+            ("no_description", None, 1),
+            ("plain_string", "Plain", 1),
+            ("adf", adf, 2),
+        ]
+        for name, description, expected_calls in cases:
+            with self.subTest(case=name):
+                jira_tools.clear_cache()
+                mock_requests_get.reset_mock()
+                mock_requests_get.return_value = _FakeResp({
+                    "renderedFields": {"description": "<p>HTML</p>"},
+                    "fields": {"description": description},
+                })
+
+                result = get_jira_issue_details("PROJ-LAZY", render_html=True)
+
+                # Rendered HTML is used whenever a response carries it
+                self.assertTrue(result["report"].endswith("Description: <p>HTML</p>"))
+                self.assertEqual(mock_requests_get.call_count, expected_calls)
+                self.assertEqual(mock_requests_get.call_args_list[0].kwargs["params"], {"fields": _FIELDS_PARAM})
+
+    @patch.object(jira_tools._SESSION, 'get')
+    def test_get_details_description_formats(self, mock_requests_get):
+        complex_adf = {"type": "doc", "version": 1, "content": [{"type": "table", "content": []}]} # Example of complex ADF
+        plain_desc = "This is a plain string description."
+        # (case name, description field, render_html, expected description text)
+        cases = [
+            ("no_description_plain_text", None, False, "No description provided."),
+            # No fallback message if ADF was also None
+            ("no_description_render_html", None, True, "No description provided."),
+            ("adf_complex_plain_text", complex_adf, False, "[Complex Description Format]"),
+            ("adf_complex_html_fallback", complex_adf, True,
+             "[Complex Description Format - Fallback from HTML request]"),
+            ("plain_string_plain_text", plain_desc, False, plain_desc),
+            ("plain_string_html_fallback", plain_desc, True,
+             f"{plain_desc} (Fallback: plain text from ADF, HTML not available)"),
+        ]
+        for name, description, render_html, expected_description in cases:
+            with self.subTest(case=name):
+                jira_tools.clear_cache()
+                # Serves both the issue request and, for ADF descriptions, the render request
+                mock_requests_get.return_value = _FakeResp({
+                    "renderedFields": {"description": None},
+                    "fields": {
+                        "summary": "Desc Test", "status": {"name": "Open"}, "assignee": None,
+                        CUSTOM_FIELD_CATEGORY_ID: {"value": "Misc"},
+                        "description": description
+                    }
+                })
+
+                result = get_jira_issue_details("PROJ-DESC", render_html=render_html)
+
+                self.assertEqual(result["status"], "success")
+                expected_report = (
+                    "Issue PROJ-DESC:\n"
+                    "  Summary: Desc Test\n"
+                    "  Status: Open\n"
+                    "  Assignee: Unassigned\n"
+                    "  Category: Misc\n"
+                    f"  Description: {expected_description}"
+                )
+                self.assertEqual(result["report"], expected_report)
+
+    @patch.object(jira_tools._SESSION, 'get')
+    def test_get_details_http_errors(self, mock_requests_get):
+        issue_id = "PROJ-ERR"
+        cases = [
+            (401, "Unauthorized", "Jira authentication failed. Check email/API key."),
+            (403, "Forbidden", "Jira permission denied."),
+            (404, "Not Found", f"Jira issue '{issue_id}' not found (404)."),
+            (500, "500 Server Error", "HTTP error occurred: 500 Server Error"),
+        ]
+        for status_code, reason, expected_message in cases:
+            with self.subTest(status_code=status_code):
+                mock_requests_get.return_value = _FakeResp(
+                    None, status_code, err=requests.exceptions.HTTPError(reason)
+                )
 
-    @patch('tools.jira_tools.requests.get')
-    @patch('tools.jira_tools.os.getenv')
-    def test_get_details_success_no_description_plain_text(self, mock_getenv, mock_requests_get):
-        self._setup_mock_env_vars(mock_getenv)
-        issue_id = "PROJ-4"
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "fields": {
-                "summary": "No Desc Test",
-                "status": {"name": "Open"},
-                "assignee": None,
-                CUSTOM_FIELD_CATEGORY_ID: {"value": "Backend"},
-                "description": None # No description field
-            }
-        }
-        mock_requests_get.return_value = mock_response
+                result = get_jira_issue_details(issue_id)
 
-        result = get_jira_issue_details(issue_id) # render_html=False
+                self.assertEqual(result["status"], "error")
+                self.assertEqual(result["error_message"], expected_message)
 
-        self.assertEqual(result["status"], "success")
-        expected_report = (
-            f"Issue {issue_id}:\n"
-            f"  Summary: No Desc Test\n"
-            f"  Status: Open\n"
-            f"  Assignee: Unassigned\n"
-            f"  Category: Backend\n"
-            f"  Description: No description provided."
-        )
-        self.assertEqual(result["report"], expected_report)
+    def test_get_details_missing_env_vars(self):
+        issue_id = "PROJ-ENV"
+        with patch.dict(os.environ, {}, clear=True): # Simulate no env vars
+            result = get_jira_issue_details(issue_id)
+        self.assertEqual(result["status"], "error")
+        self.assertIn("Atlassian instance configuration", result["error_message"])
+
+    @patch.object(jira_tools._SESSION, 'get')
+    def test_get_details_request_exception(self, mock_requests_get):
+        issue_id = "PROJ-REQEX"
+        req_exception_message = "Connection problem"
+        mock_requests_get.side_effect = requests.exceptions.RequestException(req_exception_message)
+
+        result = get_jira_issue_details(issue_id)
+        self.assertEqual(result["status"], "error")
+        self.assertEqual(result["error_message"], f"An error occurred: {req_exception_message}")
 
-    @patch('tools.jira_tools.requests.get')
-    @patch('tools.jira_tools.os.getenv')
-    def test_get_details_success_no_description_render_html(self, mock_getenv, mock_requests_get):
-        self._setup_mock_env_vars(mock_getenv)
-        issue_id = "PROJ-5"
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "renderedFields": {"description": None},
+    def test_get_details_deeply_nested_adf(self):
+        # Nest paragraphs far beyond the interpreter's recursion limit
+        node = {"type": "text", "text": "Deep text."}
+        for _ in range(5000):
+            node = {"type": "paragraph", "content": [node]}
+        description = {"type": "doc", "version": 1, "content": [node]}
+
+        self.assertEqual(jira_tools._adf_to_text(description), "Deep text.")
+        self.assertEqual(jira_tools._parse_adf_text(description), "Deep text.")
+
+
+class TestGetJiraIssuesBulk(unittest.TestCase):
+
+    def setUp(self):
+        self._env = patch.dict(os.environ, _ENV)
+        self._env.start()
+
+    def tearDown(self):
+        self._env.stop()
+
+    def _response_for(self, url, **kwargs):
+        issue_id = url.rsplit("/", 1)[-1]
+        return _FakeResp({
             "fields": {
-                "summary": "No Desc HTML Test",
+                "summary": f"Summary {issue_id}",
                 "status": {"name": "Open"},
-                "assignee": None,
-                CUSTOM_FIELD_CATEGORY_ID: {"value": "General"},
-                "description": None
+                "assignee": {"displayName": "Test User"},
+                CUSTOM_FIELD_CATEGORY_ID: {"value": "Test Category"},
+                "description": {
+                    "type": "doc", "version": 1, "content": [
+                        {"type": "paragraph", "content": [{"type": "text", "text": "Hello world."}]}
+                    ]
+                }
             }
-        }
-        mock_requests_get.return_value = mock_response
+        })
 
-        result = get_jira_issue_details(issue_id, render_html=True)
+    @patch.object(jira_tools._SESSION, 'get')
+    def test_bulk_fetches_every_issue(self, mock_requests_get):
+        issue_ids = [f"PROJ-{i}" for i in range(1, 9)]
+        mock_requests_get.side_effect = self._response_for
+
+        result = jira_tools.get_jira_issues_bulk(issue_ids)
 
         self.assertEqual(result["status"], "success")
-        expected_report = (
-            f"Issue {issue_id}:\n"
-            f"  Summary: No Desc HTML Test\n"
-            f"  Status: Open\n"
-            f"  Assignee: Unassigned\n"
-            f"  Category: General\n"
-            f"  Description: No description provided." # No fallback message if ADF was also None
-        )
-        self.assertEqual(result["report"], expected_report)
+        self.assertEqual(result["errors"], {})
+        self.assertEqual(list(result["issues"]), issue_ids)
+        self.assertEqual(result["issues"]["PROJ-3"]["summary"], "Summary PROJ-3")
+        self.assertEqual(mock_requests_get.call_count, len(issue_ids))
+        for call_args in mock_requests_get.call_args_list:
+            self.assertEqual(call_args.kwargs["params"], {"fields": _FIELDS_PARAM})
 
-    @patch('tools.jira_tools.os.getenv')
-    def test_get_details_missing_env_vars(self, mock_getenv):
-        mock_getenv.side_effect = lambda key, default=None: None # Simulate no env vars
-        issue_id = "PROJ-ENV"
-        result = get_jira_issue_details(issue_id)
-        self.assertEqual(result["status"], "error")
-        self.assertIn("Atlassian instance configuration", result["error_message"])
+    @patch.object(jira_tools._SESSION, 'get')
+    def test_bulk_collects_per_issue_errors(self, mock_requests_get):
 
-    @patch('tools.jira_tools.requests.get')
-    @patch('tools.jira_tools.os.getenv')
-    def test_get_details_http_error_401(self, mock_getenv, mock_requests_get):
-        self._setup_mock_env_vars(mock_getenv)
-        issue_id = "PROJ-AUTH"
-        mock_response = MagicMock()
-        mock_response.status_code = 401
-        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("Unauthorized")
-        mock_requests_get.return_value = mock_response
+        def side_effect(url, **kwargs):
+            if url.endswith("PROJ-404"):
+                return _FakeResp(None, 404, err=requests.exceptions.HTTPError("404 Not Found"))
+            return self._response_for(url)
 
-        result = get_jira_issue_details(issue_id)
-        self.assertEqual(result["status"], "error")
-        self.assertEqual(result["error_message"], "Jira authentication failed. Check email/API key.")
-
-    @patch('tools.jira_tools.requests.get')
-    @patch('tools.jira_tools.os.getenv')
-    def test_get_details_http_error_403(self, mock_getenv, mock_requests_get):
-        self._setup_mock_env_vars(mock_getenv)
-        issue_id = "PROJ-FORBID"
-        mock_response = MagicMock()
-        mock_response.status_code = 403
-        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("Forbidden")
-        mock_requests_get.return_value = mock_response
+        mock_requests_get.side_effect = side_effect
 
-        result = get_jira_issue_details(issue_id)
-        self.assertEqual(result["status"], "error")
-        self.assertEqual(result["error_message"], "Jira permission denied.")
+        result = jira_tools.get_jira_issues_bulk(["PROJ-1", "PROJ-404"])
 
+        self.assertEqual(result["status"], "success")
+        self.assertEqual(list(result["issues"]), ["PROJ-1"])
+        self.assertIn("404 Not Found", result["errors"]["PROJ-404"])
 
-    @patch('tools.jira_tools.requests.get')
-    @patch('tools.jira_tools.os.getenv')
-    def test_get_details_http_error_404(self, mock_getenv, mock_requests_get):
-        self._setup_mock_env_vars(mock_getenv)
-        issue_id = "PROJ-NF"
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("Not Found")
-        mock_requests_get.return_value = mock_response
+    @patch.object(jira_tools._SESSION, 'get')
+    def test_bulk_all_failed_is_an_error(self, mock_requests_get):
+        mock_requests_get.return_value = _FakeResp(None, 401, err=requests.exceptions.HTTPError("401 Unauthorized"))
 
-        result = get_jira_issue_details(issue_id)
-        self.assertEqual(result["status"], "error")
-        self.assertEqual(result["error_message"], f"Jira issue '{issue_id}' not found (404).")
-
-    @patch('tools.jira_tools.requests.get')
-    @patch('tools.jira_tools.os.getenv')
-    def test_get_details_other_http_error(self, mock_getenv, mock_requests_get):
-        self._setup_mock_env_vars(mock_getenv)
-        issue_id = "PROJ-HTTPERR"
-        http_error_message = "500 Server Error"
-        mock_response = MagicMock()
-        mock_response.status_code = 500
-        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError(http_error_message)
-        mock_requests_get.return_value = mock_response
+        result = jira_tools.get_jira_issues_bulk(["PROJ-1", "PROJ-2"])
 
-        result = get_jira_issue_details(issue_id)
         self.assertEqual(result["status"], "error")
-        self.assertEqual(result["error_message"], f"HTTP error occurred: {http_error_message}")
-
-    @patch('tools.jira_tools.requests.get')
-    @patch('tools.jira_tools.os.getenv')
-    def test_get_details_request_exception(self, mock_getenv, mock_requests_get):
-        self._setup_mock_env_vars(mock_getenv)
-        issue_id = "PROJ-REQEX"
-        req_exception_message = "Connection problem"
-        mock_requests_get.side_effect = requests.exceptions.RequestException(req_exception_message)
+        self.assertEqual(
+            result["error_message"],
+            "Failed to fetch any of the 2 issues. First error: HTTP error occurred: 401 Unauthorized"
+        )
+        self.assertEqual(result["issues"], {})
+        self.assertEqual(set(result["errors"]), {"PROJ-1", "PROJ-2"})
 
-        result = get_jira_issue_details(issue_id)
+    def test_bulk_empty_issue_list(self):
+        result = jira_tools.get_jira_issues_bulk([])
         self.assertEqual(result["status"], "error")
-        self.assertEqual(result["error_message"], f"An error occurred: {req_exception_message}")
-
-    @patch('tools.jira_tools.requests.get')
-    @patch('tools.jira_tools.os.getenv')
-    def test_get_details_adf_complex_format_plain_text(self, mock_getenv, mock_requests_get):
-        self._setup_mock_env_vars(mock_getenv)
-        issue_id = "PROJ-ADFCOMPLEX"
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "fields": {
-                "summary": "Complex ADF", "status": {"name": "Open"}, "assignee": None,
-                CUSTOM_FIELD_CATEGORY_ID: {"value": "Docs"},
-                "description": {"type": "doc", "version": 1, "content": [{"type": "table", "content": []}]} # Example of complex ADF
-            }
-        }
-        mock_requests_get.return_value = mock_response
-        result = get_jira_issue_details(issue_id)
-        self.assertIn("[Complex Description Format]", result["report"])
-
-    @patch('tools.jira_tools.requests.get')
-    @patch('tools.jira_tools.os.getenv')
-    def test_get_details_adf_complex_format_html_fallback(self, mock_getenv, mock_requests_get):
-        self._setup_mock_env_vars(mock_getenv)
-        issue_id = "PROJ-ADFCOMPLEXHTML"
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "renderedFields": {"description": None},
-            "fields": {
-                "summary": "Complex ADF HTML Fallback", "status": {"name": "Open"}, "assignee": None,
-                CUSTOM_FIELD_CATEGORY_ID: {"value": "Tech"},
-                "description": {"type": "doc", "version": 1, "content": [{"type": "table", "content": []}]}
-            }
-        }
-        mock_requests_get.return_value = mock_response
-        result = get_jira_issue_details(issue_id, render_html=True)
-        self.assertIn("[Complex Description Format - Fallback from HTML request]", result["report"])
-
-    @patch('tools.jira_tools.requests.get')
-    @patch('tools.jira_tools.os.getenv')
-    def test_get_details_plain_string_description_plain_text(self, mock_getenv, mock_requests_get):
-        self._setup_mock_env_vars(mock_getenv)
-        issue_id = "PROJ-STRDESC"
-        plain_desc = "This is a plain string description."
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "fields": {
-                "summary": "String Desc", "status": {"name": "Open"}, "assignee": None,
-                CUSTOM_FIELD_CATEGORY_ID: {"value": "Misc"},
-                "description": plain_desc
-            }
-        }
-        mock_requests_get.return_value = mock_response
-        result = get_jira_issue_details(issue_id)
-        self.assertIn(f"Description: {plain_desc}", result["report"])
-
-    @patch('tools.jira_tools.requests.get')
-    @patch('tools.jira_tools.os.getenv')
-    def test_get_details_plain_string_description_html_fallback(self, mock_getenv, mock_requests_get):
-        self._setup_mock_env_vars(mock_getenv)
-        issue_id = "PROJ-STRDESCHTML"
-        plain_desc = "This is a plain string description for HTML fallback."
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "renderedFields": {"description": None},
-            "fields": {
-                "summary": "String Desc HTML", "status": {"name": "Open"}, "assignee": None,
-                CUSTOM_FIELD_CATEGORY_ID: {"value": "Misc"},
-                "description": plain_desc
-            }
-        }
-        mock_requests_get.return_value = mock_response
-        result = get_jira_issue_details(issue_id, render_html=True)
-        expected_desc_text = f"{plain_desc} (Fallback: plain text from ADF, HTML not available)"
-        self.assertIn(f"Description: {expected_desc_text}", result["report"])
+        self.assertEqual(result["error_message"], "No issue IDs provided.")
 
 
 class TestSearchJiraIssuesJQL(unittest.TestCase):
-
-    def _setup_mock_env_vars(self, mock_getenv):
-        mock_getenv.side_effect = lambda key, default=None: {
-            "ATLASSIAN_INSTANCE_URL": "https://test.atlassian.net",
-            "ATLASSIAN_EMAIL": "test@example.com",
-            "ATLASSIAN_API_KEY": "test_api_key"
-        }.get(key, default)
-
-    @patch('tools.jira_tools.requests.post')
-    @patch('tools.jira_tools.os.getenv')
-    def test_search_success_with_results_default_fields(self, mock_getenv, mock_requests_post):
-        self._setup_mock_env_vars(mock_getenv)
-        jql_query = "project = TEST"
+    # Request parts every search sends, built once for the class
+    _HEADERS = {"Accept": "application/json", "Content-Type": "application/json"}
+    _AUTH = ("test@example.com", "test_api_key")
+    _DEFAULT_FIELDS = ["summary", "status", "assignee", "reporter", "created", "updated"]
+    _DEFAULT_PAYLOAD = {"jql": _DEFAULT_SEARCH_JQL, "maxResults": 50, "fields": _DEFAULT_FIELDS}
+    _CUSTOM_PAYLOAD = {"jql": _CUSTOM_SEARCH_JQL, "maxResults": 10, "fields": _CUSTOM_SEARCH_FIELDS}
+
+    @classmethod
+    def setUpClass(cls):
+        # One getenv patch for the whole class instead of one per test
+        cls._env_patch = patch('tools.jira_tools.os.getenv', side_effect=_ENV.get) # Same (key, default) signature
+        cls._env_patch.start()
+        cls.addClassCleanup(cls._env_patch.stop)
+
+    @patch.object(jira_tools._SESSION, 'post')
+    def test_search_success_with_results_default_fields(self, mock_requests_post):
+        jql_query = _DEFAULT_SEARCH_JQL
         
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "issues": [
-                {
-                    "key": "TEST-1",
-                    "fields": {
-                        "summary": "Test Issue 1",
-                        "status": {"name": "Open"},
-                        "assignee": {"displayName": "User A"},
-                        "reporter": {"displayName": "User B"},
-                        "created": "2023-01-01T10:00:00.000+0000",
-                        "updated": "2023-01-02T10:00:00.000+0000"
-                    }
-                },
-                {
-                    "key": "TEST-2",
-                    "fields": {
-                        "summary": "Test Issue 2",
-                        "status": {"name": "In Progress"},
-                        "assignee": None, # Unassigned
-                        "reporter": {"displayName": "User C"},
-                        "created": "2023-01-03T10:00:00.000+0000",
-                        "updated": "2023-01-04T10:00:00.000+0000"
-                    }
-                }
-            ],
-            "maxResults": 50,
-            "total": 2
-        }
-        mock_requests_post.return_value = mock_response
+        mock_requests_post.return_value = _FakeResp(_SEARCH_RESPONSES.default)
 
         result = search_jira_issues_jql(jql_query)
 
@@ -733,46 +884,22 @@ class TestSearchJiraIssuesJQL(unittest.TestCase):
         self.assertEqual(result["issues"][1]["assignee"], None)
         self.assertIn("Found 2 issue(s) matching JQL", result["report"])
         
-        expected_payload = {
-            "jql": jql_query,
-            "maxResults": 50,
-            "fields": ["summary", "status", "assignee", "reporter", "created", "updated"]
-        }
-        mock_requests_post.assert_called_once_with(
-            "https://test.atlassian.net/rest/api/3/search",
-            headers={"Accept": "application/json", "Content-Type": "application/json"},
-            auth=("test@example.com", "test_api_key"),
-            data=json.dumps(expected_payload),
-            timeout=30
-        )
-
-    @patch('tools.jira_tools.requests.post')
-    @patch('tools.jira_tools.os.getenv')
-    def test_search_success_with_custom_fields_and_max_results(self, mock_getenv, mock_requests_post):
-        self._setup_mock_env_vars(mock_getenv)
-        jql_query = "assignee = currentUser()"
-        custom_fields = ["summary", "customfield_10001", "labels"]
+        self.assertEqual(mock_requests_post.call_count, 1)
+        args, kwargs = mock_requests_post.call_args
+        self.assertEqual(args, ("https://test.atlassian.net/rest/api/3/search",))
+        self.assertEqual(kwargs["headers"], self._HEADERS)
+        self.assertEqual(kwargs["auth"], self._AUTH)
+        self.assertEqual(json.loads(kwargs["data"]), self._DEFAULT_PAYLOAD)
+        self.assertEqual(kwargs["timeout"], 30)
+
+    @patch.object(jira_tools._SESSION, 'post')
+    def test_search_success_with_custom_fields_and_max_results(self, mock_requests_post):
+        jql_query = _CUSTOM_SEARCH_JQL
         max_res = 10
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "issues": [
-                {
-                    "key": "TEST-3",
-                    "fields": {
-                        "summary": "Custom Field Test",
-                        "customfield_10001": {"value": "OptionA"}, # Single select custom field
-                        "labels": ["label1", "label2"] # List of strings
-                    }
-                }
-            ],
-            "maxResults": max_res,
-            "total": 1
-        }
-        mock_requests_post.return_value = mock_response
+        mock_requests_post.return_value = _FakeResp(_SEARCH_RESPONSES.custom_fields)
 
-        result = search_jira_issues_jql(jql_query, fields=custom_fields, max_results=max_res)
+        result = search_jira_issues_jql(jql_query, fields=_CUSTOM_SEARCH_FIELDS, max_results=max_res)
 
         self.assertEqual(result["status"], "success")
         self.assertEqual(len(result["issues"]), 1)
@@ -781,29 +908,19 @@ class TestSearchJiraIssuesJQL(unittest.TestCase):
         self.assertEqual(result["issues"][0]["labels"], ["label1", "label2"])
         self.assertIn(f"Found 1 issue(s) matching JQL (returning up to {max_res})", result["report"])
 
-        expected_payload = {
-            "jql": jql_query,
-            "maxResults": max_res,
-            "fields": custom_fields
-        }
-        mock_requests_post.assert_called_once_with(
-            "https://test.atlassian.net/rest/api/3/search",
-            headers={"Accept": "application/json", "Content-Type": "application/json"},
-            auth=("test@example.com", "test_api_key"),
-            data=json.dumps(expected_payload),
-            timeout=30
-        )
+        self.assertEqual(mock_requests_post.call_count, 1)
+        args, kwargs = mock_requests_post.call_args
+        self.assertEqual(args, ("https://test.atlassian.net/rest/api/3/search",))
+        self.assertEqual(kwargs["headers"], self._HEADERS)
+        self.assertEqual(kwargs["auth"], self._AUTH)
+        self.assertEqual(json.loads(kwargs["data"]), self._CUSTOM_PAYLOAD)
+        self.assertEqual(kwargs["timeout"], 30)
 
-    @patch('tools.jira_tools.requests.post')
-    @patch('tools.jira_tools.os.getenv')
-    def test_search_success_no_results(self, mock_getenv, mock_requests_post):
-        self._setup_mock_env_vars(mock_getenv)
+    @patch.object(jira_tools._SESSION, 'post')
+    def test_search_success_no_results(self, mock_requests_post):
         jql_query = "project = XYZ AND status = Resolved"
         
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"issues": [], "maxResults": 50, "total": 0}
-        mock_requests_post.return_value = mock_response
+        mock_requests_post.return_value = _FakeResp({"issues": [], "maxResults": 50, "total": 0})
 
         result = search_jira_issues_jql(jql_query)
 
@@ -811,97 +928,131 @@ class TestSearchJiraIssuesJQL(unittest.TestCase):
         self.assertEqual(len(result["issues"]), 0)
         self.assertIn(f"No issues found matching the JQL query: {jql_query}", result["report"])
 
-    @patch('tools.jira_tools.os.getenv')
-    def test_search_missing_env_vars(self, mock_getenv):
-        mock_getenv.side_effect = lambda key, default=None: None # Simulate no env vars
-        result = search_jira_issues_jql("project = TEST")
+    def test_search_missing_env_vars(self):
+        with patch('tools.jira_tools.os.getenv', return_value=None): # Simulate no env vars
+            result = search_jira_issues_jql("project = TEST")
         self.assertEqual(result["status"], "error")
+        self.assertEqual(result["error_code"], "CONFIG_MISSING")
         self.assertIn("Atlassian instance configuration", result["error_message"])
 
     def test_search_empty_jql_query(self):
         result = search_jira_issues_jql("")
         self.assertEqual(result["status"], "error")
+        self.assertEqual(result["error_code"], "EMPTY_JQL")
         self.assertEqual(result["error_message"], "JQL query cannot be empty.")
 
-    @patch('tools.jira_tools.requests.post')
-    @patch('tools.jira_tools.os.getenv')
-    def test_search_http_error_400_bad_jql(self, mock_getenv, mock_requests_post):
-        self._setup_mock_env_vars(mock_getenv)
+    @patch.object(jira_tools._SESSION, 'post')
+    def test_search_http_errors(self, mock_requests_post):
+        # (status code, raised error, error payload, expected error code, expected detail)
+        cases = [
+            (400, requests.exceptions.HTTPError("Bad Request"),
+             {"errorMessages": ["Invalid JQL query."]}, "BAD_REQUEST", "Invalid JQL query."),
+            (401, requests.exceptions.HTTPError("Unauthorized"),
+             {"errorMessages": ["Authentication failed."]}, "UNAUTHORIZED", "Authentication failed."),
+            (500, requests.exceptions.HTTPError("Server Error"),
+             {"errorMessages": ["Internal error."]}, "HTTP_ERROR", "Internal error."),
+        ]
         jql_query = "project = INVALID JQL"
-        
-        mock_response = MagicMock()
-        mock_response.status_code = 400
-        mock_response.json.return_value = {"errorMessages": ["Invalid JQL query."]}
-        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("Bad Request")
-        mock_requests_post.return_value = mock_response
+        for status, err, payload, expected_code, expected_detail in cases:
+            with self.subTest(status=status):
+                mock_requests_post.return_value = _FakeResp(payload, status=status, err=err)
+
+                result = search_jira_issues_jql(jql_query)
+
+                self.assertEqual(result["status"], "error")
+                self.assertEqual(result["error_code"], expected_code)
+                self.assertIn(expected_detail, result["error_message"])
+                self.assertEqual(result["issues"], [])
+                # The JQL hint is only added for malformed queries
+                if status == 400:
+                    self.assertIn(f"Check JQL syntax: {jql_query}", result["error_message"])
+                else:
+                    self.assertNotIn("Check JQL syntax", result["error_message"])
+
+    @patch.object(jira_tools._SESSION, 'post')
+    def test_search_fetches_remaining_pages_in_parallel(self, mock_requests_post):
+        total = 450
+        # Every later page waits for a second one, so this only passes if pages overlap in time
+        barrier = threading.Barrier(2, timeout=5)
+        seen = [] # (startAt, maxResults, thread ident) per request
+        lock = threading.Lock()
+
+        def fake_post(url, data, **kwargs):
+            payload = json.loads(data)
+            start = payload.get("startAt", 0)
+            with lock:
+                seen.append((start, payload["maxResults"], threading.get_ident()))
+            if start:
+                barrier.wait()
+            issues = [
+                {"key": f"TEST-{i}", "fields": {"summary": f"Issue {i}"}}
+                for i in range(start, min(start + payload["maxResults"], total))
+            ]
+            return _FakeResp({"issues": issues, "maxResults": 100, "total": total})
+
+        mock_requests_post.side_effect = fake_post
+
+        result = search_jira_issues_jql("project = TEST", fields=["summary"], max_results=500)
 
-        result = search_jira_issues_jql(jql_query)
+        self.assertEqual(result["status"], "success")
+        self.assertEqual([issue["key"] for issue in result["issues"]], [f"TEST-{i}" for i in range(total)])
+        self.assertEqual(
+            sorted((start, size) for start, size, _ in seen),
+            [(0, 100), (100, 100), (200, 100), (300, 100), (400, 50)]
+        )
+        self.assertGreaterEqual(len({ident for start, _, ident in seen if start}), 2)
 
-        self.assertEqual(result["status"], "error")
-        self.assertIn("HTTP error searching issues with JQL", result["error_message"])
-        self.assertIn("Invalid JQL query.", result["error_message"])
-        self.assertIn(f"Check JQL syntax: {jql_query}", result["error_message"])
+    @patch.object(jira_tools._SESSION, 'post')
+    def test_search_zero_max_results(self, mock_requests_post):
+        mock_requests_post.return_value = _FakeResp({"issues": [], "maxResults": 0, "total": 450})
+
+        result = search_jira_issues_jql("project = TEST", max_results=0)
+
+        self.assertEqual(result["status"], "success")
         self.assertEqual(result["issues"], [])
+        self.assertEqual(mock_requests_post.call_count, 1) # No further pages
 
-    @patch('tools.jira_tools.requests.post')
-    @patch('tools.jira_tools.os.getenv')
-    def test_search_http_error_401_unauthorized(self, mock_getenv, mock_requests_post):
-        self._setup_mock_env_vars(mock_getenv)
-        
-        mock_response = MagicMock()
-        mock_response.status_code = 401
-        mock_response.json.return_value = {"errorMessages": ["Authentication failed."]}
-        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("Unauthorized")
-        mock_requests_post.return_value = mock_response
+    @patch.object(jira_tools._SESSION, 'post')
+    def test_search_follows_smaller_page_size_from_jira(self, mock_requests_post):
+        total = 120
 
-        result = search_jira_issues_jql("project = TEST")
+        def fake_post(url, data, **kwargs):
+            payload = json.loads(data)
+            start = payload.get("startAt", 0)
+            size = min(payload["maxResults"], 50) # Jira caps every page at 50 issues
+            issues = [{"key": f"TEST-{i}", "fields": {"summary": f"Issue {i}"}} for i in range(start, min(start + size, total))]
+            return _FakeResp({"issues": issues, "maxResults": size, "total": total})
 
-        self.assertEqual(result["status"], "error")
-        self.assertIn("HTTP error searching issues with JQL", result["error_message"])
-        self.assertIn("Authentication failed.", result["error_message"])
+        mock_requests_post.side_effect = fake_post
 
-    @patch('tools.jira_tools.requests.post')
-    @patch('tools.jira_tools.os.getenv')
-    def test_search_request_exception(self, mock_getenv, mock_requests_post):
-        self._setup_mock_env_vars(mock_getenv)
+        result = search_jira_issues_jql("project = TEST", fields=["summary"], max_results=500)
+
+        self.assertEqual(result["status"], "success")
+        self.assertEqual([issue["key"] for issue in result["issues"]], [f"TEST-{i}" for i in range(total)])
+        requested = sorted(
+            (json.loads(c.kwargs["data"]).get("startAt", 0), json.loads(c.kwargs["data"])["maxResults"])
+            for c in mock_requests_post.call_args_list
+        )
+        self.assertEqual(requested, [(0, 100), (50, 50), (100, 20)])
+
+    @patch.object(jira_tools._SESSION, 'post')
+    def test_search_request_exception(self, mock_requests_post):
         req_exception_message = "Connection timed out"
         mock_requests_post.side_effect = requests.exceptions.RequestException(req_exception_message)
 
         result = search_jira_issues_jql("project = TEST")
 
         self.assertEqual(result["status"], "error")
+        self.assertEqual(result["error_code"], "REQUEST_EXCEPTION")
         self.assertEqual(result["error_message"], f"Error searching issues with JQL: {req_exception_message}")
         self.assertEqual(result["issues"], [])
 
-    @patch('tools.jira_tools.requests.post')
-    @patch('tools.jira_tools.os.getenv')
-    def test_search_field_type_handling(self, mock_getenv, mock_requests_post):
-        self._setup_mock_env_vars(mock_getenv)
+    @patch.object(jira_tools._SESSION, 'post')
+    def test_search_field_type_handling(self, mock_requests_post):
         jql_query = "project = TEST"
         fields_to_request = ["status", "assignee", "components", "custom_single_select", "custom_multi_select", "priority"]
         
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "issues": [
-                {
-                    "key": "TEST-COMPLEX",
-                    "fields": {
-                        "status": {"name": "Blocked", "description": "Issue is blocked"}, # 'name'
-                        "assignee": {"displayName": "Dev Lead", "accountId": "123"}, # 'displayName'
-                        "components": [{"name": "Backend"}, {"name": "API"}], # list of dicts with 'name'
-                        "custom_single_select": {"value": "High"}, # 'value'
-                        "custom_multi_select": [ # list of dicts with 'value'
-                            {"value": "Feature"}, 
-                            {"value": "Improvement"}
-                        ],
-                        "priority": {"name": "Highest"} # 'name'
-                    }
-                }
-            ],
-            "maxResults": 1, "total": 1
-        }
-        mock_requests_post.return_value = mock_response
+        mock_requests_post.return_value = _FakeResp(_SEARCH_RESPONSES.complex)
 
         result = search_jira_issues_jql(jql_query, fields=fields_to_request, max_results=1)
 
@@ -915,16 +1066,3 @@ class TestSearchJiraIssuesJQL(unittest.TestCase):
         self.assertEqual(issue["custom_single_select"], "High")
         self.assertEqual(issue["custom_multi_select"], ["Feature", "Improvement"])
         self.assertEqual(issue["priority"], "Highest")
-
-
-if __name__ == '__main__':
-    # This is to allow running the tests directly from this file
-    # Add the project root to sys.path if tools.jira_tools cannot be found
-    import sys
-    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
-    if project_root not in sys.path:
-        sys.path.insert(0, project_root)
-    
-    # Need to import requests for the side_effect of HTTPError
-    import requests 
-    unittest.main()
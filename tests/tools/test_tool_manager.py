@@ -1,13 +1,6 @@
 import unittest
 from unittest.mock import patch, MagicMock
 import sqlite3
-import sys
-import os
-
-# Füge das Projekt-Stammverzeichnis zum sys.path hinzu, um das 'tools'-Modul zu finden
-project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
 
 from tools.tool_manager import list_available_tools_for_agent, set_tool_availability_for_agent, AGENT_TOOLS_TABLE_NAME
 from tools.tool_description_manager import TABLE_NAME as TOOL_DESCRIPTIONS_TABLE_NAME
@@ -26,38 +19,48 @@ TOOL_DESC_3 = "Beschreibung für Werkzeug3"
 TOOL_MODULE_3 = "test.module3"
 NON_EXISTENT_TOOL = "nicht_existierendes_werkzeug"
 
+# Schema und Befüllung der Testdatenbank
+CREATE_SQL = f"""
+    CREATE TABLE {TOOL_DESCRIPTIONS_TABLE_NAME} (
+        tool_name TEXT PRIMARY KEY,
+        description TEXT NOT NULL,
+        source_module TEXT
+    );
+    CREATE TABLE {AGENT_TOOLS_TABLE_NAME} (
+        agent_name TEXT NOT NULL,
+        tool_name TEXT NOT NULL,
+        PRIMARY KEY (agent_name, tool_name),
+        FOREIGN KEY (tool_name) REFERENCES {TOOL_DESCRIPTIONS_TABLE_NAME}(tool_name)
+    );
+"""
+INSERT_SQL = f"INSERT INTO {TOOL_DESCRIPTIONS_TABLE_NAME} (tool_name, description, source_module) VALUES (?, ?, ?)"
+
+
 class TestToolManager(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        # Schema und Testdaten werden einmal in einer Vorlage aufgebaut und pro Test kopiert
+        cls._template = sqlite3.connect(":memory:")
+        with cls._template:
+            cls._template.executescript(CREATE_SQL)
+            cls._template.executemany(INSERT_SQL, [
+                (TOOL_1, TOOL_DESC_1, TOOL_MODULE_1),
+                (TOOL_2, TOOL_DESC_2, TOOL_MODULE_2),
+                (TOOL_3, TOOL_DESC_3, TOOL_MODULE_3),
+            ])
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._template.close()
+
     def setUp(self):
-        # Verwende eine In-Memory SQLite-Datenbank für Tests
+        # Verwende eine In-Memory SQLite-Datenbank für Tests, kopiert aus der Vorlage
         self.conn = sqlite3.connect(":memory:")
         self.conn.row_factory = sqlite3.Row # Ermöglicht Spaltenzugriff über Namen
+        self._template.backup(self.conn)
         self.cursor = self.conn.cursor()
 
-        # Erstelle Tabellen
-        self.cursor.execute(f"""
-            CREATE TABLE {TOOL_DESCRIPTIONS_TABLE_NAME} (
-                tool_name TEXT PRIMARY KEY,
-                description TEXT NOT NULL,
-                source_module TEXT
-            )
-        """)
-        self.cursor.execute(f"""
-            CREATE TABLE {AGENT_TOOLS_TABLE_NAME} (
-                agent_name TEXT NOT NULL,
-                tool_name TEXT NOT NULL,
-                PRIMARY KEY (agent_name, tool_name),
-                FOREIGN KEY (tool_name) REFERENCES {TOOL_DESCRIPTIONS_TABLE_NAME}(tool_name)
-            )
-        """)
-        self.conn.commit()
-
-        # Befülle tool_descriptions
-        self.cursor.execute(f"INSERT INTO {TOOL_DESCRIPTIONS_TABLE_NAME} (tool_name, description, source_module) VALUES (?, ?, ?)", (TOOL_1, TOOL_DESC_1, TOOL_MODULE_1))
-        self.cursor.execute(f"INSERT INTO {TOOL_DESCRIPTIONS_TABLE_NAME} (tool_name, description, source_module) VALUES (?, ?, ?)", (TOOL_2, TOOL_DESC_2, TOOL_MODULE_2))
-        self.cursor.execute(f"INSERT INTO {TOOL_DESCRIPTIONS_TABLE_NAME} (tool_name, description, source_module) VALUES (?, ?, ?)", (TOOL_3, TOOL_DESC_3, TOOL_MODULE_3))
-        self.conn.commit()
-
         # Patche _get_db_connection, die von den Funktionen in tool_manager.py verwendet wird
         # um unsere In-Memory-Datenbankverbindung zurückzugeben
         self.mock_db_patcher = patch('tools.tool_manager._get_db_connection')
@@ -135,8 +138,8 @@ class TestToolManager(unittest.TestCase):
         self.assertIn(f"Werkzeug '{TOOL_1}' für Agent '{TEST_AGENT_1}' aktiviert.", result["message"])
 
         # Überprüfe Datenbank
-        self.cursor.execute(f"SELECT tool_name FROM {AGENT_TOOLS_TABLE_NAME} WHERE agent_name = ? AND tool_name = ?", (TEST_AGENT_1, TOOL_1))
-        self.assertIsNotNone(self.cursor.fetchone())
+        self.cursor.execute(f"SELECT COUNT(*) FROM {AGENT_TOOLS_TABLE_NAME} WHERE agent_name = ? AND tool_name = ?", (TEST_AGENT_1, TOOL_1))
+        self.assertEqual(self.cursor.fetchone()[0], 1)
 
     def test_set_enable_already_enabled_tool_info(self):
         self.cursor.execute(f"INSERT INTO {AGENT_TOOLS_TABLE_NAME} (agent_name, tool_name) VALUES (?, ?)", (TEST_AGENT_1, TOOL_1))
@@ -160,8 +163,8 @@ class TestToolManager(unittest.TestCase):
         self.assertIn(f"Werkzeug '{TOOL_1}' für Agent '{TEST_AGENT_1}' deaktiviert.", result["message"])
 
         # Überprüfe Datenbank
-        self.cursor.execute(f"SELECT tool_name FROM {AGENT_TOOLS_TABLE_NAME} WHERE agent_name = ? AND tool_name = ?", (TEST_AGENT_1, TOOL_1))
-        self.assertIsNone(self.cursor.fetchone())
+        self.cursor.execute(f"SELECT COUNT(*) FROM {AGENT_TOOLS_TABLE_NAME} WHERE agent_name = ? AND tool_name = ?", (TEST_AGENT_1, TOOL_1))
+        self.assertEqual(self.cursor.fetchone()[0], 0)
 
     def test_set_disable_not_enabled_tool_info(self):
         result = set_tool_availability_for_agent(TEST_AGENT_1, TOOL_1, False) # TOOL_1 ist nicht aktiviert
@@ -214,6 +217,3 @@ class TestToolManager(unittest.TestCase):
         result = set_tool_availability_for_agent(TEST_AGENT_1, TOOL_1, False)
         self.assertEqual(result["status"], "error")
         self.assertIn("Datenbankfehler", result["message"])
-
-if __name__ == '__main__':
-    unittest.main(argv=['first-arg-is-ignored'], exit=False)
@@ -0,0 +1,62 @@
+"""Test doubles shared by the vector_storage tests.
+
+Every test class that touches the Chroma collection gets it the same way: subclass
+CollectionTestCase (or IdGeneratorTestCase when requirement IDs are generated) and
+configure or inspect self.mock_collection.
+"""
+import unittest
+from unittest.mock import Mock, patch
+
+import tools.vector_storage.requirements as requirements_module
+
+# The collection methods the requirement tools call; any other attribute raises AttributeError
+COLLECTION_METHODS = ['upsert', 'get', 'delete', 'query']
+
+
+def make_collection_mock() -> Mock:
+    """Returns a stand-in for the Chroma collection limited to COLLECTION_METHODS."""
+    return Mock(spec=COLLECTION_METHODS)
+
+
+class CollectionTestCase(unittest.TestCase):
+    """Replaces the requirements module's collection with self.mock_collection.
+
+    The patch is started once per class and the mock is reset before every test,
+    so return values and side effects set by one test don't leak into the next.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        patcher = patch('tools.vector_storage.requirements.collection', new_callable=make_collection_mock)
+        cls._collection = patcher.start()
+        cls.addClassCleanup(patcher.stop)
+
+    def setUp(self):
+        super().setUp()
+        self.mock_collection = self._collection
+        self.mock_collection.reset_mock(return_value=True, side_effect=True)
+
+
+class IdGeneratorTestCase(CollectionTestCase):
+    """CollectionTestCase that also replaces _get_next_id with self.mock_get_next_id.
+
+    The mock is autospecced, so calls must match _get_next_id(prefix). It is reset
+    before every test and returns None until the test configures it.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        patcher = patch('tools.vector_storage.requirements._get_next_id', autospec=True)
+        patcher.start()
+        cls.addClassCleanup(patcher.stop)
+
+    def setUp(self):
+        super().setUp()
+        # Read back from the module: an autospecced function stored on the class would bind to self
+        self.mock_get_next_id = requirements_module._get_next_id
+        # Its reset_mock() takes no arguments and keeps return_value and side_effect
+        self.mock_get_next_id.reset_mock()
+        self.mock_get_next_id.return_value = None
+        self.mock_get_next_id.side_effect = None
@@ -1,16 +1,12 @@
 import unittest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, DEFAULT
+import copy
 import json
-import datetime # Used for creating expected datetime objects/strings
-import sys # Import sys module
-import os  # Import os module
-
-# Fügt das Projektstammverzeichnis zum Python-Pfad hinzu
-project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
+import types
+from datetime import datetime as _dt, timezone as _tz # Used for creating expected datetime objects/strings
 
 # Module to test
+import tools.vector_storage.requirements as requirements_module # Mocks are assigned onto this module directly
 from tools.vector_storage.requirements import (
     add_requirement,
     update_requirement, # Added for new TestUpdateRequirement class
@@ -21,112 +17,104 @@ from tools.vector_storage.requirements import (
     ALLOWED_CLASSIFICATIONS,
     DEFAULT_CLASSIFICATION
 )
+from tests.tools.vector_storage.helpers import CollectionTestCase, IdGeneratorTestCase
 # Mock for create_jira_issue which is in a different module
 # We patch it where it's *used*, which is in tools.vector_storage.requirements
 # from tools.jira_tools import create_jira_issue # Not needed for patching directly here
 
-# Patching at class level: these mocks will be passed as arguments to each test method.
-# The order of decorators is bottom-up, so the arguments to test methods will be:
-# mock_collection, mock_get_next_id, mock_datetime_module
-@patch('tools.vector_storage.requirements.datetime') # Patches the datetime module used in requirements.py
-@patch('tools.vector_storage.requirements._get_next_id')
-@patch('tools.vector_storage.requirements.collection', new_callable=MagicMock) # Use MagicMock for the collection object
-class TestAddRequirement(unittest.TestCase):
-
-    def test_add_requirement_with_only_text(self, mock_collection, mock_get_next_id, mock_datetime_module):
-        # --- Arrange ---
-        fixed_timestamp = datetime.datetime(2023, 1, 1, 12, 0, 0, tzinfo=datetime.timezone.utc)
-        mock_datetime_module.datetime.now.return_value = fixed_timestamp
-        iso_fixed_timestamp = fixed_timestamp.isoformat()
-
-        mock_get_next_id.return_value = "REQ-1"
-        requirement_text = "The system shall allow users to register."
-
-        # --- Act ---
-        result = add_requirement(requirement_text=requirement_text, metadata_json=None)
+UTC = _tz.utc
+FIXED_TS = _dt(2023, 1, 1, 12, 0, 0, tzinfo=UTC) # "now" for add_requirement
+FIXED_UPDATE_NOW = _dt(2023, 1, 15, 12, 0, 0, tzinfo=UTC)
+FIXED_GENERATE_NOW = _dt(2023, 2, 1, 12, 0, 0, tzinfo=UTC)
+ORIG_CHANGE_DATE = _dt(2023, 1, 1, 10, 0, 0, tzinfo=UTC).isoformat() # change_date of pre-existing requirements
+ISO_FIXED_TS = FIXED_TS.isoformat()
+EXPECTED_BASE_METADATA = {
+    'type': 'Requirement',
+    'implementation_status': DEFAULT_IMPLEMENTATION_STATUS,
+    'classification': DEFAULT_CLASSIFICATION,
+    'change_date': ISO_FIXED_TS
+}
+
+
+def _fixture(metadata):
+    """Pairs a metadata dict with its JSON encoding so tests don't re-encode it."""
+    return metadata, json.dumps(metadata)
+
+
+_METADATA_FIXTURES = {
+    'with_status': _fixture({"priority": "High", "source_jira_ticket": "XYZ-123", "implementation_status": "In Progress"}),
+    'special_chars': _fixture({"details": "Test with non-ASCII: éàçüö, and quotes: \"example\""}),
+    'type_override': _fixture({"type": "UserStory", "source": "Planning meeting"}),
+    'source_only': _fixture({"source": "test_source"}),
+    'invalid_classification': _fixture({"classification": "DefinitelyNotAllowedClassification"}),
+    'invalid_status': _fixture({"implementation_status": "DefinitelyNotAllowed"}),
+    'update_classification': _fixture({"type": "Requirement", "classification": "Non-Functional", "source": "original_source", "implementation_status": "Open"}),
+    'update_without_classification': _fixture({"type": "Requirement", "source": "updated_source", "implementation_status": "In Progress"}),
+    'update_invalid_classification': _fixture({"classification": "InvalidClass"}),
+    'update_text_and_classification': _fixture({"type": "Requirement", "classification": "Business", "source_jira_ticket": "NEW-TICKET"}),
+}
+
+# Success-path add_requirement cases: generated ID, input text/metadata JSON, expected deviations from EXPECTED_BASE_METADATA
+_ADD_CASES = [
+    dict(id='REQ-1', text="The system shall allow users to register.", meta=None, overrides={}),
+    # This input provides "implementation_status"
+    dict(id='REQ-2', text="Users must be able to reset their passwords.", meta=_METADATA_FIXTURES['with_status'][1],
+         overrides={"priority": "High", "source_jira_ticket": "XYZ-123", "implementation_status": "In Progress"}),
+    dict(id='REQ-3', text="The system should provide an audit log.", meta='{}', overrides={}),
+    dict(id='REQ-4', text="The system must handle inputs like '你好' & special symbols !@#$%^&*()_+.", meta=_METADATA_FIXTURES['special_chars'][1],
+         overrides={"details": "Test with non-ASCII: éàçüö, and quotes: \"example\""}),
+    # "type" from the input is overridden with 'Requirement'
+    dict(id='REQ-5', text="A requirement with a pre-defined type in input.", meta=_METADATA_FIXTURES['type_override'][1],
+         overrides={"source": "Planning meeting"}),
+]
+
+
+# JSON metadata for the classification and status loops, encoded once at import time
+_CLASSIFICATION_JSONS = {c: json.dumps({"classification": c, "source": "test"}) for c in ALLOWED_CLASSIFICATIONS}
+_STATUS_JSONS = {s: json.dumps({"implementation_status": s}) for s in ALLOWED_IMPLEMENTATION_STATUSES}
+
+
+class TestAddRequirement(IdGeneratorTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Built once and reset per test; copy.copy of a MagicMock would share its child mocks
+        cls._proto_dt = MagicMock() # datetime module used in requirements.py
+        # The module attribute is swapped for the whole class and restored once at the end
+        orig = requirements_module.datetime
+        cls.addClassCleanup(lambda: setattr(requirements_module, 'datetime', orig))
 
-        # --- Assert ---
-        self.assertEqual(result['status'], "success")
-        self.assertEqual(result['requirement_id'], "REQ-1")
-        self.assertIn("Requirement 'REQ-1' added successfully.", result['report'])
-
-        mock_get_next_id.assert_called_once_with("REQ-")
-        expected_metadata = {
-            'type': 'Requirement', 
-            'implementation_status': DEFAULT_IMPLEMENTATION_STATUS,
-            'classification': DEFAULT_CLASSIFICATION,
-            'change_date': iso_fixed_timestamp 
-        }
-        mock_collection.upsert.assert_called_once_with(
-            ids=["REQ-1"],
-            documents=[requirement_text],
-            metadatas=[expected_metadata]
-        )
-
-    def test_add_requirement_with_text_and_valid_metadata(self, mock_collection, mock_get_next_id, mock_datetime_module):
-        # --- Arrange ---
-        fixed_timestamp = datetime.datetime(2023, 1, 1, 12, 0, 0, tzinfo=datetime.timezone.utc)
-        mock_datetime_module.datetime.now.return_value = fixed_timestamp
-        iso_fixed_timestamp = fixed_timestamp.isoformat()
-
-        mock_get_next_id.return_value = "REQ-2"
-        requirement_text = "Users must be able to reset their passwords."
-        # This input provides "implementation_status"
-        metadata_input = {"priority": "High", "source_jira_ticket": "XYZ-123", "implementation_status": "In Progress"}
-        metadata_json_input = json.dumps(metadata_input)
-
-        # --- Act ---
-        result = add_requirement(requirement_text=requirement_text, metadata_json=metadata_json_input)
-
-        # --- Assert ---
-        self.assertEqual(result['status'], "success")
-        self.assertEqual(result['requirement_id'], "REQ-2")
-
-        mock_get_next_id.assert_called_once_with("REQ-")
-        expected_metadata = {
-            "priority": "High",
-            "source_jira_ticket": "XYZ-123",
-            "implementation_status": "In Progress", # Expect provided status
-            'classification': DEFAULT_CLASSIFICATION, # Defaults as not provided in input
-            'type': 'Requirement', 
-            'change_date': iso_fixed_timestamp 
-        }
-        mock_collection.upsert.assert_called_once_with(
-            ids=["REQ-2"],
-            documents=[requirement_text],
-            metadatas=[expected_metadata]
-        )
-
-    def test_add_requirement_with_text_and_empty_json_metadata(self, mock_collection, mock_get_next_id, mock_datetime_module):
-        # --- Arrange ---
-        fixed_timestamp = datetime.datetime(2023, 1, 1, 12, 0, 0, tzinfo=datetime.timezone.utc)
-        mock_datetime_module.datetime.now.return_value = fixed_timestamp
-        iso_fixed_timestamp = fixed_timestamp.isoformat()
-
-        mock_get_next_id.return_value = "REQ-3"
-        requirement_text = "The system should provide an audit log."
-        metadata_json_input = '{}' 
-
-        # --- Act ---
-        result = add_requirement(requirement_text=requirement_text, metadata_json=metadata_json_input)
-
-        # --- Assert ---
-        self.assertEqual(result['status'], "success")
-        self.assertEqual(result['requirement_id'], "REQ-3")
-
-        expected_metadata = {
-            'type': 'Requirement',
-            'implementation_status': DEFAULT_IMPLEMENTATION_STATUS,
-            'classification': DEFAULT_CLASSIFICATION,
-            'change_date': iso_fixed_timestamp
-        }
-        mock_collection.upsert.assert_called_once_with(
-            ids=["REQ-3"],
-            documents=[requirement_text],
-            metadatas=[expected_metadata]
-        )
-
-    def test_add_requirement_with_empty_text(self, mock_collection, mock_get_next_id, mock_datetime_module):
+    def setUp(self):
+        super().setUp()
+        self._proto_dt.reset_mock(return_value=True, side_effect=True)
+        self.mock_datetime_module = requirements_module.datetime = self._proto_dt
+
+    def test_add_requirement_success_cases(self):
+        self.mock_datetime_module.datetime.now.return_value = FIXED_TS
+
+        for case in _ADD_CASES:
+            with self.subTest(case=case['id']):
+                self.mock_collection.reset_mock()
+                self.mock_get_next_id.reset_mock()
+                self.mock_get_next_id.return_value = case['id']
+
+                # --- Act ---
+                result = add_requirement(requirement_text=case['text'], metadata_json=case['meta'])
+
+                # --- Assert ---
+                self.assertEqual(result['status'], "success")
+                self.assertEqual(result['requirement_id'], case['id'])
+                self.assertIn(f"Requirement '{case['id']}' added successfully.", result['report'])
+
+                self.mock_get_next_id.assert_called_once_with("REQ-")
+                self.mock_collection.upsert.assert_called_once_with(
+                    ids=[case['id']],
+                    documents=[case['text']],
+                    metadatas=[{**EXPECTED_BASE_METADATA, **case['overrides']}]
+                )
+
+    def test_add_requirement_with_empty_text(self):
         # --- Arrange ---
         requirement_text = ""
 
@@ -136,12 +124,12 @@ class TestAddRequirement(unittest.TestCase):
         # --- Assert ---
         self.assertEqual(result['status'], "error")
         self.assertEqual(result['error_message'], "Requirement text cannot be empty.")
-        mock_collection.upsert.assert_not_called()
-        mock_get_next_id.assert_not_called() 
+        self.mock_collection.upsert.assert_not_called()
+        self.mock_get_next_id.assert_not_called() 
 
-    def test_add_requirement_with_invalid_json_metadata(self, mock_collection, mock_get_next_id, mock_datetime_module):
+    def test_add_requirement_with_invalid_json_metadata(self):
         # --- Arrange ---
-        mock_get_next_id.return_value = "REQ-ID-WONT-BE-USED"
+        self.mock_get_next_id.return_value = "REQ-ID-WONT-BE-USED"
         requirement_text = "The system must be responsive."
         metadata_json_input = '{"priority": "Medium", "source": unquoted_string}' 
 
@@ -151,98 +139,27 @@ class TestAddRequirement(unittest.TestCase):
         # --- Assert ---
         self.assertEqual(result['status'], "error")
         self.assertEqual(result['error_message'], "Invalid JSON format provided for metadata.")
-        mock_collection.upsert.assert_not_called()
-        mock_get_next_id.assert_called_once_with("REQ-") 
+        self.mock_collection.upsert.assert_not_called()
+        self.mock_get_next_id.assert_called_once_with("REQ-") 
 
-    def test_add_requirement_metadata_must_be_json_object_not_array_or_string(self, mock_collection, mock_get_next_id, mock_datetime_module):
-        # --- Arrange ---
-        mock_get_next_id.return_value = "REQ-ID-WONT-BE-USED"
+    def test_add_requirement_metadata_must_be_json_object_not_array_or_string(self):
         requirement_text = "Valid requirement text."
-        metadata_json_input_array = '[1, 2, 3]'
-        metadata_json_input_string = '"just a string"'
-
-        # --- Act & Assert for array ---
-        result_array = add_requirement(requirement_text=requirement_text, metadata_json=metadata_json_input_array)
-        self.assertEqual(result_array['status'], "error")
-        self.assertEqual(result_array['error_message'], "Metadata must be a JSON object (dictionary).")
-        mock_get_next_id.assert_called_once_with("REQ-") 
-        mock_collection.upsert.assert_not_called()
-
-        mock_get_next_id.reset_mock()
-        mock_get_next_id.return_value = "REQ-ID-WONT-BE-USED-AGAIN"
-
-        # --- Act & Assert for string ---
-        result_string = add_requirement(requirement_text=requirement_text, metadata_json=metadata_json_input_string)
-        self.assertEqual(result_string['status'], "error")
-        self.assertEqual(result_string['error_message'], "Metadata must be a JSON object (dictionary).")
-        mock_get_next_id.assert_called_once_with("REQ-") 
-        mock_collection.upsert.assert_not_called() 
-
-    def test_add_requirement_with_special_characters_in_text_and_metadata(self, mock_collection, mock_get_next_id, mock_datetime_module):
-        # --- Arrange ---
-        fixed_timestamp = datetime.datetime(2023, 1, 1, 12, 0, 0, tzinfo=datetime.timezone.utc)
-        mock_datetime_module.datetime.now.return_value = fixed_timestamp
-        iso_fixed_timestamp = fixed_timestamp.isoformat()
-
-        mock_get_next_id.return_value = "REQ-4"
-        requirement_text = "The system must handle inputs like '你好' & special symbols !@#$%^&*()_+."
-        metadata_input = {"details": "Test with non-ASCII: éàçüö, and quotes: \"example\""}
-        metadata_json_input = json.dumps(metadata_input)
-
-        # --- Act ---
-        result = add_requirement(requirement_text=requirement_text, metadata_json=metadata_json_input)
 
-        # --- Assert ---
-        self.assertEqual(result['status'], "success")
-        self.assertEqual(result['requirement_id'], "REQ-4")
+        for metadata_json_input in ('[1, 2, 3]', '"just a string"'):
+            with self.subTest(metadata_json=metadata_json_input):
+                self.mock_get_next_id.reset_mock()
+                self.mock_get_next_id.return_value = "REQ-ID-WONT-BE-USED"
 
-        expected_metadata = {
-            "details": "Test with non-ASCII: éàçüö, and quotes: \"example\"",
-            'type': 'Requirement',
-            'implementation_status': DEFAULT_IMPLEMENTATION_STATUS,
-            'classification': DEFAULT_CLASSIFICATION,
-            'change_date': iso_fixed_timestamp
-        }
-        mock_collection.upsert.assert_called_once_with(
-            ids=["REQ-4"],
-            documents=[requirement_text],
-            metadatas=[expected_metadata]
-        )
+                result = add_requirement(requirement_text=requirement_text, metadata_json=metadata_json_input)
 
-    def test_add_requirement_metadata_type_field_is_overridden(self, mock_collection, mock_get_next_id, mock_datetime_module):
-        # --- Arrange ---
-        fixed_timestamp = datetime.datetime(2023, 1, 1, 12, 0, 0, tzinfo=datetime.timezone.utc)
-        mock_datetime_module.datetime.now.return_value = fixed_timestamp
-        iso_fixed_timestamp = fixed_timestamp.isoformat()
-
-        mock_get_next_id.return_value = "REQ-5"
-        requirement_text = "A requirement with a pre-defined type in input."
-        metadata_input = {"type": "UserStory", "source": "Planning meeting"}
-        metadata_json_input = json.dumps(metadata_input)
-
-        # --- Act ---
-        result = add_requirement(requirement_text=requirement_text, metadata_json=metadata_json_input)
+                self.assertEqual(result['status'], "error")
+                self.assertEqual(result['error_message'], "Metadata must be a JSON object (dictionary).")
+                self.mock_get_next_id.assert_called_once_with("REQ-")
+                self.mock_collection.upsert.assert_not_called()
 
-        # --- Assert ---
-        self.assertEqual(result['status'], "success")
-        self.assertEqual(result['requirement_id'], "REQ-5")
-
-        expected_metadata = {
-            "type": "Requirement", 
-            "source": "Planning meeting",
-            'implementation_status': DEFAULT_IMPLEMENTATION_STATUS,
-            'classification': DEFAULT_CLASSIFICATION,
-            'change_date': iso_fixed_timestamp
-        }
-        mock_collection.upsert.assert_called_once_with(
-            ids=["REQ-5"],
-            documents=[requirement_text],
-            metadatas=[expected_metadata]
-        )
-
-    def test_add_requirement_id_generation_failure(self, mock_collection, mock_get_next_id, mock_datetime_module):
+    def test_add_requirement_id_generation_failure(self):
         # --- Arrange ---
-        mock_get_next_id.side_effect = Exception("Failed to generate ID")
+        self.mock_get_next_id.side_effect = Exception("Failed to generate ID")
         requirement_text = "Some requirement text."
 
         # --- Act ---
@@ -251,16 +168,13 @@ class TestAddRequirement(unittest.TestCase):
         # --- Assert ---
         self.assertEqual(result['status'], "error")
         self.assertEqual(result['error_message'], "Failed to generate requirement ID: Failed to generate ID")
-        mock_collection.upsert.assert_not_called()
-        mock_get_next_id.assert_called_once_with("REQ-") 
+        self.mock_collection.upsert.assert_not_called()
+        self.mock_get_next_id.assert_called_once_with("REQ-") 
 
-    def test_add_requirement_collection_upsert_failure(self, mock_collection, mock_get_next_id, mock_datetime_module):
+    def test_add_requirement_collection_upsert_failure(self):
         # --- Arrange ---
-        fixed_timestamp = datetime.datetime(2023, 1, 1, 12, 0, 0, tzinfo=datetime.timezone.utc)
-        mock_datetime_module.datetime.now.return_value = fixed_timestamp
-
-        mock_get_next_id.return_value = "REQ-6"
-        mock_collection.upsert.side_effect = Exception("ChromaDB unavailable")
+        self.mock_get_next_id.return_value = "REQ-6"
+        self.mock_collection.upsert.side_effect = Exception("ChromaDB unavailable")
         requirement_text = "Another requirement."
 
         # --- Act ---
@@ -269,164 +183,149 @@ class TestAddRequirement(unittest.TestCase):
         # --- Assert ---
         self.assertEqual(result['status'], "error")
         self.assertEqual(result['error_message'], "Failed to add requirement 'REQ-6': ChromaDB unavailable")
-        mock_get_next_id.assert_called_once_with("REQ-") 
-        mock_collection.upsert.assert_called_once() 
-
-    def test_add_requirement_sets_default_implementation_status(self, mock_collection, mock_get_next_id, mock_datetime_module):
-        fixed_timestamp = datetime.datetime(2023, 1, 1, 12, 0, 0, tzinfo=datetime.timezone.utc)
-        mock_datetime_module.datetime.now.return_value = fixed_timestamp
-        iso_fixed_timestamp = fixed_timestamp.isoformat()
-        mock_get_next_id.return_value = "REQ-DEF"
+        self.mock_get_next_id.assert_called_once_with("REQ-") 
+        self.assertEqual(self.mock_collection.upsert.call_count, 1) 
+
+    def test_add_requirement_sets_default_implementation_status(self):
+        self.mock_datetime_module.datetime.now.return_value = FIXED_TS
+        self.mock_get_next_id.return_value = "REQ-DEF"
         requirement_text = "Requirement without explicit status."
         
         # Case 1: metadata_json is None
         result1 = add_requirement(requirement_text=requirement_text, metadata_json=None)
         self.assertEqual(result1['status'], "success")
-        args1, kwargs1 = mock_collection.upsert.call_args_list[0]
-        self.assertEqual(kwargs1['metadatas'][0]['implementation_status'], DEFAULT_IMPLEMENTATION_STATUS)
+        meta1 = self.mock_collection.upsert.call_args.kwargs['metadatas'][0]
+        self.assertEqual(meta1, EXPECTED_BASE_METADATA)
         
-        mock_collection.reset_mock() # Reset for next call
-        mock_get_next_id.reset_mock()
-        mock_get_next_id.return_value = "REQ-DEF2"
+        self.mock_collection.upsert.reset_mock() # Reset for next call
+        self.mock_get_next_id.reset_mock()
+        self.mock_get_next_id.return_value = "REQ-DEF2"
 
         # Case 2: metadata_json is provided but doesn't contain implementation_status
-        metadata_input = {"source": "test_source"}
-        result2 = add_requirement(requirement_text=requirement_text, metadata_json=json.dumps(metadata_input))
+        _, metadata_json_input = _METADATA_FIXTURES['source_only']
+        result2 = add_requirement(requirement_text=requirement_text, metadata_json=metadata_json_input)
         self.assertEqual(result2['status'], "success")
-        args2, kwargs2 = mock_collection.upsert.call_args_list[0]
-        self.assertEqual(kwargs2['metadatas'][0]['implementation_status'], DEFAULT_IMPLEMENTATION_STATUS)
-        self.assertEqual(kwargs2['metadatas'][0]['classification'], DEFAULT_CLASSIFICATION)
-        self.assertEqual(kwargs2['metadatas'][0]['source'], "test_source")
+        meta2 = self.mock_collection.upsert.call_args.kwargs['metadatas'][0]
+        self.assertEqual(meta2, {**EXPECTED_BASE_METADATA, "source": "test_source"}) # Status and classification default
 
-    def test_add_requirement_with_explicit_valid_classification(self, mock_collection, mock_get_next_id, mock_datetime_module):
+    def test_add_requirement_with_explicit_valid_classification(self):
         # --- Arrange ---
-        fixed_timestamp = datetime.datetime(2023, 1, 1, 12, 0, 0, tzinfo=datetime.timezone.utc)
-        mock_datetime_module.datetime.now.return_value = fixed_timestamp
-        iso_fixed_timestamp = fixed_timestamp.isoformat()
+        self.mock_datetime_module.datetime.now.return_value = FIXED_TS
 
-        mock_get_next_id.return_value = "REQ-CLASS-VALID"
         requirement_text = "A requirement with an explicit classification."
-        
+
         for valid_classification in ALLOWED_CLASSIFICATIONS:
-            mock_collection.reset_mock()
-            mock_get_next_id.reset_mock()
-            current_req_id = f"REQ-CLASS-{valid_classification.replace(' ', '')}"
-            mock_get_next_id.return_value = current_req_id
-
-            metadata_input = {"classification": valid_classification, "source": "test"}
-            metadata_json_input = json.dumps(metadata_input)
-
-            # --- Act ---
-            result = add_requirement(requirement_text=requirement_text, metadata_json=metadata_json_input)
-
-            # --- Assert ---
-            self.assertEqual(result['status'], "success", f"Failed for classification: {valid_classification}")
-            self.assertEqual(result['requirement_id'], current_req_id)
-
-            expected_metadata = {
-                "classification": valid_classification,
-                "source": "test",
-                'type': 'Requirement',
-                'implementation_status': DEFAULT_IMPLEMENTATION_STATUS,
-                'change_date': iso_fixed_timestamp
-            }
-            mock_collection.upsert.assert_called_once_with(
-                ids=[current_req_id],
-                documents=[requirement_text],
-                metadatas=[expected_metadata]
-            )
-
-    def test_add_requirement_with_invalid_classification(self, mock_collection, mock_get_next_id, mock_datetime_module):
+            with self.subTest(classification=valid_classification):
+                current_req_id = f"REQ-CLASS-{valid_classification.replace(' ', '')}"
+                self.mock_collection.reset_mock()
+                self.mock_get_next_id.return_value = current_req_id
+
+                # --- Act ---
+                result = add_requirement(requirement_text, metadata_json=_CLASSIFICATION_JSONS[valid_classification])
+
+                # --- Assert ---
+                self.assertEqual(result['status'], "success")
+                self.assertEqual(result['requirement_id'], current_req_id)
+
+                expected_metadata = {**EXPECTED_BASE_METADATA, "classification": valid_classification, "source": "test"}
+                self.mock_collection.upsert.assert_called_once_with(
+                    ids=[current_req_id],
+                    documents=[requirement_text],
+                    metadatas=[expected_metadata]
+                )
+
+    def test_add_requirement_with_invalid_classification(self):
         # --- Arrange ---
-        mock_get_next_id.return_value = "REQ-CLASS-INVALID" # ID will be generated before validation
+        self.mock_get_next_id.return_value = "REQ-CLASS-INVALID" # ID will be generated before validation
         requirement_text = "A requirement with an invalid classification."
-        invalid_classification = "DefinitelyNotAllowedClassification"
-        metadata_input = {"classification": invalid_classification}
-        metadata_json_input = json.dumps(metadata_input)
+        metadata_input, metadata_json_input = _METADATA_FIXTURES['invalid_classification']
+        invalid_classification = metadata_input["classification"]
 
         # --- Act ---
-        result = add_requirement(requirement_text=requirement_text, metadata_json=metadata_json_input)
+        result = add_requirement(requirement_text, metadata_json=metadata_json_input)
 
         # --- Assert ---
         self.assertEqual(result['status'], "error")
         self.assertIn(f"Invalid classification '{invalid_classification}'. Must be one of {ALLOWED_CLASSIFICATIONS}", result['error_message'])
-        mock_collection.upsert.assert_not_called()
-        mock_get_next_id.assert_called_once_with("REQ-") # Ensure ID generation was attempted
-
-    def test_add_requirement_with_valid_implementation_status(self, mock_collection, mock_get_next_id, mock_datetime_module):
-        fixed_timestamp = datetime.datetime(2023, 1, 1, 12, 0, 0, tzinfo=datetime.timezone.utc)
-        mock_datetime_module.datetime.now.return_value = fixed_timestamp
-        iso_fixed_timestamp = fixed_timestamp.isoformat()
-        mock_get_next_id.return_value = "REQ-VALID-STATUS" # Initial value, will be reset
+        self.mock_collection.upsert.assert_not_called()
+        self.mock_get_next_id.assert_called_once_with("REQ-") # Ensure ID generation was attempted
+
+    def test_add_requirement_with_valid_implementation_status(self):
+        self.mock_datetime_module.datetime.now.return_value = FIXED_TS
         requirement_text = "Requirement with valid status."
-        
+
         for valid_status in ALLOWED_IMPLEMENTATION_STATUSES:
-            mock_collection.reset_mock() # Reset for each iteration
-            mock_get_next_id.reset_mock() # Reset for each iteration
-            # Ensure a unique ID for each iteration to avoid issues if tests run in parallel or state leaks
-            current_req_id = f"REQ-{valid_status.replace(' ', '')}"
-            mock_get_next_id.return_value = current_req_id
-            
-            metadata_input = {"implementation_status": valid_status}
-            result = add_requirement(requirement_text=requirement_text, metadata_json=json.dumps(metadata_input))
-            
-            self.assertEqual(result['status'], "success", f"Failed for status: {valid_status}")
-            args, kwargs = mock_collection.upsert.call_args
-            self.assertEqual(kwargs['metadatas'][0]['implementation_status'], valid_status)
-            self.assertEqual(kwargs['metadatas'][0]['classification'], DEFAULT_CLASSIFICATION) # Should still default
-            self.assertEqual(kwargs['metadatas'][0]['type'], 'Requirement')
-            self.assertEqual(kwargs['metadatas'][0]['change_date'], iso_fixed_timestamp)
-
-    def test_add_requirement_with_invalid_implementation_status(self, mock_collection, mock_get_next_id, mock_datetime_module):
-        mock_get_next_id.return_value = "REQ-INVALID-STATUS" # ID will be generated before validation
+            with self.subTest(status=valid_status):
+                current_req_id = f"REQ-{valid_status.replace(' ', '')}"
+                self.mock_collection.reset_mock()
+                self.mock_get_next_id.return_value = current_req_id
+
+                result = add_requirement(requirement_text, metadata_json=_STATUS_JSONS[valid_status])
+
+                self.assertEqual(result['status'], "success")
+                meta = self.mock_collection.upsert.call_args.kwargs['metadatas'][0]
+                self.assertEqual(meta, {**EXPECTED_BASE_METADATA, 'implementation_status': valid_status}) # Classification still defaults
+
+    def test_add_requirement_with_invalid_implementation_status(self):
+        self.mock_get_next_id.return_value = "REQ-INVALID-STATUS" # ID will be generated before validation
         requirement_text = "Requirement with invalid status."
-        invalid_status = "DefinitelyNotAllowed"
-        metadata_input = {"implementation_status": invalid_status}
-        
-        result = add_requirement(requirement_text=requirement_text, metadata_json=json.dumps(metadata_input))
+        metadata_input, metadata_json_input = _METADATA_FIXTURES['invalid_status']
+        invalid_status = metadata_input["implementation_status"]
+
+        result = add_requirement(requirement_text, metadata_json=metadata_json_input)
         
         self.assertEqual(result['status'], "error")
         self.assertEqual(
             result['error_message'],
             f"Invalid implementation_status '{invalid_status}'. Must be one of {ALLOWED_IMPLEMENTATION_STATUSES}."
         )
-        mock_collection.upsert.assert_not_called()
-        mock_get_next_id.assert_called_once_with("REQ-") # Ensure ID generation was attempted
+        self.mock_collection.upsert.assert_not_called()
+        self.mock_get_next_id.assert_called_once_with("REQ-") # Ensure ID generation was attempted
 
 
 # Test class for update_requirement function
-@patch('tools.vector_storage.requirements.datetime')
-@patch('tools.vector_storage.requirements.collection', new_callable=MagicMock)
-class TestUpdateRequirement(unittest.TestCase):
+class TestUpdateRequirement(CollectionTestCase):
+
+    REQ_ID = "REQ-UPDATE-1"
+    ORIGINAL_TEXT = "Original requirement text."
+    # Read-only so a test can't mutate the shared fixture; pass dict(ORIGINAL_METADATA) where a mutable copy is needed
+    ORIGINAL_METADATA = types.MappingProxyType({
+        "type": "Requirement",
+        "source": "original_source",
+        "implementation_status": "Open",
+        "classification": "Functional", # Assume it was set during add
+        "change_date": ORIG_CHANGE_DATE
+    })
+    # Template only; setUp gives every test its own deep copy because updates mutate the fetched metadata
+    ORIGINAL_GET_RETURN = {'ids': [REQ_ID], 'documents': [ORIGINAL_TEXT], 'metadatas': [dict(ORIGINAL_METADATA)]}
+    FIXED_NOW = FIXED_UPDATE_NOW
+    ISO_FIXED_NOW = FIXED_UPDATE_NOW.isoformat()
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Built once and reset per test; copy.copy of a MagicMock would share its child mocks
+        cls._proto_dt = MagicMock()
+        # The module attribute is swapped for the whole class and restored once at the end
+        orig = requirements_module.datetime
+        cls.addClassCleanup(lambda: setattr(requirements_module, 'datetime', orig))
 
     def setUp(self):
-        self.req_id = "REQ-UPDATE-1"
-        self.original_text = "Original requirement text."
-        self.original_metadata = {
-            "type": "Requirement",
-            "source": "original_source",
-            "implementation_status": "Open",
-            "classification": "Functional", # Assume it was set during add
-            "change_date": datetime.datetime(2023, 1, 1, 10, 0, 0, tzinfo=datetime.timezone.utc).isoformat()
-        }
-        self.fixed_now = datetime.datetime(2023, 1, 15, 12, 0, 0, tzinfo=datetime.timezone.utc)
-        self.iso_fixed_now = self.fixed_now.isoformat()
+        super().setUp()
+        self._proto_dt.reset_mock(return_value=True, side_effect=True)
+        self.mock_datetime_module = requirements_module.datetime = self._proto_dt
+        self.original_get_return = copy.deepcopy(self.ORIGINAL_GET_RETURN)
 
-    def test_update_requirement_classification_only(self, mock_collection, mock_datetime_module):
+    def test_update_requirement_classification_only(self):
         # --- Arrange ---
-        mock_datetime_module.datetime.now.return_value = self.fixed_now
-        mock_collection.get.return_value = {
-            'ids': [self.req_id],
-            'documents': [self.original_text],
-            'metadatas': [self.original_metadata]
-        }
-        new_classification = "Non-Functional"
-        new_metadata_input = {"type": "Requirement", "classification": new_classification, "source": "original_source", "implementation_status": "Open"} # provide other existing fields
-        new_metadata_json = json.dumps(new_metadata_input)
+        self.mock_datetime_module.datetime.now.return_value = self.FIXED_NOW
+        self.mock_collection.get.return_value = self.original_get_return
+        new_metadata_input, new_metadata_json = _METADATA_FIXTURES['update_classification'] # provides other existing fields
+        new_classification = new_metadata_input["classification"]
 
         # --- Act ---
         result = update_requirement(
-            requirement_id=self.req_id,
+            requirement_id=self.REQ_ID,
             new_metadata_json=new_metadata_json
         )
 
@@ -434,38 +333,31 @@ class TestUpdateRequirement(unittest.TestCase):
         self.assertEqual(result['status'], "success")
         self.assertIn("Requirement 'REQ-UPDATE-1' updated successfully (metadata).", result['report'])
         
-        expected_metadata = self.original_metadata.copy()
-        expected_metadata.update({
+        expected_metadata = self.ORIGINAL_METADATA | {
             "classification": new_classification,
-            "change_date": self.iso_fixed_now,
-            "type": "Requirement" # Ensure type is preserved or set
-        })
-        # Adjust expected if other fields were part of new_metadata_input
-        expected_metadata["source"] = new_metadata_input["source"]
-        expected_metadata["implementation_status"] = new_metadata_input["implementation_status"]
-
+            "change_date": self.ISO_FIXED_NOW,
+            "type": "Requirement", # Ensure type is preserved or set
+            # Other fields that were part of new_metadata_input
+            "source": new_metadata_input["source"],
+            "implementation_status": new_metadata_input["implementation_status"]
+        }
 
-        mock_collection.upsert.assert_called_once_with(
-            ids=[self.req_id],
-            documents=[self.original_text], # Text not changed
+        self.mock_collection.upsert.assert_called_once_with(
+            ids=[self.REQ_ID],
+            documents=[self.ORIGINAL_TEXT], # Text not changed
             metadatas=[expected_metadata]
         )
 
-    def test_update_requirement_sets_default_classification_if_missing_in_new_metadata(self, mock_collection, mock_datetime_module):
+    def test_update_requirement_sets_default_classification_if_missing_in_new_metadata(self):
         # --- Arrange ---
-        mock_datetime_module.datetime.now.return_value = self.fixed_now
-        mock_collection.get.return_value = {
-            'ids': [self.req_id],
-            'documents': [self.original_text],
-            'metadatas': [self.original_metadata] # Original had "Functional"
-        }
+        self.mock_datetime_module.datetime.now.return_value = self.FIXED_NOW
+        self.mock_collection.get.return_value = self.original_get_return # Original had "Functional"
         # New metadata intentionally omits 'classification'
-        new_metadata_input = {"type": "Requirement", "source": "updated_source", "implementation_status": "In Progress"}
-        new_metadata_json = json.dumps(new_metadata_input)
+        new_metadata_input, new_metadata_json = _METADATA_FIXTURES['update_without_classification']
 
         # --- Act ---
         result = update_requirement(
-            requirement_id=self.req_id,
+            requirement_id=self.REQ_ID,
             new_metadata_json=new_metadata_json
         )
 
@@ -477,54 +369,43 @@ class TestUpdateRequirement(unittest.TestCase):
             "implementation_status": "In Progress",
             "classification": DEFAULT_CLASSIFICATION, # Should default
             "type": "Requirement",
-            "change_date": self.iso_fixed_now
+            "change_date": self.ISO_FIXED_NOW
         }
-        mock_collection.upsert.assert_called_once_with(
-            ids=[self.req_id],
-            documents=[self.original_text],
+        self.mock_collection.upsert.assert_called_once_with(
+            ids=[self.REQ_ID],
+            documents=[self.ORIGINAL_TEXT],
             metadatas=[expected_metadata]
         )
 
-    def test_update_requirement_with_invalid_classification(self, mock_collection, mock_datetime_module):
+    def test_update_requirement_with_invalid_classification(self):
         # --- Arrange ---
-        mock_datetime_module.datetime.now.return_value = self.fixed_now # Not strictly needed as it should fail before date
-        mock_collection.get.return_value = { # Needed for the initial get
-            'ids': [self.req_id],
-            'documents': [self.original_text],
-            'metadatas': [self.original_metadata]
-        }
-        invalid_classification = "InvalidClass"
-        new_metadata_input = {"classification": invalid_classification}
-        new_metadata_json = json.dumps(new_metadata_input)
+        self.mock_collection.get.return_value = self.original_get_return # Needed for the initial get
+        new_metadata_input, new_metadata_json = _METADATA_FIXTURES['update_invalid_classification']
+        invalid_classification = new_metadata_input["classification"]
 
         # --- Act ---
         result = update_requirement(
-            requirement_id=self.req_id,
+            requirement_id=self.REQ_ID,
             new_metadata_json=new_metadata_json
         )
 
         # --- Assert ---
         self.assertEqual(result['status'], "error")
         self.assertIn(f"Invalid classification '{invalid_classification}'. Must be one of {ALLOWED_CLASSIFICATIONS}", result['error_message'])
-        mock_collection.upsert.assert_not_called()
+        self.mock_collection.upsert.assert_not_called()
 
-    def test_update_requirement_text_and_classification(self, mock_collection, mock_datetime_module):
+    def test_update_requirement_text_and_classification(self):
         # --- Arrange ---
-        mock_datetime_module.datetime.now.return_value = self.fixed_now
-        mock_collection.get.return_value = {
-            'ids': [self.req_id],
-            'documents': [self.original_text],
-            'metadatas': [self.original_metadata]
-        }
+        self.mock_datetime_module.datetime.now.return_value = self.FIXED_NOW
+        self.mock_collection.get.return_value = self.original_get_return
         new_text = "Updated requirement text for classification test."
-        new_classification = "Business"
         # Provide minimal metadata, other fields should be handled by the function (type, default classification if not this one)
-        new_metadata_input = {"type": "Requirement", "classification": new_classification, "source_jira_ticket": "NEW-TICKET"}
-        new_metadata_json = json.dumps(new_metadata_input)
+        new_metadata_input, new_metadata_json = _METADATA_FIXTURES['update_text_and_classification']
+        new_classification = new_metadata_input["classification"]
 
         # --- Act ---
         result = update_requirement(
-            requirement_id=self.req_id,
+            requirement_id=self.REQ_ID,
             new_requirement_text=new_text,
             new_metadata_json=new_metadata_json
         )
@@ -537,29 +418,25 @@ class TestUpdateRequirement(unittest.TestCase):
             "classification": new_classification,
             "source_jira_ticket": "NEW-TICKET", # from new metadata
             "type": "Requirement", # Defaulted by update_requirement logic
-            "change_date": self.iso_fixed_now
+            "change_date": self.ISO_FIXED_NOW
             # implementation_status would be missing if not in new_metadata_input
         }
-        mock_collection.upsert.assert_called_once_with(
-            ids=[self.req_id],
+        self.mock_collection.upsert.assert_called_once_with(
+            ids=[self.REQ_ID],
             documents=[new_text],
             metadatas=[expected_metadata]
         )
 
-    def test_update_requirement_classification_persists_if_metadata_not_updated(self, mock_collection, mock_datetime_module):
+    def test_update_requirement_classification_persists_if_metadata_not_updated(self):
         # --- Arrange ---
-        mock_datetime_module.datetime.now.return_value = self.fixed_now
+        self.mock_datetime_module.datetime.now.return_value = self.FIXED_NOW
         # Original metadata has 'classification': 'Functional'
-        mock_collection.get.return_value = {
-            'ids': [self.req_id],
-            'documents': [self.original_text],
-            'metadatas': [self.original_metadata.copy()] 
-        }
+        self.mock_collection.get.return_value = self.original_get_return
         new_text = "Only updating the text."
 
         # --- Act ---
         result = update_requirement(
-            requirement_id=self.req_id,
+            requirement_id=self.REQ_ID,
             new_requirement_text=new_text,
             new_metadata_json=None # Metadata not being updated explicitly
         )
@@ -568,24 +445,34 @@ class TestUpdateRequirement(unittest.TestCase):
         self.assertEqual(result['status'], "success")
         self.assertIn("updated successfully (text)", result['report'])
         
-        expected_metadata = self.original_metadata.copy()
-        expected_metadata['change_date'] = self.iso_fixed_now # Change date always updates
+        expected_metadata = {**self.ORIGINAL_METADATA, 'change_date': self.ISO_FIXED_NOW} # Change date always updates
 
-        mock_collection.upsert.assert_called_once_with(
-            ids=[self.req_id],
+        self.mock_collection.upsert.assert_called_once_with(
+            ids=[self.REQ_ID],
             documents=[new_text],
             metadatas=[expected_metadata] # Should contain original classification
         )
-        self.assertEqual(mock_collection.upsert.call_args[1]['metadatas'][0]['classification'], "Functional")
+        self.assertEqual(self.mock_collection.upsert.call_args.kwargs['metadatas'][0]['classification'], "Functional")
+
 
+class TestGenerateJiraIssuesForRequirement(CollectionTestCase):
 
-@patch('tools.vector_storage.requirements.datetime')
-@patch('tools.vector_storage.requirements.create_jira_issue') # Patched where it's imported and used
-@patch('tools.vector_storage.requirements.retrieve_similar_requirements') # Patched where it's imported and used
-@patch('tools.vector_storage.requirements.collection', new_callable=MagicMock)
-class TestGenerateJiraIssuesForRequirement(unittest.TestCase):
+    FIXED_NOW = FIXED_GENERATE_NOW
+    ISO_FIXED_NOW = FIXED_GENERATE_NOW.isoformat()
 
     def setUp(self):
+        super().setUp()
+        # One patcher for all three names; create_jira_issue and retrieve_similar_requirements are patched where they're used
+        patcher = patch.multiple(
+            'tools.vector_storage.requirements',
+            datetime=DEFAULT, create_jira_issue=DEFAULT, retrieve_similar_requirements=DEFAULT
+        )
+        mocks = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.mock_datetime_module = mocks['datetime']
+        self.mock_create_jira = mocks['create_jira_issue']
+        self.mock_retrieve_similar = mocks['retrieve_similar_requirements']
+
         self.requirement_id = "REQ-GEN-1"
         self.project_key = "PIB"
         # self.issue_type_name = "Story" # No longer a parameter, but good to keep for expected value
@@ -598,21 +485,19 @@ class TestGenerateJiraIssuesForRequirement(unittest.TestCase):
             "source": "test_source",
             "implementation_status": "Open",
             "classification": "Functional",
-            "change_date": datetime.datetime(2023, 1, 1, 10, 0, 0, tzinfo=datetime.timezone.utc).isoformat()
+            "change_date": ORIG_CHANGE_DATE
         }
-        self.fixed_now = datetime.datetime(2023, 2, 1, 12, 0, 0, tzinfo=datetime.timezone.utc)
-        self.iso_fixed_now = self.fixed_now.isoformat()
 
-    def test_generate_issues_success_multiline(self, mock_collection, mock_retrieve_similar, mock_create_jira, mock_datetime_module):
+    def test_generate_issues_success_multiline(self):
         # --- Arrange ---
-        mock_datetime_module.datetime.now.return_value = self.fixed_now
-        mock_collection.get.return_value = {
+        self.mock_datetime_module.datetime.now.return_value = self.FIXED_NOW
+        self.mock_collection.get.return_value = {
             'ids': [self.requirement_id],
             'documents': [self.original_text_multiline],
             'metadatas': [self.original_metadata.copy()]
         }
-        mock_retrieve_similar.return_value = {"status": "success", "report": "Found 1 similar req."}
-        mock_create_jira.side_effect = [
+        self.mock_retrieve_similar.return_value = {"status": "success", "report": "Found 1 similar req."}
+        self.mock_create_jira.side_effect = [
             {"status": "success", "issue_key": "PIB-101", "report": "Issue PIB-101 created."},
             {"status": "success", "issue_key": "PIB-102", "report": "Issue PIB-102 created."}
         ]
@@ -630,12 +515,12 @@ class TestGenerateJiraIssuesForRequirement(unittest.TestCase):
         self.assertListEqual(result['created_issue_keys'], ["PIB-101", "PIB-102"])
         self.assertEqual(len(result['errors']), 0)
 
-        mock_collection.get.assert_called_once_with(ids=[self.requirement_id], include=['documents', 'metadatas'])
-        mock_retrieve_similar.assert_called_once()
-        self.assertEqual(mock_create_jira.call_count, 2)
+        self.mock_collection.get.assert_called_once_with(ids=[self.requirement_id], include=['documents', 'metadatas'])
+        self.mock_retrieve_similar.assert_called_once()
+        self.assertEqual(self.mock_create_jira.call_count, 2)
         
         # Check calls to create_jira_issue
-        first_call_args = mock_create_jira.call_args_list[0][1]
+        first_call_args = self.mock_create_jira.call_args_list[0][1]
         self.assertEqual(first_call_args['project_key'], self.project_key)
         self.assertIn("Line 1 of requirement.", first_call_args['summary'])
         self.assertIn("Line 1 of requirement.", first_call_args['description'])
@@ -644,27 +529,27 @@ class TestGenerateJiraIssuesForRequirement(unittest.TestCase):
         self.assertEqual(first_call_args['issue_type_name'], self.expected_issue_type_name)
         self.assertEqual(first_call_args['components'], self.components)
 
-        second_call_args = mock_create_jira.call_args_list[1][1]
+        second_call_args = self.mock_create_jira.call_args_list[1][1]
         self.assertIn("Line 2 of requirement.", second_call_args['summary'])
 
         # Check metadata update
-        mock_collection.upsert.assert_called_once()
-        upsert_args, upsert_kwargs = mock_collection.upsert.call_args
+        self.mock_collection.upsert.assert_called_once()
+        upsert_kwargs = self.mock_collection.upsert.call_args.kwargs
         self.assertEqual(upsert_kwargs['ids'], [self.requirement_id])
         updated_meta = upsert_kwargs['metadatas'][0]
-        self.assertEqual(updated_meta['change_date'], self.iso_fixed_now)
+        self.assertEqual(updated_meta['change_date'], self.ISO_FIXED_NOW)
         self.assertListEqual(updated_meta['generated_jira_issues'], ["PIB-101", "PIB-102"])
 
-    def test_generate_issues_success_single_line(self, mock_collection, mock_retrieve_similar, mock_create_jira, mock_datetime_module):
+    def test_generate_issues_success_single_line(self):
         # --- Arrange ---
-        mock_datetime_module.datetime.now.return_value = self.fixed_now
-        mock_collection.get.return_value = {
+        self.mock_datetime_module.datetime.now.return_value = self.FIXED_NOW
+        self.mock_collection.get.return_value = {
             'ids': [self.requirement_id],
             'documents': [self.original_text_singleline],
             'metadatas': [self.original_metadata.copy()]
         }
-        mock_retrieve_similar.return_value = {"status": "success", "report": "No similar reqs."}
-        mock_create_jira.return_value = {"status": "success", "issue_key": "PIB-103", "report": "Issue PIB-103 created."}
+        self.mock_retrieve_similar.return_value = {"status": "success", "report": "No similar reqs."}
+        self.mock_create_jira.return_value = {"status": "success", "issue_key": "PIB-103", "report": "Issue PIB-103 created."}
 
         # --- Act ---
         result = generate_jira_issues_for_requirement(
@@ -676,16 +561,16 @@ class TestGenerateJiraIssuesForRequirement(unittest.TestCase):
         self.assertEqual(result['status'], "success")
         self.assertEqual(len(result['created_issue_keys']), 1)
         self.assertEqual(result['created_issue_keys'][0], "PIB-103")
-        mock_create_jira.assert_called_once()
-        call_args = mock_create_jira.call_args_list[0][1]
+        self.mock_create_jira.assert_called_once()
+        call_args = self.mock_create_jira.call_args.kwargs
         self.assertIn(self.original_text_singleline, call_args['summary'])
         
-        updated_meta = mock_collection.upsert.call_args[1]['metadatas'][0]
+        updated_meta = self.mock_collection.upsert.call_args.kwargs['metadatas'][0]
         self.assertListEqual(updated_meta['generated_jira_issues'], ["PIB-103"])
 
-    def test_requirement_not_found(self, mock_collection, mock_retrieve_similar, mock_create_jira, mock_datetime_module):
+    def test_requirement_not_found(self):
         # --- Arrange ---
-        mock_collection.get.return_value = {'ids': [], 'documents': [], 'metadatas': []}
+        self.mock_collection.get.return_value = {'ids': [], 'documents': [], 'metadatas': []}
 
         # --- Act ---
         result = generate_jira_issues_for_requirement(
@@ -696,15 +581,14 @@ class TestGenerateJiraIssuesForRequirement(unittest.TestCase):
         # --- Assert ---
         self.assertEqual(result['status'], "error")
         self.assertIn("Requirement 'REQ-NOTFOUND' not found", result['error_message'])
-        mock_retrieve_similar.assert_not_called()
-        mock_create_jira.assert_not_called()
-        mock_collection.upsert.assert_not_called()
+        self.mock_retrieve_similar.assert_not_called()
+        self.mock_create_jira.assert_not_called()
+        self.mock_collection.upsert.assert_not_called()
 
-    def test_item_not_a_requirement_type(self, mock_collection, mock_retrieve_similar, mock_create_jira, mock_datetime_module):
+    def test_item_not_a_requirement_type(self):
         # --- Arrange ---
-        wrong_type_metadata = self.original_metadata.copy()
-        wrong_type_metadata['type'] = "UserStory"
-        mock_collection.get.return_value = {
+        wrong_type_metadata = self.original_metadata | {'type': "UserStory"}
+        self.mock_collection.get.return_value = {
             'ids': [self.requirement_id],
             'documents': [self.original_text_singleline],
             'metadatas': [wrong_type_metadata]
@@ -719,20 +603,20 @@ class TestGenerateJiraIssuesForRequirement(unittest.TestCase):
         # --- Assert ---
         self.assertEqual(result['status'], "error")
         self.assertIn(f"Item '{self.requirement_id}' is not of type 'Requirement'", result['error_message'])
-        mock_retrieve_similar.assert_not_called()
-        mock_create_jira.assert_not_called()
+        self.mock_retrieve_similar.assert_not_called()
+        self.mock_create_jira.assert_not_called()
 
-    def test_retrieve_similar_fails_still_creates_issues(self, mock_collection, mock_retrieve_similar, mock_create_jira, mock_datetime_module):
+    def test_retrieve_similar_fails_still_creates_issues(self):
         # --- Arrange ---
-        mock_datetime_module.datetime.now.return_value = self.fixed_now
-        mock_collection.get.return_value = {
+        self.mock_datetime_module.datetime.now.return_value = self.FIXED_NOW
+        self.mock_collection.get.return_value = {
             'ids': [self.requirement_id],
             'documents': [self.original_text_singleline],
             'metadatas': [self.original_metadata.copy()]
         }
-        mock_retrieve_similar.side_effect = Exception("Vector DB connection error")
-        # mock_retrieve_similar.return_value = {"status": "error", "error_message": "Vector DB connection error"} # Alternative
-        mock_create_jira.return_value = {"status": "success", "issue_key": "PIB-104", "report": "Issue PIB-104 created."}
+        self.mock_retrieve_similar.side_effect = Exception("Vector DB connection error")
+        # self.mock_retrieve_similar.return_value = {"status": "error", "error_message": "Vector DB connection error"} # Alternative
+        self.mock_create_jira.return_value = {"status": "success", "issue_key": "PIB-104", "report": "Issue PIB-104 created."}
 
         # --- Act ---
         result = generate_jira_issues_for_requirement(
@@ -744,23 +628,23 @@ class TestGenerateJiraIssuesForRequirement(unittest.TestCase):
         self.assertEqual(result['status'], "success") # Still success as Jira issue created
         self.assertEqual(result['created_issue_keys'][0], "PIB-104")
         
-        mock_retrieve_similar.assert_called_once()
-        mock_create_jira.assert_called_once()
+        self.mock_retrieve_similar.assert_called_once()
+        self.mock_create_jira.assert_called_once()
         
         # Check that the description contains the error message for similar reqs
-        create_jira_call_args = mock_create_jira.call_args_list[0][1]
+        create_jira_call_args = self.mock_create_jira.call_args.kwargs
         self.assertIn("Error retrieving similar requirements: Vector DB connection error", create_jira_call_args['description'])
 
-    def test_create_jira_issue_fails_for_one_task(self, mock_collection, mock_retrieve_similar, mock_create_jira, mock_datetime_module):
+    def test_create_jira_issue_fails_for_one_task(self):
         # --- Arrange ---
-        mock_datetime_module.datetime.now.return_value = self.fixed_now
-        mock_collection.get.return_value = {
+        self.mock_datetime_module.datetime.now.return_value = self.FIXED_NOW
+        self.mock_collection.get.return_value = {
             'ids': [self.requirement_id],
             'documents': [self.original_text_multiline], # 2 lines = 2 tasks
             'metadatas': [self.original_metadata.copy()]
         }
-        mock_retrieve_similar.return_value = {"status": "success", "report": "Context."}
-        mock_create_jira.side_effect = [
+        self.mock_retrieve_similar.return_value = {"status": "success", "report": "Context."}
+        self.mock_create_jira.side_effect = [
             {"status": "success", "issue_key": "PIB-105", "report": "Issue PIB-105 created."},
             {"status": "error", "error_message": "Jira API limit reached for second task."}
         ]
@@ -778,18 +662,18 @@ class TestGenerateJiraIssuesForRequirement(unittest.TestCase):
         self.assertEqual(len(result['errors']), 1)
         self.assertIn("Jira API limit reached for second task.", result['errors'][0])
         
-        updated_meta = mock_collection.upsert.call_args[1]['metadatas'][0]
+        updated_meta = self.mock_collection.upsert.call_args.kwargs['metadatas'][0]
         self.assertListEqual(updated_meta['generated_jira_issues'], ["PIB-105"]) # Only successful one
 
-    def test_create_jira_issue_fails_for_all_tasks(self, mock_collection, mock_retrieve_similar, mock_create_jira, mock_datetime_module):
+    def test_create_jira_issue_fails_for_all_tasks(self):
         # --- Arrange ---
-        mock_collection.get.return_value = {
+        self.mock_collection.get.return_value = {
             'ids': [self.requirement_id],
             'documents': [self.original_text_singleline],
             'metadatas': [self.original_metadata.copy()]
         }
-        mock_retrieve_similar.return_value = {"status": "success", "report": "Context."}
-        mock_create_jira.return_value = {"status": "error", "error_message": "Jira unavailable."}
+        self.mock_retrieve_similar.return_value = {"status": "success", "report": "Context."}
+        self.mock_create_jira.return_value = {"status": "error", "error_message": "Jira unavailable."}
 
         # --- Act ---
         result = generate_jira_issues_for_requirement(
@@ -802,19 +686,19 @@ class TestGenerateJiraIssuesForRequirement(unittest.TestCase):
         self.assertEqual(len(result['created_issue_keys']), 0)
         self.assertEqual(len(result['errors']), 1)
         self.assertIn("Jira unavailable.", result['errors'][0])
-        mock_collection.upsert.assert_not_called() # No issues created, so no metadata update call
+        self.mock_collection.upsert.assert_not_called() # No issues created, so no metadata update call
 
-    def test_update_metadata_fails(self, mock_collection, mock_retrieve_similar, mock_create_jira, mock_datetime_module):
+    def test_update_metadata_fails(self):
         # --- Arrange ---
-        mock_datetime_module.datetime.now.return_value = self.fixed_now
-        mock_collection.get.return_value = {
+        self.mock_datetime_module.datetime.now.return_value = self.FIXED_NOW
+        self.mock_collection.get.return_value = {
             'ids': [self.requirement_id],
             'documents': [self.original_text_singleline],
             'metadatas': [self.original_metadata.copy()]
         }
-        mock_retrieve_similar.return_value = {"status": "success", "report": "Context."}
-        mock_create_jira.return_value = {"status": "success", "issue_key": "PIB-106", "report": "Issue created."}
-        mock_collection.upsert.side_effect = Exception("DB write error during metadata update.")
+        self.mock_retrieve_similar.return_value = {"status": "success", "report": "Context."}
+        self.mock_create_jira.return_value = {"status": "success", "issue_key": "PIB-106", "report": "Issue created."}
+        self.mock_collection.upsert.side_effect = Exception("DB write error during metadata update.")
 
         # --- Act ---
         result = generate_jira_issues_for_requirement(
@@ -829,7 +713,7 @@ class TestGenerateJiraIssuesForRequirement(unittest.TestCase):
         self.assertIn("Failed to update requirement", result['errors'][0])
         self.assertIn("DB write error during metadata update.", result['errors'][0])
 
-    def test_missing_parameters_for_function_call(self, mock_collection, mock_retrieve_similar, mock_create_jira, mock_datetime_module):
+    def test_missing_parameters_for_function_call(self):
         # --- Act & Assert for missing project_key ---
         result_no_proj = generate_jira_issues_for_requirement(
             requirement_id=self.requirement_id,
@@ -839,17 +723,17 @@ class TestGenerateJiraIssuesForRequirement(unittest.TestCase):
         self.assertIn("project key", result_no_proj['error_message'].lower())
         self.assertIn("requirement id", result_no_proj['error_message'].lower()) # Updated error message check
         
-        mock_collection.get.assert_not_called() # Should fail before DB access
+        self.mock_collection.get.assert_not_called() # Should fail before DB access
 
-    def test_no_actionable_tasks_from_empty_req_text(self, mock_collection, mock_retrieve_similar, mock_create_jira, mock_datetime_module):
+    def test_no_actionable_tasks_from_empty_req_text(self):
         # --- Arrange ---
-        mock_datetime_module.datetime.now.return_value = self.fixed_now
-        mock_collection.get.return_value = {
+        self.mock_datetime_module.datetime.now.return_value = self.FIXED_NOW
+        self.mock_collection.get.return_value = {
             'ids': [self.requirement_id],
             'documents': ["   \n   \n "], # Requirement text that results in no actionable lines
             'metadatas': [self.original_metadata.copy()]
         }
-        mock_retrieve_similar.return_value = {"status": "success", "report": "Context."}
+        self.mock_retrieve_similar.return_value = {"status": "success", "report": "Context."}
         # Note: The function currently uses the full text if splitting results in empty.
         # This test will check the case where the original text itself is effectively empty for splitting.
         # If the original_requirement_text was truly empty, collection.get would likely error or return no document.
@@ -865,7 +749,7 @@ class TestGenerateJiraIssuesForRequirement(unittest.TestCase):
         # This can happen if actionable_tasks_text becomes empty AND original_requirement_text is also empty.
         # This is hard to achieve with current logic unless collection.get returns an empty document string.
 
-        mock_collection.get.return_value = { # Simulate empty document
+        self.mock_collection.get.return_value = { # Simulate empty document
             'ids': [self.requirement_id],
             'documents': [""], 
             'metadatas': [self.original_metadata.copy()]
@@ -881,7 +765,7 @@ class TestGenerateJiraIssuesForRequirement(unittest.TestCase):
         # With current logic, an empty original_requirement_text will lead to one task with empty text.
         # create_jira_issue might then fail or create an issue with empty summary/desc.
         # Let's assume create_jira_issue handles empty summary by erroring out or by Jira.
-        mock_create_jira.return_value = {"status": "error", "error_message": "Summary cannot be empty"}
+        self.mock_create_jira.return_value = {"status": "error", "error_message": "Summary cannot be empty"}
         
         result_after_create_attempt = generate_jira_issues_for_requirement(
             requirement_id=self.requirement_id,
@@ -901,19 +785,18 @@ class TestGenerateJiraIssuesForRequirement(unittest.TestCase):
         # This part of the code might need refinement or the test needs to be very specific.
         # For now, the above covers the empty document scenario leading to a create_jira_issue attempt.
 
-    def test_generated_jira_issues_metadata_appended(self, mock_collection, mock_retrieve_similar, mock_create_jira, mock_datetime_module):
+    def test_generated_jira_issues_metadata_appended(self):
         # --- Arrange ---
-        mock_datetime_module.datetime.now.return_value = self.fixed_now
-        existing_meta_with_issues = self.original_metadata.copy()
-        existing_meta_with_issues['generated_jira_issues'] = ["PIB-OLD-1", "PIB-OLD-2"]
+        self.mock_datetime_module.datetime.now.return_value = self.FIXED_NOW
+        existing_meta_with_issues = self.original_metadata | {'generated_jira_issues': ["PIB-OLD-1", "PIB-OLD-2"]}
         
-        mock_collection.get.return_value = {
+        self.mock_collection.get.return_value = {
             'ids': [self.requirement_id],
             'documents': [self.original_text_singleline],
             'metadatas': [existing_meta_with_issues]
         }
-        mock_retrieve_similar.return_value = {"status": "success", "report": "Context."}
-        mock_create_jira.return_value = {"status": "success", "issue_key": "PIB-NEW-1", "report": "Issue created."}
+        self.mock_retrieve_similar.return_value = {"status": "success", "report": "Context."}
+        self.mock_create_jira.return_value = {"status": "success", "issue_key": "PIB-NEW-1", "report": "Issue created."}
 
         # --- Act ---
         result = generate_jira_issues_for_requirement(
@@ -923,17 +806,16 @@ class TestGenerateJiraIssuesForRequirement(unittest.TestCase):
         
         # --- Assert ---
         self.assertEqual(result['status'], "success")
-        updated_meta = mock_collection.upsert.call_args[1]['metadatas'][0]
+        updated_meta = self.mock_collection.upsert.call_args.kwargs['metadatas'][0]
         self.assertIn("PIB-OLD-1", updated_meta['generated_jira_issues'])
         self.assertIn("PIB-OLD-2", updated_meta['generated_jira_issues'])
         self.assertIn("PIB-NEW-1", updated_meta['generated_jira_issues'])
         self.assertEqual(len(updated_meta['generated_jira_issues']), 3) # No duplicates
 
         # Test that a duplicate new key is not added again
-        mock_create_jira.return_value = {"status": "success", "issue_key": "PIB-OLD-1", "report": "Issue created."} # Simulate creating an existing key
-        existing_meta_with_issues_for_dup_test = self.original_metadata.copy()
-        existing_meta_with_issues_for_dup_test['generated_jira_issues'] = ["PIB-OLD-1"]
-        mock_collection.get.return_value = {
+        self.mock_create_jira.return_value = {"status": "success", "issue_key": "PIB-OLD-1", "report": "Issue created."} # Simulate creating an existing key
+        existing_meta_with_issues_for_dup_test = self.original_metadata | {'generated_jira_issues': ["PIB-OLD-1"]}
+        self.mock_collection.get.return_value = {
             'ids': [self.requirement_id],
             'documents': [self.original_text_singleline],
             'metadatas': [existing_meta_with_issues_for_dup_test]
@@ -942,9 +824,5 @@ class TestGenerateJiraIssuesForRequirement(unittest.TestCase):
             requirement_id=self.requirement_id,
             project_key=self.project_key
         )
-        updated_meta_dup = mock_collection.upsert.call_args_list[-1][1]['metadatas'][0] # Get the latest call
+        updated_meta_dup = self.mock_collection.upsert.call_args_list[-1][1]['metadatas'][0] # Get the latest call
         self.assertListEqual(updated_meta_dup['generated_jira_issues'], ["PIB-OLD-1"])
-
-
-if __name__ == '__main__':
-    unittest.main(argv=['first-arg-is-ignored'], exit=False)
@@ -1,32 +1,32 @@
 import unittest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 import json
-import datetime
-import sys
-import os
-
-# Fügt das Projektstammverzeichnis zum Python-Pfad hinzu
-project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
+from datetime import datetime as _dt, timezone as _tz # Used for creating expected datetime objects/strings
 
 from tools.vector_storage.requirements import update_requirement, ALLOWED_IMPLEMENTATION_STATUSES, DEFAULT_IMPLEMENTATION_STATUS, ALLOWED_CLASSIFICATIONS, DEFAULT_CLASSIFICATION
+from tests.tools.vector_storage.helpers import CollectionTestCase
+
+# New metadata JSON per allowed status, encoded once at import instead of in the status loop
+_STATUS_METADATA_JSON = {
+    s: json.dumps({"implementation_status": s, "type": "Requirement"}) for s in ALLOWED_IMPLEMENTATION_STATUSES
+}
 
 @patch('tools.vector_storage.requirements.datetime')
-@patch('tools.vector_storage.requirements._get_next_id') # Not used by update_requirement
-@patch('tools.vector_storage.requirements.collection', new_callable=MagicMock)
-class TestUpdateRequirement(unittest.TestCase):
+class TestUpdateRequirement(CollectionTestCase):
+
+    # What update_requirement fills in when new metadata omits it; tests add change_date and their own fields
+    _BASE_EXPECTED = {'type': 'Requirement', 'classification': DEFAULT_CLASSIFICATION}
 
-    def test_update_requirement_text_only(self, mock_collection, mock_get_next_id, mock_datetime_module):
+    def test_update_requirement_text_only(self, mock_datetime_module):
         req_id = "REQ-10"
         original_doc = "Original text"
         original_meta = {"type": "Requirement", "source": "test", "implementation_status": "Open", "classification": "Functional"}
         new_text = "Updated requirement text"
-        fixed_timestamp = datetime.datetime(2023, 2, 1, 10, 0, 0, tzinfo=datetime.timezone.utc)
+        fixed_timestamp = _dt(2023, 2, 1, 10, 0, 0, tzinfo=_tz.utc)
         mock_datetime_module.datetime.now.return_value = fixed_timestamp
         iso_fixed_timestamp = fixed_timestamp.isoformat()
 
-        mock_collection.get.return_value = {'ids': [req_id], 'documents': [original_doc], 'metadatas': [original_meta]}
+        self.mock_collection.get.return_value = {'ids': [req_id], 'documents': [original_doc], 'metadatas': [original_meta]}
         
         result = update_requirement(requirement_id=req_id, new_requirement_text=new_text)
         
@@ -34,13 +34,13 @@ class TestUpdateRequirement(unittest.TestCase):
         self.assertIn("updated successfully (text)", result['report'])
         expected_meta_updated = original_meta.copy() # implementation_status should be preserved
         expected_meta_updated['change_date'] = iso_fixed_timestamp
-        mock_collection.upsert.assert_called_once_with(
+        self.mock_collection.upsert.assert_called_once_with(
             ids=[req_id],
             documents=[new_text],
             metadatas=[expected_meta_updated]
         )
 
-    def test_update_requirement_metadata_only(self, mock_collection, mock_get_next_id, mock_datetime_module):
+    def test_update_requirement_metadata_only(self, mock_datetime_module):
         req_id = "REQ-11"
         original_doc = "Some document text"
         original_meta = {"type": "Requirement", "source": "old_source", "implementation_status": "Open", "classification": "Functional"}
@@ -48,26 +48,24 @@ class TestUpdateRequirement(unittest.TestCase):
         new_meta_dict = {"type": "Requirement", "source": "new_source", "priority": "High", "implementation_status": "In Progress"} # No classification, should default
         new_meta_json = json.dumps(new_meta_dict)
         
-        fixed_timestamp = datetime.datetime(2023, 2, 2, 11, 0, 0, tzinfo=datetime.timezone.utc)
+        fixed_timestamp = _dt(2023, 2, 2, 11, 0, 0, tzinfo=_tz.utc)
         mock_datetime_module.datetime.now.return_value = fixed_timestamp
         iso_fixed_timestamp = fixed_timestamp.isoformat()
 
-        mock_collection.get.return_value = {'ids': [req_id], 'documents': [original_doc], 'metadatas': [original_meta]}
+        self.mock_collection.get.return_value = {'ids': [req_id], 'documents': [original_doc], 'metadatas': [original_meta]}
 
         result = update_requirement(requirement_id=req_id, new_metadata_json=new_meta_json)
 
         self.assertEqual(result['status'], "success")
         self.assertIn("updated successfully (metadata)", result['report'])
-        expected_meta_updated = new_meta_dict.copy()
-        expected_meta_updated['classification'] = DEFAULT_CLASSIFICATION # Should default
-        expected_meta_updated['change_date'] = iso_fixed_timestamp
-        mock_collection.upsert.assert_called_once_with(
+        expected_meta_updated = {**self._BASE_EXPECTED, **new_meta_dict, 'change_date': iso_fixed_timestamp} # Classification should default
+        self.mock_collection.upsert.assert_called_once_with(
             ids=[req_id],
             documents=[original_doc], 
             metadatas=[expected_meta_updated]
         )
 
-    def test_update_requirement_text_and_metadata(self, mock_collection, mock_get_next_id, mock_datetime_module):
+    def test_update_requirement_text_and_metadata(self, mock_datetime_module):
         req_id = "REQ-12"
         original_doc_text = "old text" 
         original_meta = {"type": "Requirement", "implementation_status": "Open", "classification": "Functional"} 
@@ -75,75 +73,73 @@ class TestUpdateRequirement(unittest.TestCase):
         new_meta_dict = {"type": "Requirement", "status": "approved", "implementation_status": "Done"} # No classification, should default
         new_meta_json = json.dumps(new_meta_dict)
         
-        fixed_timestamp = datetime.datetime(2023, 2, 3, 12, 0, 0, tzinfo=datetime.timezone.utc)
+        fixed_timestamp = _dt(2023, 2, 3, 12, 0, 0, tzinfo=_tz.utc)
         mock_datetime_module.datetime.now.return_value = fixed_timestamp
         iso_fixed_timestamp = fixed_timestamp.isoformat()
 
-        mock_collection.get.return_value = {'ids': [req_id], 'documents': [original_doc_text], 'metadatas': [original_meta]}
+        self.mock_collection.get.return_value = {'ids': [req_id], 'documents': [original_doc_text], 'metadatas': [original_meta]}
 
         result = update_requirement(requirement_id=req_id, new_requirement_text=new_text, new_metadata_json=new_meta_json)
 
         self.assertEqual(result['status'], "success")
         self.assertIn("updated successfully (text, metadata)", result['report'])
-        expected_meta_updated = new_meta_dict.copy()
-        expected_meta_updated['classification'] = DEFAULT_CLASSIFICATION # Should default
-        expected_meta_updated['change_date'] = iso_fixed_timestamp
-        mock_collection.upsert.assert_called_once_with(
+        expected_meta_updated = {**self._BASE_EXPECTED, **new_meta_dict, 'change_date': iso_fixed_timestamp} # Classification should default
+        self.mock_collection.upsert.assert_called_once_with(
             ids=[req_id],
             documents=[new_text],
             metadatas=[expected_meta_updated]
         )
 
-    def test_update_requirement_id_not_found(self, mock_collection, mock_get_next_id, mock_datetime_module):
-        mock_collection.get.return_value = {'ids': [], 'documents': [], 'metadatas': []} 
+    def test_update_requirement_id_not_found(self, mock_datetime_module):
+        self.mock_collection.get.return_value = {'ids': [], 'documents': [], 'metadatas': []} 
         result = update_requirement(requirement_id="REQ-NONEXIST", new_requirement_text="text")
         self.assertEqual(result['status'], "error")
         self.assertEqual(result['error_message'], "Requirement 'REQ-NONEXIST' not found.")
 
-    def test_update_requirement_item_not_a_requirement_type(self, mock_collection, mock_get_next_id, mock_datetime_module):
+    def test_update_requirement_item_not_a_requirement_type(self, mock_datetime_module):
         req_id = "ITEM-1"
-        mock_collection.get.return_value = {'ids': [req_id], 'documents': ["doc"], 'metadatas': [{"type": "TestCase"}]}
+        self.mock_collection.get.return_value = {'ids': [req_id], 'documents': ["doc"], 'metadatas': [{"type": "TestCase"}]}
         result = update_requirement(requirement_id=req_id, new_requirement_text="text")
         self.assertEqual(result['status'], "error")
         self.assertEqual(result['error_message'], f"Item '{req_id}' found, but it is not a Requirement (type: TestCase). Update aborted.")
 
-    def test_update_requirement_empty_id(self, mock_collection, mock_get_next_id, mock_datetime_module):
+    def test_update_requirement_empty_id(self, mock_datetime_module):
         result = update_requirement(requirement_id="", new_requirement_text="text")
         self.assertEqual(result['status'], "error")
         self.assertEqual(result['error_message'], "Requirement ID cannot be empty.")
 
-    def test_update_requirement_no_changes_provided(self, mock_collection, mock_get_next_id, mock_datetime_module):
+    def test_update_requirement_no_changes_provided(self, mock_datetime_module):
         result = update_requirement(requirement_id="REQ-1", new_requirement_text=None, new_metadata_json=None)
         self.assertEqual(result['status'], "error")
         self.assertEqual(result['error_message'], "Must provide either new text or new metadata to update.")
 
-    def test_update_requirement_empty_new_text(self, mock_collection, mock_get_next_id, mock_datetime_module):
-        mock_collection.get.return_value = {'ids': ["REQ-1"], 'documents': ["old"], 'metadatas': [{"type": "Requirement", "implementation_status": "Open", "classification": "Functional"}]}
+    def test_update_requirement_empty_new_text(self, mock_datetime_module):
+        self.mock_collection.get.return_value = {'ids': ["REQ-1"], 'documents': ["old"], 'metadatas': [{"type": "Requirement", "implementation_status": "Open", "classification": "Functional"}]}
         result = update_requirement(requirement_id="REQ-1", new_requirement_text="   ")
         self.assertEqual(result['status'], "error")
         self.assertEqual(result['error_message'], "New requirement text cannot be empty.")
 
-    def test_update_requirement_invalid_new_metadata_json(self, mock_collection, mock_get_next_id, mock_datetime_module):
-        mock_collection.get.return_value = {'ids': ["REQ-1"], 'documents': ["old"], 'metadatas': [{"type": "Requirement", "implementation_status": "Open", "classification": "Functional"}]}
+    def test_update_requirement_invalid_new_metadata_json(self, mock_datetime_module):
+        self.mock_collection.get.return_value = {'ids': ["REQ-1"], 'documents': ["old"], 'metadatas': [{"type": "Requirement", "implementation_status": "Open", "classification": "Functional"}]}
         result = update_requirement(requirement_id="REQ-1", new_metadata_json="not json")
         self.assertEqual(result['status'], "error")
         self.assertEqual(result['error_message'], "Invalid JSON format provided for new metadata.")
 
-    def test_update_requirement_new_metadata_json_not_dict(self, mock_collection, mock_get_next_id, mock_datetime_module):
-        mock_collection.get.return_value = {'ids': ["REQ-1"], 'documents': ["old"], 'metadatas': [{"type": "Requirement", "implementation_status": "Open", "classification": "Functional"}]}
+    def test_update_requirement_new_metadata_json_not_dict(self, mock_datetime_module):
+        self.mock_collection.get.return_value = {'ids': ["REQ-1"], 'documents': ["old"], 'metadatas': [{"type": "Requirement", "implementation_status": "Open", "classification": "Functional"}]}
         result = update_requirement(requirement_id="REQ-1", new_metadata_json='["list"]')
         self.assertEqual(result['status'], "error")
         self.assertEqual(result['error_message'], "New metadata must be a JSON object (dictionary).")
 
     @patch('builtins.print')
-    def test_update_requirement_metadata_new_type_is_set_if_missing(self, mock_print, mock_collection, mock_get_next_id, mock_datetime_module):
+    def test_update_requirement_metadata_new_type_is_set_if_missing(self, mock_print, mock_datetime_module):
         req_id = "REQ-13"
         doc_content = "doc" 
         original_meta = {"type": "Requirement", "implementation_status": "Open", "classification": "Functional"} 
-        fixed_timestamp = datetime.datetime(2023, 1, 1, 12, 0, 0, tzinfo=datetime.timezone.utc)
+        fixed_timestamp = _dt(2023, 1, 1, 12, 0, 0, tzinfo=_tz.utc)
         mock_datetime_module.datetime.now.return_value = fixed_timestamp
         iso_fixed_timestamp = fixed_timestamp.isoformat()
-        mock_collection.get.return_value = {'ids': [req_id], 'documents': [doc_content], 'metadatas': [original_meta]}
+        self.mock_collection.get.return_value = {'ids': [req_id], 'documents': [doc_content], 'metadatas': [original_meta]}
         
         # new_metadata_json is empty, so 'type' will be missing, and 'implementation_status' will be missing
         # The function should default 'type' to 'Requirement'.
@@ -155,18 +151,18 @@ class TestUpdateRequirement(unittest.TestCase):
         self.assertEqual(result['status'], "success") 
         mock_print.assert_called_once_with(f"Warning: Updating metadata for '{req_id}' without a 'type' field. Setting to 'Requirement'.")
         # Expected metadata will have 'type' defaulted, and 'classification' defaulted.
-        expected_meta = {'type': 'Requirement', 'classification': DEFAULT_CLASSIFICATION, 'change_date': iso_fixed_timestamp}
-        mock_collection.upsert.assert_called_once_with(ids=[req_id], documents=[doc_content], metadatas=[expected_meta])
+        expected_meta = {**self._BASE_EXPECTED, 'change_date': iso_fixed_timestamp}
+        self.mock_collection.upsert.assert_called_once_with(ids=[req_id], documents=[doc_content], metadatas=[expected_meta])
 
     @patch('builtins.print')
-    def test_update_requirement_metadata_new_type_is_different(self, mock_print, mock_collection, mock_get_next_id, mock_datetime_module):
+    def test_update_requirement_metadata_new_type_is_different(self, mock_print, mock_datetime_module):
         req_id = "REQ-14"
         doc_content = "doc" 
         original_meta = {"type": "Requirement", "implementation_status": "Open", "classification": "Functional"} 
-        fixed_timestamp = datetime.datetime(2023, 1, 1, 12, 0, 0, tzinfo=datetime.timezone.utc)
+        fixed_timestamp = _dt(2023, 1, 1, 12, 0, 0, tzinfo=_tz.utc)
         mock_datetime_module.datetime.now.return_value = fixed_timestamp
         iso_fixed_timestamp = fixed_timestamp.isoformat()
-        mock_collection.get.return_value = {'ids': [req_id], 'documents': [doc_content], 'metadatas': [original_meta]}
+        self.mock_collection.get.return_value = {'ids': [req_id], 'documents': [doc_content], 'metadatas': [original_meta]}
         
         # new_metadata_json has a different 'type', and no 'implementation_status'.
         # 'classification' will default to 'Functional'.
@@ -176,55 +172,54 @@ class TestUpdateRequirement(unittest.TestCase):
 
         self.assertEqual(result['status'], "success") 
         mock_print.assert_called_once_with(f"Warning: Updating metadata for '{req_id}' with a type other than 'Requirement' ('OtherType').")
-        expected_meta = {'type': 'OtherType', 'classification': DEFAULT_CLASSIFICATION, 'change_date': iso_fixed_timestamp}
-        mock_collection.upsert.assert_called_once_with(ids=[req_id], documents=[doc_content], metadatas=[expected_meta])
+        expected_meta = {**self._BASE_EXPECTED, 'type': 'OtherType', 'change_date': iso_fixed_timestamp}
+        self.mock_collection.upsert.assert_called_once_with(ids=[req_id], documents=[doc_content], metadatas=[expected_meta])
 
-    def test_update_requirement_collection_get_exception(self, mock_collection, mock_get_next_id, mock_datetime_module):
-        mock_collection.get.side_effect = Exception("DB GET error")
+    def test_update_requirement_collection_get_exception(self, mock_datetime_module):
+        self.mock_collection.get.side_effect = Exception("DB GET error")
         result = update_requirement(requirement_id="REQ-1", new_requirement_text="text")
         self.assertEqual(result['status'], "error")
         self.assertIn("Error retrieving requirement 'REQ-1': DB GET error", result['error_message'])
 
-    def test_update_requirement_collection_upsert_exception(self, mock_collection, mock_get_next_id, mock_datetime_module):
-        mock_collection.get.return_value = {'ids': ["REQ-1"], 'documents': ["old"], 'metadatas': [{"type": "Requirement", "implementation_status": "Open", "classification": "Functional"}]}
-        mock_collection.upsert.side_effect = Exception("DB UPSERT error")
+    def test_update_requirement_collection_upsert_exception(self, mock_datetime_module):
+        self.mock_collection.get.return_value = {'ids': ["REQ-1"], 'documents': ["old"], 'metadatas': [{"type": "Requirement", "implementation_status": "Open", "classification": "Functional"}]}
+        self.mock_collection.upsert.side_effect = Exception("DB UPSERT error")
         result = update_requirement(requirement_id="REQ-1", new_requirement_text="text")
         self.assertEqual(result['status'], "error")
         self.assertIn("Failed to upsert requirement 'REQ-1': DB UPSERT error", result['error_message'])
 
-    def test_update_requirement_to_valid_implementation_status(self, mock_collection, mock_get_next_id, mock_datetime_module):
+    def test_update_requirement_to_valid_implementation_status(self, mock_datetime_module):
         req_id = "REQ-STATUS-VALID"
         original_doc = "Doc for status update"
         original_meta = {"type": "Requirement", "implementation_status": "Open", "classification": "Functional"}
-        fixed_timestamp = datetime.datetime(2023, 1, 1, 12, 0, 0, tzinfo=datetime.timezone.utc)
+        fixed_timestamp = _dt(2023, 1, 1, 12, 0, 0, tzinfo=_tz.utc)
         mock_datetime_module.datetime.now.return_value = fixed_timestamp
         iso_fixed_timestamp = fixed_timestamp.isoformat()
         
-        mock_collection.get.return_value = {'ids': [req_id], 'documents': [original_doc], 'metadatas': [original_meta]}
+        self.mock_collection.get.return_value = {'ids': [req_id], 'documents': [original_doc], 'metadatas': [original_meta]}
 
         for valid_status in ALLOWED_IMPLEMENTATION_STATUSES:
-            mock_collection.upsert.reset_mock() # Reset for each iteration
-            
-            new_metadata_dict = {"implementation_status": valid_status, "type": "Requirement"} # classification will default
-            result = update_requirement(requirement_id=req_id, new_metadata_json=json.dumps(new_metadata_dict))
-            
-            self.assertEqual(result['status'], "success", f"Failed for status: {valid_status}")
-            expected_meta = new_metadata_dict.copy()
-            expected_meta['classification'] = DEFAULT_CLASSIFICATION # Should default
-            expected_meta['change_date'] = iso_fixed_timestamp
-            mock_collection.upsert.assert_called_once_with(
-                ids=[req_id],
-                documents=[original_doc],
-                metadatas=[expected_meta]
-            )
-
-    def test_update_requirement_to_invalid_implementation_status(self, mock_collection, mock_get_next_id, mock_datetime_module):
+            with self.subTest(status=valid_status): # Each status is reported on its own
+                self.mock_collection.upsert.reset_mock() # Reset for each iteration
+
+                # classification will default
+                result = update_requirement(requirement_id=req_id, new_metadata_json=_STATUS_METADATA_JSON[valid_status])
+
+                self.assertEqual(result['status'], "success")
+                expected_meta = {**self._BASE_EXPECTED, 'implementation_status': valid_status, 'change_date': iso_fixed_timestamp} # Classification should default
+                self.mock_collection.upsert.assert_called_once_with(
+                    ids=[req_id],
+                    documents=[original_doc],
+                    metadatas=[expected_meta]
+                )
+
+    def test_update_requirement_to_invalid_implementation_status(self, mock_datetime_module):
         req_id = "REQ-STATUS-INVALID"
         original_doc = "Doc for invalid status update"
         original_meta = {"type": "Requirement", "implementation_status": "Open", "classification": "Functional"}
         invalid_status = "DefinitelyNotAllowed"
         
-        mock_collection.get.return_value = {'ids': [req_id], 'documents': [original_doc], 'metadatas': [original_meta]}
+        self.mock_collection.get.return_value = {'ids': [req_id], 'documents': [original_doc], 'metadatas': [original_meta]}
         
         new_metadata_dict = {"implementation_status": invalid_status, "type": "Requirement"} # type is needed for validation to pass before status check
         result = update_requirement(requirement_id=req_id, new_metadata_json=json.dumps(new_metadata_dict))
@@ -234,17 +229,17 @@ class TestUpdateRequirement(unittest.TestCase):
             result['error_message'],
             f"Invalid implementation_status '{invalid_status}'. Must be one of {ALLOWED_IMPLEMENTATION_STATUSES}."
         )
-        mock_collection.upsert.assert_not_called()
+        self.mock_collection.upsert.assert_not_called()
 
-    def test_update_requirement_metadata_removes_status_if_not_in_new_json(self, mock_collection, mock_get_next_id, mock_datetime_module):
+    def test_update_requirement_metadata_removes_status_if_not_in_new_json(self, mock_datetime_module):
         req_id = "REQ-REMOVE-STATUS"
         original_doc = "Doc for status removal"
         original_meta = {"type": "Requirement", "implementation_status": "Open", "source": "A", "classification": "Functional"}
-        fixed_timestamp = datetime.datetime(2023, 1, 1, 12, 0, 0, tzinfo=datetime.timezone.utc)
+        fixed_timestamp = _dt(2023, 1, 1, 12, 0, 0, tzinfo=_tz.utc)
         mock_datetime_module.datetime.now.return_value = fixed_timestamp
         iso_fixed_timestamp = fixed_timestamp.isoformat()
         
-        mock_collection.get.return_value = {'ids': [req_id], 'documents': [original_doc], 'metadatas': [original_meta]}
+        self.mock_collection.get.return_value = {'ids': [req_id], 'documents': [original_doc], 'metadatas': [original_meta]}
 
         # New metadata only contains 'source' and 'type'. 'implementation_status' should be gone.
         # 'classification' will default.
@@ -252,7 +247,7 @@ class TestUpdateRequirement(unittest.TestCase):
         result = update_requirement(requirement_id=req_id, new_metadata_json=json.dumps(new_metadata_dict))
         
         self.assertEqual(result['status'], "success")
-        args, kwargs = mock_collection.upsert.call_args
+        args, kwargs = self.mock_collection.upsert.call_args
         updated_metadata = kwargs['metadatas'][0]
         
         self.assertNotIn("implementation_status", updated_metadata)
@@ -260,7 +255,3 @@ class TestUpdateRequirement(unittest.TestCase):
         self.assertEqual(updated_metadata["type"], "Requirement")
         self.assertEqual(updated_metadata["classification"], DEFAULT_CLASSIFICATION) # Should default
         self.assertEqual(updated_metadata["change_date"], iso_fixed_timestamp)
-
-
-if __name__ == '__main__':
-    unittest.main(argv=['first-arg-is-ignored'], exit=False)
@@ -1,10 +1,30 @@
 import os
 import requests
+from requests.adapters import HTTPAdapter
+import functools
+import inspect
+import copy
 import json
-from typing import Optional, List
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Optional, List
 from datetime import datetime
 import pytz # For timezone handling
 import webbrowser # Import the webbrowser module
+try:
+    import orjson # Optional: faster parsing of large issue payloads
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+try:
+    import ijson # Optional: incremental parsing of large issue link lists
+except ImportError:
+    ijson = None
+
+# Errors raised for malformed response bodies by the available parsers
+_JSON_ERRORS = (ValueError, ijson.JSONError) if ijson is not None else (ValueError,)
 # Note: 're' import removed previously
 
 # --- Constants ---
@@ -14,6 +34,153 @@ CUSTOM_FIELD_CATEGORY_ID = "customfield_10035" # ID for the Category custom fiel
 # ALLOWED_COMPONENTS = ["cerebra", "pib-backend", "pib-blockly"]
 # ALLOWED_COMPONENTS = ["SB3-Backend", "ML-Backend", "Frontend", "DevOps", "Backend"]
 ALLOWED_COMPONENTS = []
+# Field list requested by get_jira_issue_details, built once at import
+_DETAIL_FIELDS = "summary,status,assignee,description," + CUSTOM_FIELD_CATEGORY_ID
+# Query parameters of get_jira_issue_details' issue request and of its follow-up render request,
+# which is only sent for ADF descriptions when HTML was asked for
+_DETAIL_PARAMS = {"fields": _DETAIL_FIELDS}
+_DETAIL_RENDER_PARAMS = {"fields": "description", "expand": "renderedFields.description"}
+
+# --- HTTP Session ---
+# Shared session so repeated reads reuse pooled keep-alive connections
+# instead of paying a TCP/TLS handshake per call.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=32))
+_SESSION.headers.update({"Accept": "application/json"})
+_BULK_MAX_WORKERS = 16 # Concurrent requests used by get_jira_issues_bulk
+_SEARCH_PAGE_SIZE = 100 # Largest page search_jira_issues_jql asks Jira for
+_SEARCH_MAX_WORKERS = 5 # Concurrent page requests used by search_jira_issues_jql
+_SEARCH_HTTP_ERROR_CODES = {400: "BAD_REQUEST", 401: "UNAUTHORIZED"} # Others map to HTTP_ERROR
+
+# --- Atlassian Configuration ---
+_BASE_URL = None # Instance URL without trailing slash
+_AUTH = None # (email, API key) for basic auth
+_CONFIG = None # (URL, email, API key) as last read from the environment
+
+
+def _load_config() -> bool:
+    """Reads the Atlassian instance configuration from the environment.
+
+    Every tool calls this first, so a configuration loaded after import (the
+    agents call load_dotenv() after importing this module) or changed later is
+    picked up. When it changes, the read cache is cleared, since its entries
+    belong to the previous instance or account.
+
+    Returns:
+        bool: True if the URL, email and API key are all set.
+    """
+    global _BASE_URL, _AUTH, _CONFIG
+    config = (os.getenv("ATLASSIAN_INSTANCE_URL"), os.getenv("ATLASSIAN_EMAIL"), os.getenv("ATLASSIAN_API_KEY"))
+    if config != _CONFIG:
+        url, email, key = config
+        _BASE_URL = url.rstrip('/') if url else None
+        _AUTH = (email, key) if email and key else None
+        _CONFIG = config
+        clear_cache()
+    return bool(_BASE_URL and _AUTH)
+
+
+# --- Read Cache ---
+# Successful issue reads are kept for a short time, so repeated lookups of the
+# same issue within one agent session skip the API round trip. The write tools
+# drop the entries of the issue they change, and once _CACHE_MAXSIZE entries
+# are stored the least recently used one is evicted.
+#
+# The same store keeps the ETag of the last successful fetch per lookup, so a
+# fetch after the TTL has run out can be a conditional GET that Jira answers
+# with an empty 304 if nothing changed.
+_CACHE_TTL = 60 # Seconds a cached result stays valid
+_CACHE_MAXSIZE = 256 # Entries kept before the least recently used one is evicted
+_CACHE = OrderedDict() # (lookup name, issue id, *args) -> (timestamp, result, ETag or None), oldest first
+_CACHE_LOCK = threading.Lock() # Tools may be called from several threads at once
+
+
+def _cache_get(key: tuple) -> Optional[tuple]:
+    """Returns the entry stored under key and marks it as most recently used, or None."""
+    with _CACHE_LOCK:
+        entry = _CACHE.get(key)
+        if entry is not None:
+            _CACHE.move_to_end(key)
+        return entry
+
+
+def _cache_put(key: tuple, entry: tuple) -> None:
+    """Stores entry under key, evicting the least recently used entries beyond _CACHE_MAXSIZE."""
+    with _CACHE_LOCK:
+        _CACHE[key] = entry
+        _CACHE.move_to_end(key)
+        while len(_CACHE) > _CACHE_MAXSIZE:
+            _CACHE.popitem(last=False)
+
+
+def _cache_pop(key: tuple) -> None:
+    """Removes the entry stored under key, if any."""
+    with _CACHE_LOCK:
+        _CACHE.pop(key, None)
+
+
+def _invalidate_issue(issue_id: str) -> None:
+    """Drops every cached read of issue_id.
+
+    The tools that change an issue call this as soon as their request returns,
+    whether or not it succeeded, since a failed write may still have been applied.
+    """
+    with _CACHE_LOCK:
+        for key in [key for key in _CACHE if key[1] == issue_id]:
+            del _CACHE[key]
+
+
+def _ttl_cache(func):
+    """Caches successful results of an issue read for _CACHE_TTL seconds.
+
+    The key is the function name plus its bound arguments (defaults applied), so
+    get_jira_issue_details("PROJ-1") and get_jira_issue_details("PROJ-1", False)
+    share an entry. The issue ID must be the first parameter. Error results are
+    never cached and evict any stale entry. Callers get their own copy of a
+    result, so modifying it doesn't change the cached one.
+    """
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        key = (func.__name__, *bound.arguments.values())
+        _load_config() # Drops entries cached under a previous configuration
+        entry = _cache_get(key)
+        if entry is not None and time.monotonic() - entry[0] < _CACHE_TTL:
+            return copy.deepcopy(entry[1])
+        result = func(*args, **kwargs)
+        if result.get("status") == "success":
+            _cache_put(key, (time.monotonic(), copy.deepcopy(result), None))
+        else:
+            _cache_pop(key)
+        return result
+
+    return wrapper
+
+
+def _stored_etag(key: tuple) -> Optional[tuple]:
+    """Returns the (ETag, result) remembered under key, or None if there is none.
+
+    Send If-None-Match only when this returns an entry: the stored result is
+    what a 304 answer stands for.
+    """
+    entry = _cache_get(key)
+    return (entry[2], entry[1]) if entry is not None else None
+
+
+def _remember_etag(key: tuple, etag: Optional[str], result: dict) -> dict:
+    """Stores result under key with etag (if the response carried one) and returns it."""
+    if etag:
+        _cache_put(key, (time.monotonic(), copy.deepcopy(result), etag))
+    return result
+
+
+def clear_cache() -> None:
+    """Empties the issue read cache, including the stored ETags."""
+    with _CACHE_LOCK:
+        _CACHE.clear()
 
 # --- General Issue Creation ---
 
@@ -39,11 +206,7 @@ def create_jira_issue(
     Returns:
         dict: status and result (new issue key) or error message.
     """
-    atlassian_instance_url = os.getenv("ATLASSIAN_INSTANCE_URL")
-    atlassian_email = os.getenv("ATLASSIAN_EMAIL")
-    atlassian_api_key = os.getenv("ATLASSIAN_API_KEY")
-
-    if not all([atlassian_instance_url, atlassian_email, atlassian_api_key]):
+    if not _load_config():
         return {"status": "error", "error_message": "Atlassian instance configuration (URL, email, API key) missing."}
     if not all([project_key, summary, description, issue_type_name]):
         return {"status": "error", "error_message": "Project key, summary, description, and issue type name are required."}
@@ -59,8 +222,7 @@ def create_jira_issue(
                 "error_message": f"Invalid component(s): {', '.join(invalid_components)}. Allowed components are: {', '.join(ALLOWED_COMPONENTS)}."
             }
 
-    api_url = f"{atlassian_instance_url.rstrip('/')}/rest/api/3/issue"
-    auth = (atlassian_email, atlassian_api_key)
+    api_url = f"{_BASE_URL}/rest/api/3/issue"
     headers = {"Accept": "application/json", "Content-Type": "application/json"}
 
     payload_fields = {
@@ -85,8 +247,8 @@ def create_jira_issue(
     payload = {"fields": payload_fields}
 
     try:
-        response = requests.post(
-            api_url, headers=headers, auth=auth, data=json.dumps(payload), timeout=20
+        response = _SESSION.post(
+            api_url, headers=headers, auth=_AUTH, data=json.dumps(payload), timeout=20
         )
         response.raise_for_status()
 
@@ -130,11 +292,7 @@ def create_jira_subtask(
     Returns:
         dict: status and result (new sub-task key) or error message.
     """
-    atlassian_instance_url = os.getenv("ATLASSIAN_INSTANCE_URL")
-    atlassian_email = os.getenv("ATLASSIAN_EMAIL")
-    atlassian_api_key = os.getenv("ATLASSIAN_API_KEY")
-
-    if not all([atlassian_instance_url, atlassian_email, atlassian_api_key]):
+    if not _load_config():
         return {"status": "error", "error_message": "Atlassian instance configuration (URL, email, API key) missing."}
     if not parent_issue_key or not summary:
         return {"status": "error", "error_message": "Parent key and summary are required."}
@@ -149,12 +307,10 @@ def create_jira_subtask(
             }
 
     # Need project key - fetch parent issue details to get it
-    parent_details_url = f"{atlassian_instance_url.rstrip('/')}/rest/api/3/issue/{parent_issue_key}?fields=project"
-    auth = (atlassian_email, atlassian_api_key)
-    headers = {"Accept": "application/json"}
+    parent_details_url = f"{_BASE_URL}/rest/api/3/issue/{parent_issue_key}?fields=project"
     project_key = None
     try:
-        parent_response = requests.get(parent_details_url, headers=headers, auth=auth, timeout=10)
+        parent_response = _SESSION.get(parent_details_url, auth=_AUTH, timeout=10)
         parent_response.raise_for_status()
         project_key = parent_response.json().get("fields", {}).get("project", {}).get("key")
         if not project_key:
@@ -165,7 +321,7 @@ def create_jira_subtask(
          return {"status": "error", "error_message": str(e)}
 
 
-    api_url = f"{atlassian_instance_url.rstrip('/')}/rest/api/3/issue"
+    api_url = f"{_BASE_URL}/rest/api/3/issue"
     headers = {"Accept": "application/json", "Content-Type": "application/json"}
 
     payload_fields = {
@@ -184,8 +340,8 @@ def create_jira_subtask(
     payload = {"fields": payload_fields}
 
     try:
-        response = requests.post(
-            api_url, headers=headers, auth=auth, data=json.dumps(payload), timeout=20
+        response = _SESSION.post(
+            api_url, headers=headers, auth=_AUTH, data=json.dumps(payload), timeout=20
         )
         response.raise_for_status()
 
@@ -222,20 +378,14 @@ def get_jira_subtasks(parent_issue_key: str) -> dict:
         dict: status and result (report listing sub-tasks) or error message.
               Each sub-task includes its key, summary, and status.
     """
-    atlassian_instance_url = os.getenv("ATLASSIAN_INSTANCE_URL")
-    atlassian_email = os.getenv("ATLASSIAN_EMAIL")
-    atlassian_api_key = os.getenv("ATLASSIAN_API_KEY")
-
-    if not all([atlassian_instance_url, atlassian_email, atlassian_api_key]):
+    if not _load_config():
         return {"status": "error", "error_message": "Atlassian instance configuration (URL, email, API key) missing."}
 
     # Fetch parent issue details including the subtasks field
-    api_url = f"{atlassian_instance_url.rstrip('/')}/rest/api/3/issue/{parent_issue_key}?fields=subtasks"
-    auth = (atlassian_email, atlassian_api_key)
-    headers = {"Accept": "application/json"}
+    api_url = f"{_BASE_URL}/rest/api/3/issue/{parent_issue_key}?fields=subtasks"
 
     try:
-        response = requests.get(api_url, headers=headers, auth=auth, timeout=15)
+        response = _SESSION.get(api_url, auth=_AUTH, timeout=15)
         response.raise_for_status()
 
         data = response.json()
@@ -274,11 +424,7 @@ def delete_jira_issue(issue_key: str) -> dict:
     Returns:
         dict: status and result message or error message.
     """
-    atlassian_instance_url = os.getenv("ATLASSIAN_INSTANCE_URL")
-    atlassian_email = os.getenv("ATLASSIAN_EMAIL")
-    atlassian_api_key = os.getenv("ATLASSIAN_API_KEY")
-
-    if not all([atlassian_instance_url, atlassian_email, atlassian_api_key]):
+    if not _load_config():
         return {"status": "error", "error_message": "Atlassian instance configuration (URL, email, API key) missing."}
     if not issue_key:
         return {"status": "error", "error_message": "Issue key cannot be empty."}
@@ -286,12 +432,12 @@ def delete_jira_issue(issue_key: str) -> dict:
     # Add a confirmation step here? Or rely on agent confirmation?
     # For now, proceed directly based on agent call.
 
-    api_url = f"{atlassian_instance_url.rstrip('/')}/rest/api/3/issue/{issue_key}"
-    auth = (atlassian_email, atlassian_api_key)
+    api_url = f"{_BASE_URL}/rest/api/3/issue/{issue_key}"
     headers = {"Accept": "application/json"}
 
     try:
-        response = requests.delete(api_url, headers=headers, auth=auth, timeout=20)
+        response = _SESSION.delete(api_url, headers=headers, auth=_AUTH, timeout=20)
+        _invalidate_issue(issue_key)
         response.raise_for_status() # Raises HTTPError for bad responses (4xx or 5xx)
 
         # Successful deletion usually returns 204 No Content
@@ -347,15 +493,51 @@ def show_jira_issue(issue_key: str) -> dict:
         return {"status": "error", "error_message": f"An error occurred while trying to open the browser: {e}"}
 
 def _parse_adf_text(adf_node: dict) -> str:
-    """Recursively extracts plain text from an ADF node."""
+    """Extracts plain text from an ADF node.
+
+    Walks the tree with an explicit stack, so deeply nested documents cannot
+    hit the recursion limit.
+    """
     text_content = []
-    if adf_node.get("type") == "text":
-        text_content.append(adf_node.get("text", ""))
-    if "content" in adf_node and isinstance(adf_node["content"], list):
-        for child_node in adf_node["content"]:
-            text_content.append(_parse_adf_text(child_node))
+    stack = [adf_node]
+    while stack:
+        node = stack.pop()
+        if not isinstance(node, dict):
+            continue
+        if node.get("type") == "text":
+            text_content.append(node.get("text", ""))
+        children = node.get("content")
+        if isinstance(children, list):
+            stack.extend(reversed(children))
     return "".join(text_content)
 
+
+# ADF node types _adf_to_text descends into; anything else is treated as complex content.
+_ADF_CONTAINER_TYPES = frozenset({"doc", "paragraph"})
+
+
+def _adf_to_text(adf_doc: dict) -> str:
+    """Extracts the paragraph text of an ADF description.
+
+    Only doc and paragraph nodes are descended into (at any depth); other blocks
+    such as tables are skipped. Text nodes are joined with newlines.
+
+    Returns:
+        str: the text, or "[Complex Description Format]" if no text was found.
+    """
+    content_texts = []
+    stack = [adf_doc]
+    while stack:
+        node = stack.pop()
+        if not isinstance(node, dict):
+            continue
+        node_type = node.get("type")
+        if node_type == "text":
+            content_texts.append(node.get("text", ""))
+        elif node_type in _ADF_CONTAINER_TYPES:
+            stack.extend(reversed(node.get("content", [])))
+    return "\n".join(content_texts) if content_texts else "[Complex Description Format]"
+
 def update_jira_issue(
     issue_id: str,
     summary: Optional[str] = None,
@@ -386,11 +568,7 @@ def update_jira_issue(
     Returns:
         dict: status and result message or error message.
     """
-    atlassian_instance_url = os.getenv("ATLASSIAN_INSTANCE_URL")
-    atlassian_email = os.getenv("ATLASSIAN_EMAIL")
-    atlassian_api_key = os.getenv("ATLASSIAN_API_KEY")
-
-    if not all([atlassian_instance_url, atlassian_email, atlassian_api_key]):
+    if not _load_config():
         return {
             "status": "error",
             "error_message": (
@@ -406,8 +584,7 @@ def update_jira_issue(
             "error_message": "No fields provided to update (summary, description, assignee, components, or category).",
         }
 
-    api_url = f"{atlassian_instance_url.rstrip('/')}/rest/api/3/issue/{issue_id}"
-    auth = (atlassian_email, atlassian_api_key)
+    api_url = f"{_BASE_URL}/rest/api/3/issue/{issue_id}"
     headers = {"Accept": "application/json", "Content-Type": "application/json"}
 
     payload_fields = {}
@@ -459,9 +636,10 @@ def update_jira_issue(
     payload = {"fields": payload_fields}
 
     try:
-        response = requests.put(
-            api_url, headers=headers, auth=auth, data=json.dumps(payload), timeout=20
+        response = _SESSION.put(
+            api_url, headers=headers, auth=_AUTH, data=json.dumps(payload), timeout=20
         )
+        _invalidate_issue(issue_id)
         response.raise_for_status()  # Raise HTTPError for bad responses (4xx or 5xx)
 
         # Jira PUT request returns 204 No Content on success
@@ -525,42 +703,62 @@ def search_jira_issues_jql(
         fields (Optional[List[str]]): A list of fields to retrieve for each issue.
             Defaults to ["summary", "status", "assignee", "reporter", "created", "updated"].
         max_results (int): Maximum number of issues to return. Defaults to 50.
+            Results beyond the first page are fetched in parallel.
 
     Returns:
         dict: status and result (list of issues or error message).
-              Each issue in the list is a dictionary of its fields.
+              Each issue in the list is a dictionary of its fields. Errors also
+              carry a stable "error_code" (CONFIG_MISSING, EMPTY_JQL, BAD_REQUEST,
+              UNAUTHORIZED, HTTP_ERROR or REQUEST_EXCEPTION).
     """
-    atlassian_instance_url = os.getenv("ATLASSIAN_INSTANCE_URL")
-    atlassian_email = os.getenv("ATLASSIAN_EMAIL")
-    atlassian_api_key = os.getenv("ATLASSIAN_API_KEY")
-
-    if not all([atlassian_instance_url, atlassian_email, atlassian_api_key]):
-        return {"status": "error", "error_message": "Atlassian instance configuration (URL, email, API key) missing."}
+    if not _load_config():
+        return {
+            "status": "error", "error_code": "CONFIG_MISSING",
+            "error_message": "Atlassian instance configuration (URL, email, API key) missing."
+        }
 
     if not jql_query:
-        return {"status": "error", "error_message": "JQL query cannot be empty."}
+        return {"status": "error", "error_code": "EMPTY_JQL", "error_message": "JQL query cannot be empty."}
 
     if fields is None:
         fields = ["summary", "status", "assignee", "reporter", "created", "updated"]
 
-    api_url = f"{atlassian_instance_url.rstrip('/')}/rest/api/3/search"
-    auth = (atlassian_email, atlassian_api_key)
+    api_url = f"{_BASE_URL}/rest/api/3/search"
     headers = {"Accept": "application/json", "Content-Type": "application/json"}
     payload = {
         "jql": jql_query,
-        "maxResults": max_results,
+        "maxResults": min(max_results, _SEARCH_PAGE_SIZE),
         "fields": fields
     }
 
     try:
-        response = requests.post(
-            api_url, headers=headers, auth=auth, data=json.dumps(payload), timeout=30
+        response = _SESSION.post(
+            api_url, headers=headers, auth=_AUTH, data=json.dumps(payload), timeout=30
         )
         response.raise_for_status()
 
         data = response.json()
         issues_data = data.get("issues", [])
 
+        # The first page tells us the total; fetch any remaining pages concurrently.
+        # Jira may cap maxResults below what was asked, so the page size comes from its answer.
+        page_size = data.get("maxResults") or payload["maxResults"]
+        limit = min(data.get("total", 0), max_results)
+        if page_size > 0 and limit > page_size: # max_results=0 asks for no issues at all
+            page_starts = range(page_size, limit, page_size)
+            def _fetch_page(start_at):
+                page_payload = dict(payload, startAt=start_at, maxResults=min(page_size, limit - start_at))
+                page_response = _SESSION.post(
+                    api_url, headers=headers, auth=_AUTH, data=json.dumps(page_payload), timeout=30
+                )
+                page_response.raise_for_status()
+                return page_response.json().get("issues", [])
+
+            issues_data = list(issues_data)
+            with ThreadPoolExecutor(max_workers=min(_SEARCH_MAX_WORKERS, len(page_starts))) as executor:
+                for page in executor.map(_fetch_page, page_starts): # map keeps page order
+                    issues_data.extend(page)
+
         if not issues_data:
             return {"status": "success", "report": f"No issues found matching the JQL query: {jql_query}", "issues": []}
 
@@ -611,15 +809,21 @@ def search_jira_issues_jql(
 
     except requests.exceptions.HTTPError as http_err:
         error_message = f"HTTP error searching issues with JQL: {http_err}"
+        if http_err.response is not None: # Raised by a later page rather than the first
+            response = http_err.response
         try:
             error_details = response.json()
             if "errorMessages" in error_details: error_message += f" Details: {'; '.join(error_details['errorMessages'])}"
             if "errors" in error_details: error_message += f" Field Errors: {json.dumps(error_details['errors'])}"
         except json.JSONDecodeError: pass
         if response.status_code == 400: error_message += f"\nCheck JQL syntax: {jql_query}"
-        return {"status": "error", "error_message": error_message, "issues": []}
+        error_code = _SEARCH_HTTP_ERROR_CODES.get(response.status_code, "HTTP_ERROR")
+        return {"status": "error", "error_code": error_code, "error_message": error_message, "issues": []}
     except requests.exceptions.RequestException as req_err:
-        return {"status": "error", "error_message": f"Error searching issues with JQL: {req_err}", "issues": []}
+        return {
+            "status": "error", "error_code": "REQUEST_EXCEPTION",
+            "error_message": f"Error searching issues with JQL: {req_err}", "issues": []
+        }
 
 # --- Time-based Search ---
 
@@ -645,11 +849,7 @@ def search_jira_issues_by_time(
     Returns:
         dict: status and result (report listing issues) or error message.
     """
-    atlassian_instance_url = os.getenv("ATLASSIAN_INSTANCE_URL")
-    atlassian_email = os.getenv("ATLASSIAN_EMAIL")
-    atlassian_api_key = os.getenv("ATLASSIAN_API_KEY")
-
-    if not all([atlassian_instance_url, atlassian_email, atlassian_api_key]):
+    if not _load_config():
         return {"status": "error", "error_message": "Atlassian instance configuration (URL, email, API key) missing."}
 
     if time_field not in ['created', 'updated', 'resolutiondate']:
@@ -677,8 +877,7 @@ def search_jira_issues_by_time(
     jql = " AND ".join(jql_parts)
     jql += " ORDER BY updated DESC" # Order by most recently updated by default
 
-    api_url = f"{atlassian_instance_url.rstrip('/')}/rest/api/3/search"
-    auth = (atlassian_email, atlassian_api_key)
+    api_url = f"{_BASE_URL}/rest/api/3/search"
     headers = {"Accept": "application/json", "Content-Type": "application/json"}
     payload = {
         "jql": jql,
@@ -687,8 +886,8 @@ def search_jira_issues_by_time(
     }
 
     try:
-        response = requests.post(
-            api_url, headers=headers, auth=auth, data=json.dumps(payload), timeout=30
+        response = _SESSION.post(
+            api_url, headers=headers, auth=_AUTH, data=json.dumps(payload), timeout=30
         )
         response.raise_for_status()
 
@@ -742,6 +941,7 @@ __all__ = [
     'search_jira_issues_jql', # Added JQL search tool
     'search_jira_issues_by_time', # Added time search tool
     'get_jira_issue_links',
+    'get_jira_issues_bulk',
 ]
 
 
@@ -757,22 +957,16 @@ def get_jira_transitions(issue_id: str) -> dict:
         dict: status and result (report listing transitions) or error message.
               Each transition includes its ID and the target status name.
     """
-    atlassian_instance_url = os.getenv("ATLASSIAN_INSTANCE_URL")
-    atlassian_email = os.getenv("ATLASSIAN_EMAIL")
-    atlassian_api_key = os.getenv("ATLASSIAN_API_KEY")
-
-    if not all([atlassian_instance_url, atlassian_email, atlassian_api_key]):
+    if not _load_config():
         return {
             "status": "error",
             "error_message": "Atlassian instance configuration (URL, email, API key) missing in environment variables.",
         }
 
-    api_url = f"{atlassian_instance_url.rstrip('/')}/rest/api/3/issue/{issue_id}/transitions"
-    auth = (atlassian_email, atlassian_api_key)
-    headers = {"Accept": "application/json"}
+    api_url = f"{_BASE_URL}/rest/api/3/issue/{issue_id}/transitions"
 
     try:
-        response = requests.get(api_url, headers=headers, auth=auth, timeout=15)
+        response = _SESSION.get(api_url, auth=_AUTH, timeout=15)
         response.raise_for_status()
 
         data = response.json()
@@ -812,11 +1006,7 @@ def transition_jira_issue(issue_id: str, transition_id: str) -> dict:
     Returns:
         dict: status and result message or error message.
     """
-    atlassian_instance_url = os.getenv("ATLASSIAN_INSTANCE_URL")
-    atlassian_email = os.getenv("ATLASSIAN_EMAIL")
-    atlassian_api_key = os.getenv("ATLASSIAN_API_KEY")
-
-    if not all([atlassian_instance_url, atlassian_email, atlassian_api_key]):
+    if not _load_config():
         return {
             "status": "error",
             "error_message": "Atlassian instance configuration (URL, email, API key) missing in environment variables.",
@@ -825,15 +1015,15 @@ def transition_jira_issue(issue_id: str, transition_id: str) -> dict:
         return {"status": "error", "error_message": "Transition ID cannot be empty."}
 
 
-    api_url = f"{atlassian_instance_url.rstrip('/')}/rest/api/3/issue/{issue_id}/transitions"
-    auth = (atlassian_email, atlassian_api_key)
+    api_url = f"{_BASE_URL}/rest/api/3/issue/{issue_id}/transitions"
     headers = {"Accept": "application/json", "Content-Type": "application/json"}
     payload = {"transition": {"id": transition_id}}
 
     try:
-        response = requests.post(
-            api_url, headers=headers, auth=auth, data=json.dumps(payload), timeout=20
+        response = _SESSION.post(
+            api_url, headers=headers, auth=_AUTH, data=json.dumps(payload), timeout=20
         )
+        _invalidate_issue(issue_id)
         response.raise_for_status() # Raises HTTPError for bad responses (4xx or 5xx)
 
         # Successful transition usually returns 204 No Content
@@ -873,11 +1063,7 @@ def add_jira_comment(issue_id: str, comment_body: str) -> dict:
     Returns:
         dict: status and result message or error message.
     """
-    atlassian_instance_url = os.getenv("ATLASSIAN_INSTANCE_URL")
-    atlassian_email = os.getenv("ATLASSIAN_EMAIL")
-    atlassian_api_key = os.getenv("ATLASSIAN_API_KEY")
-
-    if not all([atlassian_instance_url, atlassian_email, atlassian_api_key]):
+    if not _load_config():
         return {
             "status": "error",
             "error_message": (
@@ -889,8 +1075,7 @@ def add_jira_comment(issue_id: str, comment_body: str) -> dict:
     if not comment_body:
         return {"status": "error", "error_message": "Comment body cannot be empty."}
 
-    api_url = f"{atlassian_instance_url.rstrip('/')}/rest/api/3/issue/{issue_id}/comment"
-    auth = (atlassian_email, atlassian_api_key)
+    api_url = f"{_BASE_URL}/rest/api/3/issue/{issue_id}/comment"
     headers = {"Accept": "application/json", "Content-Type": "application/json"}
 
     # Construct comment body in ADF format
@@ -908,9 +1093,10 @@ def add_jira_comment(issue_id: str, comment_body: str) -> dict:
     }
 
     try:
-        response = requests.post(
-            api_url, headers=headers, auth=auth, data=json.dumps(payload), timeout=20
+        response = _SESSION.post(
+            api_url, headers=headers, auth=_AUTH, data=json.dumps(payload), timeout=20
         )
+        _invalidate_issue(issue_id)
         response.raise_for_status()  # Raise HTTPError for bad responses (4xx or 5xx)
 
         comment_id = response.json().get("id", "N/A")
@@ -969,11 +1155,7 @@ def get_jira_comments(issue_id: str) -> dict:
     Returns:
         dict: status and result (report with comments) or error message.
     """
-    atlassian_instance_url = os.getenv("ATLASSIAN_INSTANCE_URL")
-    atlassian_email = os.getenv("ATLASSIAN_EMAIL")
-    atlassian_api_key = os.getenv("ATLASSIAN_API_KEY")
-
-    if not all([atlassian_instance_url, atlassian_email, atlassian_api_key]):
+    if not _load_config():
         return {
             "status": "error",
             "error_message": (
@@ -982,13 +1164,11 @@ def get_jira_comments(issue_id: str) -> dict:
             ),
         }
 
-    api_url = f"{atlassian_instance_url.rstrip('/')}/rest/api/3/issue/{issue_id}/comment"
-    auth = (atlassian_email, atlassian_api_key)
-    headers = {"Accept": "application/json"}
+    api_url = f"{_BASE_URL}/rest/api/3/issue/{issue_id}/comment"
 
     try:
-        response = requests.get(
-            api_url, headers=headers, auth=auth, timeout=15
+        response = _SESSION.get(
+            api_url, auth=_AUTH, timeout=15
         )
         response.raise_for_status()
 
@@ -1058,6 +1238,74 @@ def get_jira_comments(issue_id: str) -> dict:
 # --- End of removed Implementation Step Management Tools ---
 
 
+# Error message templates by HTTP status for the issue link and details lookups.
+# They are filled in with str.format(issue_id=..., err=<the raised HTTPError>).
+_LINKS_ERRORS = {
+    401: "Jira authentication failed. Check email/API key.",
+    403: "Jira permission denied for accessing issue links for '{issue_id}'.",
+    404: "Jira issue '{issue_id}' not found.",
+}
+_LINKS_ERROR_DEFAULT = "HTTP error occurred while fetching issue links: {err}"
+
+_DETAIL_ERRORS = {
+    401: "Jira authentication failed. Check email/API key.",
+    403: "Jira permission denied.",
+    404: "Jira issue '{issue_id}' not found (404).",
+}
+_DETAIL_ERROR_DEFAULT = "HTTP error occurred: {err}"
+
+
+def _parse_link(link: dict) -> dict:
+    """Flattens one Jira issue link into type, direction, key, status and summary."""
+    link_type = link.get("type", {}).get("name", "N/A")
+    direction = ""
+    linked_issue_key = "N/A"
+    linked_issue_summary = "N/A"
+    linked_issue_status = "N/A"
+
+    if "inwardIssue" in link:
+        direction = link.get("type", {}).get("inward", "points to")
+        linked_issue = link.get("inwardIssue", {})
+        linked_issue_key = linked_issue.get("key", "N/A")
+        linked_issue_summary = linked_issue.get("fields", {}).get("summary", "N/A")
+        linked_issue_status = linked_issue.get("fields", {}).get("status", {}).get("name", "N/A")
+    elif "outwardIssue" in link:
+        direction = link.get("type", {}).get("outward", "is pointed to by")
+        linked_issue = link.get("outwardIssue", {})
+        linked_issue_key = linked_issue.get("key", "N/A")
+        linked_issue_summary = linked_issue.get("fields", {}).get("summary", "N/A")
+        linked_issue_status = linked_issue.get("fields", {}).get("status", {}).get("name", "N/A")
+
+    return {
+        "type": link_type,
+        "direction": direction,
+        "key": linked_issue_key,
+        "status": linked_issue_status,
+        "summary": linked_issue_summary,
+    }
+
+
+def _iter_issue_links(response) -> Iterable[dict]:
+    """Returns the raw issue links contained in a streamed issue response.
+
+    With ijson installed the links are parsed one at a time straight from the
+    socket, so a large link list is never buffered as a whole document.
+    """
+    if ijson is not None:
+        response.raw.decode_content = True # Undo gzip/deflate content encoding
+        return ijson.items(response.raw, "fields.issuelinks.item")
+    return _json_loads(response.content).get("fields", {}).get("issuelinks", [])
+
+
+def _format_link(link: dict) -> str:
+    """Renders one parsed issue link as a report line."""
+    return (
+        f"  - Type: {link['type']}, Direction: {link['direction']} {link['key']} "
+        f"(Status: {link['status']}, Summary: {link['summary']})"
+    )
+
+
+@_ttl_cache
 def get_jira_issue_links(issue_id: str) -> dict:
     """Retrieves issue links for a specified Jira issue.
 
@@ -1068,13 +1316,10 @@ def get_jira_issue_links(issue_id: str) -> dict:
         issue_id (str): The Jira issue ID or key (e.g., 'PROJ-123').
 
     Returns:
-        dict: status and result (report listing issue links) or error message.
+        dict: status, the parsed links (type, direction, key, status, summary)
+              and a report listing them, or an error message.
     """
-    atlassian_instance_url = os.getenv("ATLASSIAN_INSTANCE_URL")
-    atlassian_email = os.getenv("ATLASSIAN_EMAIL")
-    atlassian_api_key = os.getenv("ATLASSIAN_API_KEY")
-
-    if not all([atlassian_instance_url, atlassian_email, atlassian_api_key]):
+    if not _load_config():
         return {
             "status": "error",
             "error_message": (
@@ -1083,61 +1328,43 @@ def get_jira_issue_links(issue_id: str) -> dict:
             ),
         }
 
-    api_url = f"{atlassian_instance_url.rstrip('/')}/rest/api/3/issue/{issue_id}?fields=issuelinks"
-    auth = (atlassian_email, atlassian_api_key)
-    headers = {"Accept": "application/json"}
+    api_url = f"{_BASE_URL}/rest/api/3/issue/{issue_id}?fields=issuelinks"
+    etag_key = ("links", issue_id)
+    stored = _stored_etag(etag_key)
 
     try:
-        response = requests.get(api_url, headers=headers, auth=auth, timeout=15)
-        response.raise_for_status()
+        response = _SESSION.get(
+            api_url, auth=_AUTH, headers={"If-None-Match": stored[0]} if stored else None,
+            timeout=15, stream=True
+        )
+        try:
+            response.raise_for_status()
+            if stored and response.status_code == 304: # Unchanged since the ETag we sent
+                return copy.deepcopy(stored[1])
+            links = [_parse_link(link) for link in _iter_issue_links(response)]
+        finally:
+            response.close()
+
+        if not links:
+            result = {
+                "status": "success",
+                "links": [],
+                "report": f"No issue links found for issue '{issue_id}'.",
+            }
+        else:
+            report_lines = [f"Issue links for {issue_id}:"]
+            report_lines.extend(map(_format_link, links))
+            result = {"status": "success", "links": links, "report": "\n".join(report_lines)}
 
-        issue_data = response.json()
-        issue_links = issue_data.get("fields", {}).get("issuelinks", [])
-
-        if not issue_links:
-            return {"status": "success", "report": f"No issue links found for issue '{issue_id}'."}
-
-        report_lines = [f"Issue links for {issue_id}:"]
-        for link in issue_links:
-            link_type = link.get("type", {}).get("name", "N/A")
-            direction = ""
-            linked_issue_key = "N/A"
-            linked_issue_summary = "N/A"
-            linked_issue_status = "N/A"
-
-            if "inwardIssue" in link:
-                direction = link.get("type", {}).get("inward", "points to")
-                linked_issue = link.get("inwardIssue", {})
-                linked_issue_key = linked_issue.get("key", "N/A")
-                linked_issue_summary = linked_issue.get("fields", {}).get("summary", "N/A")
-                linked_issue_status = linked_issue.get("fields", {}).get("status", {}).get("name", "N/A")
-            elif "outwardIssue" in link:
-                direction = link.get("type", {}).get("outward", "is pointed to by")
-                linked_issue = link.get("outwardIssue", {})
-                linked_issue_key = linked_issue.get("key", "N/A")
-                linked_issue_summary = linked_issue.get("fields", {}).get("summary", "N/A")
-                linked_issue_status = linked_issue.get("fields", {}).get("status", {}).get("name", "N/A")
-
-            report_lines.append(
-                f"  - Type: {link_type}, Direction: {direction} {linked_issue_key} "
-                f"(Status: {linked_issue_status}, Summary: {linked_issue_summary})"
-            )
-
-        return {"status": "success", "report": "\n".join(report_lines)}
+        return _remember_etag(etag_key, response.headers.get("ETag"), result)
 
     except requests.exceptions.HTTPError as http_err:
-        if response.status_code == 401:
-            error_message = "Jira authentication failed. Check email/API key."
-        elif response.status_code == 403:
-            error_message = f"Jira permission denied for accessing issue links for '{issue_id}'."
-        elif response.status_code == 404:
-            error_message = f"Jira issue '{issue_id}' not found."
-        else:
-            error_message = f"HTTP error occurred while fetching issue links: {http_err}"
-        return {"status": "error", "error_message": error_message}
-    except requests.exceptions.RequestException as req_err:
+        error_template = _LINKS_ERRORS.get(response.status_code, _LINKS_ERROR_DEFAULT)
+        return {"status": "error", "error_message": error_template.format(issue_id=issue_id, err=http_err)}
+    except (requests.exceptions.RequestException, *_JSON_ERRORS) as req_err:
         return {"status": "error", "error_message": f"Error fetching issue links: {req_err}"}
 
+@_ttl_cache
 def get_jira_issue_details(issue_id: str, render_html: bool = False) -> dict:
     """Retrieves details for a specified Jira issue ID from Jira Cloud.
 
@@ -1153,37 +1380,31 @@ def get_jira_issue_details(issue_id: str, render_html: bool = False) -> dict:
         dict: status and result (report including the description as plain text or HTML)
               or error message.
     """
-    atlassian_instance_url = os.getenv("ATLASSIAN_INSTANCE_URL")
-    atlassian_email = os.getenv("ATLASSIAN_EMAIL")
-    atlassian_api_key = os.getenv("ATLASSIAN_API_KEY")
-
-    if not all([atlassian_instance_url, atlassian_email, atlassian_api_key]):
+    if not _load_config():
         return {
             "status": "error",
             "error_message": (
-                "Atlassian instance configuration (URL, email, API key)" 
+                "Atlassian instance configuration (URL, email, API key)"
                 " missing in environment variables."
             ),
         }
 
     # Request the category custom field along with standard fields
-    fields_to_request = f"summary,status,assignee,description,{CUSTOM_FIELD_CATEGORY_ID}"
-    api_url_base = f"{atlassian_instance_url.rstrip('/')}/rest/api/3/issue/{issue_id}"
-    
-    params = {"fields": fields_to_request}
-    if render_html:
-        params["expand"] = "renderedFields"
-
-    auth = (atlassian_email, atlassian_api_key)
-    headers = {"Accept": "application/json"}
+    api_url_base = f"{_BASE_URL}/rest/api/3/issue/{issue_id}"
+    etag_key = ("details", issue_id, render_html)
+    stored = _stored_etag(etag_key)
 
     try:
-        response = requests.get(
-            api_url_base, headers=headers, auth=auth, params=params, timeout=15
+        response = _SESSION.get(
+            api_url_base, auth=_AUTH, headers={"If-None-Match": stored[0]} if stored else None,
+            params=_DETAIL_PARAMS, timeout=15
         )
         response.raise_for_status()  # Raise HTTPError for bad responses (4xx or 5xx)
+        if stored and response.status_code == 304: # Unchanged since the ETag we sent
+            return copy.deepcopy(stored[1])
+        etag = response.headers.get("ETag")
 
-        issue_data = response.json()
+        issue_data = _json_loads(response.content)
         fields = issue_data.get("fields", {})
         summary = fields.get("summary", "N/A")
         status = fields.get("status", {}).get("name", "N/A")
@@ -1192,29 +1413,27 @@ def get_jira_issue_details(issue_id: str, render_html: bool = False) -> dict:
         # Extract category - it's often an object with a 'value' field for single-select lists
         category_data = fields.get(CUSTOM_FIELD_CATEGORY_ID)
         category = category_data.get("value", "N/A") if isinstance(category_data, dict) else "N/A"
-        
+        description_data_adf = fields.get('description')
+
         description_text = "No description provided."
         got_html_description = False
 
         if render_html:
-            rendered_fields = issue_data.get("renderedFields", {})
-            html_description = rendered_fields.get("description")
+            if isinstance(description_data_adf, dict):
+                # Only ADF needs Jira's renderer, so only then pay for rendering it
+                response = _SESSION.get(api_url_base, auth=_AUTH, params=_DETAIL_RENDER_PARAMS, timeout=15)
+                response.raise_for_status()
+                issue_data = _json_loads(response.content)
+            html_description = (issue_data.get("renderedFields") or {}).get("description")
             if html_description is not None:
                 description_text = html_description
                 got_html_description = True
-        
+
         if not got_html_description: # True if (render_html is False) OR (render_html is True but HTML failed)
-            description_data_adf = fields.get('description')
             if description_data_adf:
                 if isinstance(description_data_adf, dict) and description_data_adf.get('type') == 'doc':
                     try:
-                        content_texts = []
-                        for content_block in description_data_adf.get('content', []):
-                            if content_block.get('type') == 'paragraph':
-                                for text_node in content_block.get('content', []):
-                                    if text_node.get('type') == 'text':
-                                        content_texts.append(text_node.get('text', ''))
-                        description_text = "\n".join(content_texts) if content_texts else "[Complex Description Format]"
+                        description_text = _adf_to_text(description_data_adf)
                     except Exception:
                         description_text = "[Error parsing description]"
                 elif isinstance(description_data_adf, str):
@@ -1241,18 +1460,11 @@ def get_jira_issue_details(issue_id: str, render_html: bool = False) -> dict:
             f"  Category: {category}\n" # Added Category to report
             f"  Description: {description_text}"
         )
-        return {"status": "success", "report": report}
+        return _remember_etag(etag_key, etag, {"status": "success", "report": report})
 
     except requests.exceptions.HTTPError as http_err:
-        if response.status_code == 401:
-            error_message = "Jira authentication failed. Check email/API key."
-        elif response.status_code == 403:
-            error_message = "Jira permission denied."
-        elif response.status_code == 404:
-            error_message = f"Jira issue '{issue_id}' not found (404)."
-        else:
-            error_message = f"HTTP error occurred: {http_err}"
-        return {"status": "error", "error_message": error_message}
+        error_template = _DETAIL_ERRORS.get(response.status_code, _DETAIL_ERROR_DEFAULT)
+        return {"status": "error", "error_message": error_template.format(issue_id=issue_id, err=http_err)}
     except requests.exceptions.ConnectionError as conn_err:
         return {
             "status": "error",
@@ -1263,8 +1475,70 @@ def get_jira_issue_details(issue_id: str, render_html: bool = False) -> dict:
             "status": "error",
             "error_message": f"Request timed out: {timeout_err}",
         }
-    except requests.exceptions.RequestException as req_err:
+    except (requests.exceptions.RequestException, *_JSON_ERRORS) as req_err:
         return {
             "status": "error",
             "error_message": f"An error occurred: {req_err}",
         }
+
+
+def get_jira_issues_bulk(issue_ids: List[str], fields: Optional[List[str]] = None) -> dict:
+    """Retrieves the raw fields of several Jira issues concurrently.
+
+    The requests are fanned out over a thread pool sharing the module's pooled
+    session, so fetching N issues costs roughly one round trip instead of N.
+
+    Requires ATLASSIAN_INSTANCE_URL, ATLASSIAN_EMAIL, and ATLASSIAN_API_KEY environment
+    variables to be set.
+
+    Args:
+        issue_ids (List[str]): The Jira issue keys to fetch (e.g., ['PROJ-1', 'PROJ-2']).
+        fields (Optional[List[str]]): Fields to request for every issue. Defaults to
+            summary, status, assignee, description and the category custom field.
+
+    Returns:
+        dict: status, "issues" mapping each fetched key to its fields and "errors"
+              mapping each failed key to an error message. The status is "error",
+              with an error message, if no issue could be fetched.
+    """
+    if not _load_config():
+        return {
+            "status": "error",
+            "error_message": (
+                "Atlassian instance configuration (URL, email, API key)"
+                " missing in environment variables."
+            ),
+        }
+
+    if not issue_ids:
+        return {"status": "error", "error_message": "No issue IDs provided."}
+
+    base_url = f"{_BASE_URL}/rest/api/3/issue"
+    params = {"fields": ",".join(fields) if fields is not None else _DETAIL_FIELDS}
+
+    def _fetch(issue_id):
+        response = _SESSION.get(f"{base_url}/{issue_id}", auth=_AUTH, params=params, timeout=15)
+        response.raise_for_status()
+        return _json_loads(response.content).get("fields", {})
+
+    issues = {}
+    errors = {}
+    with ThreadPoolExecutor(max_workers=min(_BULK_MAX_WORKERS, len(issue_ids))) as executor:
+        futures = [(issue_id, executor.submit(_fetch, issue_id)) for issue_id in issue_ids]
+        for issue_id, future in futures:
+            try:
+                issues[issue_id] = future.result()
+            except requests.exceptions.HTTPError as http_err:
+                errors[issue_id] = f"HTTP error occurred: {http_err}"
+            except (requests.exceptions.RequestException, *_JSON_ERRORS) as req_err:
+                errors[issue_id] = f"An error occurred: {req_err}"
+
+    if not issues: # Every request failed, e.g. bad credentials or Jira unreachable
+        first_error = next(iter(errors.values()))
+        return {
+            "status": "error",
+            "error_message": f"Failed to fetch any of the {len(issue_ids)} issues. First error: {first_error}",
+            "issues": issues,
+            "errors": errors,
+        }
+    return {"status": "success", "issues": issues, "errors": errors}
@@ -10,6 +10,7 @@ from typing import List, Dict, Optional # Keep typing for potential future use o
 # Import functions from submodules
 from .vector_storage.requirements import (
     add_requirement,
+    add_requirements,
     retrieve_similar_requirements,
     update_requirement,
     delete_requirement,
@@ -34,6 +35,7 @@ from .vector_storage.test_cases import (
 __all__ = [
     # Requirement Functions
     'add_requirement',
+    'add_requirements',
     'retrieve_similar_requirements',
     'update_requirement',
     'delete_requirement',
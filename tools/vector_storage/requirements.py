@@ -37,35 +37,65 @@ def add_requirement(requirement_text: str, metadata_json: Optional[str] = None)
     Returns:
         Dict: Status dictionary indicating success or error, including the generated requirement ID.
     """
-    if not requirement_text:
-        return {"status": "error", "error_message": "Requirement text cannot be empty."}
+    result = _add_requirements([requirement_text], [metadata_json])
+    if result["status"] != "success":
+        return result
+    new_requirement_id = result["requirement_ids"][0]
+    return {"status": "success", "report": f"Requirement '{new_requirement_id}' added successfully.", "requirement_id": new_requirement_id}
 
-    # Generate the next requirement ID
-    try:
-        new_requirement_id = _get_next_id("REQ-")
-    except Exception as e:
-        return {"status": "error", "error_message": f"Failed to generate requirement ID: {e}"}
 
+def add_requirements(requirement_texts: List[str], metadata_jsons: Optional[List[Optional[str]]] = None) -> Dict:
+    """Adds several software requirements with a single database write and consecutive generated IDs.
+
+    Args:
+        requirement_texts (List[str]): The full texts of the requirements.
+        metadata_jsons (Optional[List[Optional[str]]]): Optional metadata JSON strings, one per requirement
+                                                        and in the same order as requirement_texts
+                                                        (null for none). Accepts the same keys as
+                                                        add_requirement.
 
+    Returns:
+        Dict: Status dictionary indicating success or error, including the generated requirement IDs.
+              Nothing is stored if any of the requirements is invalid.
+    """
+    if not requirement_texts:
+        return {"status": "error", "error_message": "At least one requirement text must be provided."}
+    if metadata_jsons is None:
+        metadata_jsons = [None] * len(requirement_texts)
+    elif len(metadata_jsons) != len(requirement_texts):
+        return {"status": "error", "error_message": "metadata_jsons must have one entry per requirement text."}
+
+    result = _add_requirements(requirement_texts, metadata_jsons)
+    if result["status"] != "success":
+        return result
+    new_requirement_ids = result["requirement_ids"]
+    return {
+        "status": "success",
+        "report": f"Added {len(new_requirement_ids)} requirements: {', '.join(new_requirement_ids)}.",
+        "requirement_ids": new_requirement_ids
+    }
+
+
+def _prepare_requirement_metadata(metadata_json: Optional[str]) -> Dict:
+    """Parses and validates one requirement's metadata and fills in the defaults.
+
+    Raises:
+        ValueError: With the user-facing error message if the metadata is invalid.
+    """
     parsed_metadata = {}
     if metadata_json:
         try:
             parsed_metadata = json.loads(metadata_json)
-            if not isinstance(parsed_metadata, dict):
-                raise ValueError("Metadata must be a JSON object (dictionary).")
         except json.JSONDecodeError:
-            return {"status": "error", "error_message": "Invalid JSON format provided for metadata."}
-        except ValueError as ve:
-             return {"status": "error", "error_message": str(ve)}
+            raise ValueError("Invalid JSON format provided for metadata.")
+        if not isinstance(parsed_metadata, dict):
+            raise ValueError("Metadata must be a JSON object (dictionary).")
 
     # Validate and set implementation_status
     current_status = parsed_metadata.get('implementation_status')
     if current_status is not None:
         if current_status not in ALLOWED_IMPLEMENTATION_STATUSES:
-            return {
-                "status": "error",
-                "error_message": f"Invalid implementation_status '{current_status}'. Must be one of {ALLOWED_IMPLEMENTATION_STATUSES}."
-            }
+            raise ValueError(f"Invalid implementation_status '{current_status}'. Must be one of {ALLOWED_IMPLEMENTATION_STATUSES}.")
     else:
         parsed_metadata['implementation_status'] = DEFAULT_IMPLEMENTATION_STATUS
 
@@ -73,30 +103,65 @@ def add_requirement(requirement_text: str, metadata_json: Optional[str] = None)
     current_classification = parsed_metadata.get('classification')
     if current_classification is not None:
         if current_classification not in ALLOWED_CLASSIFICATIONS:
-            return {
-                "status": "error",
-                "error_message": f"Invalid classification '{current_classification}'. Must be one of {ALLOWED_CLASSIFICATIONS}."
-            }
+            raise ValueError(f"Invalid classification '{current_classification}'. Must be one of {ALLOWED_CLASSIFICATIONS}.")
     else:
         parsed_metadata['classification'] = DEFAULT_CLASSIFICATION
 
-
     # Ensure 'type' is set in metadata
     parsed_metadata['type'] = 'Requirement'
+    return parsed_metadata
+
+
+def _add_requirements(requirement_texts: List[str], metadata_jsons: List[Optional[str]]) -> Dict:
+    """Validates the requirements, generates their IDs and stores them with one upsert.
+
+    Returns {"status": "success", "requirement_ids": [...]} or an error dict. When more than one
+    requirement is added, error messages are prefixed with the 1-based position of the offending one.
+    """
+    batch = len(requirement_texts) > 1
+
+    def _error(index: int, message: str) -> Dict:
+        return {"status": "error", "error_message": f"Requirement {index + 1}: {message}" if batch else message}
+
+    for index, requirement_text in enumerate(requirement_texts):
+        if not requirement_text:
+            return _error(index, "Requirement text cannot be empty.")
+
+    # Generate the next requirement ID; the rest of a batch continues the numbering from there
+    try:
+        first_requirement_id = _get_next_id("REQ-")
+        new_requirement_ids = [first_requirement_id]
+        if batch:
+            first_num = int(first_requirement_id[len("REQ-"):]) # ValueError if the generated ID is malformed
+            new_requirement_ids.extend(f"REQ-{first_num + offset}" for offset in range(1, len(requirement_texts)))
+    except Exception as e:
+        return {"status": "error", "error_message": f"Failed to generate requirement ID: {e}"}
+
+    parsed_metadatas = []
+    for index, metadata_json in enumerate(metadata_jsons):
+        try:
+            parsed_metadatas.append(_prepare_requirement_metadata(metadata_json))
+        except ValueError as ve:
+            return _error(index, str(ve))
+
     # Add the change date
-    parsed_metadata['change_date'] = datetime.datetime.now(datetime.timezone.utc).isoformat()
+    change_date = datetime.datetime.now(datetime.timezone.utc).isoformat()
+    for parsed_metadata in parsed_metadatas:
+        parsed_metadata['change_date'] = change_date
 
     try:
-        # Use upsert with the generated ID
+        # Use upsert with the generated IDs
         collection.upsert(
-            ids=[new_requirement_id],
-            documents=[requirement_text],
-            metadatas=[parsed_metadata] # Chroma expects a list for each argument
+            ids=new_requirement_ids,
+            documents=list(requirement_texts),
+            metadatas=parsed_metadatas # Chroma expects a list for each argument
         )
-        return {"status": "success", "report": f"Requirement '{new_requirement_id}' added successfully.", "requirement_id": new_requirement_id}
+        return {"status": "success", "requirement_ids": new_requirement_ids}
     except Exception as e:
         # Catch potential ChromaDB errors or other issues
-        return {"status": "error", "error_message": f"Failed to add requirement '{new_requirement_id}': {e}"}
+        if batch:
+            return {"status": "error", "error_message": f"Failed to add requirements {', '.join(new_requirement_ids)}: {e}"}
+        return {"status": "error", "error_message": f"Failed to add requirement '{new_requirement_ids[0]}': {e}"}
 
 
 def retrieve_similar_requirements(query_text: str, n_results: int = 3, filter_metadata_json: Optional[str] = None) -> Dict:
@@ -343,6 +408,7 @@ def get_all_requirements() -> Dict:
 
 __all__ = [
     'add_requirement',
+    'add_requirements',
     'retrieve_similar_requirements',
     'update_requirement',
     'delete_requirement',